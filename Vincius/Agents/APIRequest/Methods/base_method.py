@@ -3,6 +3,9 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 from Vincius.Core.file_system_manager import FileSystemManager
 from Vincius.Core.logger_base import LoggerBase
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class APIMethod(ABC):
     """Base class for API methods"""
@@ -31,10 +34,10 @@ class APIMethod(ABC):
             }
             
             if path := self.fs_manager.create_or_update_file(file_info):
-                print(f"✅ Saved request configuration: {path}")
+                logger.info("✅ Saved request configuration: %s", path)
                 
         except Exception as e:
-            print(f"❌ Error saving request: {e}")
+            logger.error("❌ Error saving request: %s", e)
 
     def _ensure_valid_data(self, data: Any) -> Dict[str, Any]:
         """Ensure data is in correct format"""
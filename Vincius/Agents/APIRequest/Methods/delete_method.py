@@ -6,6 +6,10 @@ from pathlib import Path
 import time
 import datetime
 import re
+from Vincius.Core.tracing import span
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class DeleteMethod(APIMethod):
     def __init__(self, logger, base_path):
@@ -47,7 +51,9 @@ class DeleteMethod(APIMethod):
             params = params or {}
             url, query_params = self._process_url_params(base_url, params)
             
-            response = requests.delete(url, params=query_params, headers=headers, auth=auth)
+            with span("HTTP DELETE", "http", url=url) as trace:
+                response = requests.delete(url, params=query_params, headers=headers, auth=auth)
+                trace.set(status=response.status_code)
             response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
             
             end_time = time.time()
@@ -88,7 +94,7 @@ class DeleteMethod(APIMethod):
             with open(file_path, "w") as f:
                 json.dump(log_content, f, indent=2)
             
-            print(f"✅ Saved DELETE request information to: {file_path}")
+            logger.info("✅ Saved DELETE request information to: %s", file_path)
             
             return result
         
@@ -5,6 +5,10 @@ from pathlib import Path
 import time
 import datetime
 import re
+from Vincius.Core.tracing import span
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class GetMethod:
     def __init__(self, logger, base_path):
@@ -35,7 +39,9 @@ class GetMethod:
             params = params or {}
             url, query_params = self._process_url_params(base_url, params)
             
-            response = requests.get(url, params=query_params, headers=headers, auth=auth)
+            with span("HTTP GET", "http", url=url) as trace:
+                response = requests.get(url, params=query_params, headers=headers, auth=auth)
+                trace.set(status=response.status_code)
             response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
             
             end_time = time.time()
@@ -76,7 +82,7 @@ class GetMethod:
             with open(file_path, "w") as f:
                 json.dump(log_content, f, indent=2)
             
-            print(f"✅ Saved request information to: {file_path}")
+            logger.info("✅ Saved request information to: %s", file_path)
             
             return result
         
@@ -6,6 +6,10 @@ from pathlib import Path
 import time
 import datetime
 import re
+from Vincius.Core.tracing import span
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class PutMethod(APIMethod):
     def __init__(self, logger, base_path):
@@ -69,13 +73,15 @@ class PutMethod(APIMethod):
                         return f"Error: Invalid JSON body - {body}"
             
             # Execute PUT request
-            response = requests.put(
-                url, 
-                json=json_body,
-                params=query_params, 
-                headers=headers, 
-                auth=auth
-            )
+            with span("HTTP PUT", "http", url=url) as trace:
+                response = requests.put(
+                    url, 
+                    json=json_body,
+                    params=query_params, 
+                    headers=headers, 
+                    auth=auth
+                )
+                trace.set(status=response.status_code)
             response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
             
             end_time = time.time()
@@ -116,7 +122,7 @@ class PutMethod(APIMethod):
             with open(file_path, "w") as f:
                 json.dump(log_content, f, indent=2)
             
-            print(f"✅ Saved PUT request information to: {file_path}")
+            logger.info("✅ Saved PUT request information to: %s", file_path)
             
             return result
         
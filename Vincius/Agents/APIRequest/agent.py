@@ -11,7 +11,10 @@ import requests
 import json
 from Vincius.Core.logger_base import LoggerBase
 import uuid
-from Vincius.Core.config_manager import ConfigManager
+from Vincius.Core import run_context
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class APIRequestAgent(BaseAgent):
     METHOD_MAPPING = {
@@ -27,17 +30,16 @@ class APIRequestAgent(BaseAgent):
         self.agent_uuid = str(uuid.uuid4()) # Initialize agent_uuid here
         
         # Initialize base directory from config
-        config_manager = ConfigManager()
         base_dir_key = config.get('base_dir_key', '').lower()
-        self.base_dir = config_manager.get_base_path(base_dir_key)
+        self.base_dir = run_context.workspace_path() / base_dir_key
         
-        self.brain = BrainModel()
+        self._brain = None  # Created on first use; direct requests never need the model
         self.api_creator = APICreator()
         
         # Get HTTP method from config
         self.method_name = config.get('method', 'GET').upper()
         if self.method_name not in self.METHOD_MAPPING:
-            print(f"⚠️ Invalid method {self.method_name}, defaulting to GET")
+            logger.warning("⚠️ Invalid method %s, defaulting to GET", self.method_name)
             self.method_name = 'GET'
             
         # Initialize logger
@@ -46,7 +48,14 @@ class APIRequestAgent(BaseAgent):
         # Initialize method handler
         method_class = self.METHOD_MAPPING[self.method_name]
         self.method = method_class(self.logger, self.base_dir)
-        print(f"✅ Using {self.method_name} method handler")
+        logger.info("✅ Using %s method handler", self.method_name)
+
+    @property
+    def brain(self) -> BrainModel:
+        """Get the model, initializing it only when a request has to be generated"""
+        if self._brain is None:
+            self._brain = BrainModel()
+        return self._brain
 
     def _setup_auth(self, auth_config: Dict[str, Any]) -> tuple[Dict[str, Any], Optional[requests.auth.AuthBase]]:
         """Setup authentication headers and auth object based on configuration"""
@@ -54,7 +63,7 @@ class APIRequestAgent(BaseAgent):
         auth = None
 
         if not auth_config:
-            print("ℹ️ No authentication configured")
+            logger.info("ℹ️ No authentication configured")
             return headers, auth
 
         auth_type = auth_config.get('type', '').lower()
@@ -66,13 +75,13 @@ class APIRequestAgent(BaseAgent):
                 if token_env:
                     token = os.environ.get(token_env)
                     if not token:
-                        print(f"⚠️ Bearer token not found in environment variable: {token_env}")
+                        logger.warning("⚠️ Bearer token not found in environment variable: %s", token_env)
                 else:
-                    print("⚠️ No token or token_env provided for bearer authentication")
+                    logger.warning("⚠️ No token or token_env provided for bearer authentication")
             
             if token:
                 headers['Authorization'] = f'Bearer {token}'
-                print("✅ Bearer token authentication configured")
+                logger.info("✅ Bearer token authentication configured")
             
         elif auth_type == 'basic':
             username = auth_config.get('username')
@@ -86,17 +95,17 @@ class APIRequestAgent(BaseAgent):
                     username = os.environ.get(username_env)
                     password = os.environ.get(password_env)
                     if not username or not password:
-                        print(f"⚠️ Credentials not found in environment variables: {username_env}, {password_env}")
+                        logger.warning("⚠️ Credentials not found in environment variables: %s, %s", username_env, password_env)
                 else:
-                    print("⚠️ No credentials provided for basic authentication")
+                    logger.warning("⚠️ No credentials provided for basic authentication")
             
             if username and password:
                 from requests.auth import HTTPBasicAuth
                 auth = HTTPBasicAuth(username, password)
-                print("✅ Basic authentication configured")
+                logger.info("✅ Basic authentication configured")
         
         else:
-            print(f"ℹ️ Unknown authentication type: {auth_type}")
+            logger.info("ℹ️ Unknown authentication type: %s", auth_type)
         
         return headers, auth
 
@@ -172,7 +181,7 @@ class APIRequestAgent(BaseAgent):
 
     def execute(self, input_data: Any = None) -> Any:
         try:
-            print(f"\n🌐 Creating {self.method_name} request...")
+            logger.info("\n🌐 Creating %s request...", self.method_name)
             
             if self.method_name in ['GET', 'DELETE']:
                 api_config = self.config.get('api_config', {})
@@ -207,10 +216,10 @@ class APIRequestAgent(BaseAgent):
                 # Setup authentication
                 headers, auth = self._setup_auth(api_config.get('auth', {}))
                 
-                print(f"🔍 Using dynamic configuration:")
-                print(f"   Base URL: {base_url}")
-                print(f"   URL Parameters: {url_params}")
-                print(f"   Query Parameters: {query_params}")
+                logger.info("🔍 Using dynamic configuration:")
+                logger.info("   Base URL: %s", base_url)
+                logger.info("   URL Parameters: %s", url_params)
+                logger.info("   Query Parameters: %s", query_params)
                 
                 # Execute the request using appropriate Method
                 result = self.method.execute_request(
@@ -264,11 +273,11 @@ class APIRequestAgent(BaseAgent):
                 if 'headers' in api_config:
                     headers.update(api_config['headers'])
                 
-                print(f"🔍 Using dynamic configuration:")
-                print(f"   Base URL: {base_url}")
-                print(f"   URL Parameters: {url_params}")
-                print(f"   Query Parameters: {query_params}")
-                print(f"   Body: {body}")
+                logger.info("🔍 Using dynamic configuration:")
+                logger.info("   Base URL: %s", base_url)
+                logger.info("   URL Parameters: %s", url_params)
+                logger.info("   Query Parameters: %s", query_params)
+                logger.info("   Body: %s", body)
                 
                 # Execute the POST/PUT request
                 result = self.method.execute_request(
@@ -296,9 +305,9 @@ class APIRequestAgent(BaseAgent):
                 if not request:
                     return "Error: Failed to create request"
 
-                print(f"✅ {self.method_name} request created successfully")
+                logger.info("✅ %s request created successfully", self.method_name)
                 return request
             
         except Exception as e:
-            print(f"\n❌ Error in API request creation: {e}")
+            logger.error("\n❌ Error in API request creation: %s", e)
             return f"Error executing agent: {str(e)}"
@@ -1,11 +1,45 @@
 from typing import Dict, Any
-import logging
 from Vincius.Core.brain_model import BrainModel
 from Vincius.Agents.base_agent import BaseAgent
 from Vincius.Agents.Analyst.reviewer import AnalysisReviewer
 from Vincius.Agents.Analyst.analyzer import RequirementsAnalyzer, AnalysisResult
 from Vincius.Agents.Analyst.prompts import AnalystPrompts
 from Vincius.Core.file_system_manager import FileSystemManager
+from Vincius.Core.task_executor import TaskExecutor
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+def format_technical_analysis(content: str) -> str:
+    """Format technical analysis as markdown; pure, so it can run in a worker process"""
+    sections = [
+        "# Technical Requirements Analysis\n",
+        "## Overview\n",
+        "## Components\n",
+        "## Technical Specifications\n",
+        "## Implementation Details\n"
+    ]
+
+    formatted = sections[0]
+
+    # Extract and format each section
+    if "OVERVIEW:" in content:
+        overview = content.split("OVERVIEW:")[1].split("COMPONENTS:")[0].strip()
+        formatted += f"{sections[1]}{overview}\n\n"
+
+    if "COMPONENTS:" in content:
+        components = content.split("COMPONENTS:")[1].split("TECHNICAL SPECIFICATIONS:")[0].strip()
+        formatted += f"{sections[2]}{components}\n\n"
+
+    if "TECHNICAL SPECIFICATIONS:" in content:
+        specs = content.split("TECHNICAL SPECIFICATIONS:")[1].split("IMPLEMENTATION DETAILS:")[0].strip()
+        formatted += f"{sections[3]}{specs}\n\n"
+
+    if "IMPLEMENTATION DETAILS:" in content:
+        impl = content.split("IMPLEMENTATION DETAILS:")[1].strip()
+        formatted += f"{sections[4]}{impl}\n"
+
+    return formatted
 
 
 class AnalystAgent(BaseAgent):
@@ -17,11 +51,11 @@ class AnalystAgent(BaseAgent):
         self.analyzer = RequirementsAnalyzer()  # Add missing analyzer
         self.reviewer = AnalysisReviewer()  # Add missing reviewer
         self.fs_manager = FileSystemManager(agent=self)  # Pass self reference for UUID access
-        print(f"🔧 Initialized {self.name} agent with UUID: {self.uuid[:8]}")
+        logger.info("🔧 Initialized %s agent with UUID: %s", self.name, self.uuid[:8])
 
     def execute(self, input_data: Any = None) -> str:
         try:
-            print("\n🚀 Starting requirements analysis...")
+            logger.info("\n🚀 Starting requirements analysis...")
             
             # Generate initial analysis
             result = self.analyzer.analyze_requirements(
@@ -42,22 +76,22 @@ class AnalystAgent(BaseAgent):
                 "description": "Technical Requirements Analysis"
             }
             
-            print("\n📝 Saving technical analysis...")
+            logger.info("\n📝 Saving technical analysis...")
             tech_file = self.fs_manager.create_or_update_file(tech_file_info)
             if not tech_file:
-                print("❌ Failed to save technical analysis")
+                logger.error("❌ Failed to save technical analysis")
                 return "Error: Failed to save technical analysis"
             
-            print(f"✅ Technical analysis saved at: {tech_file}")
+            logger.info("✅ Technical analysis saved at: %s", tech_file)
             
             # Review and generate final report
             if self.reviewer.review_analysis(result.content, self.brain, self.config):
-                print("\n📝 Generating final report...")
+                logger.info("\n📝 Generating final report...")
                 final_prompt = AnalystPrompts.final_report(result.content, "Analysis Approved")
                 report = self.brain.generate(final_prompt, self.config)
                 
                 if not report or not report.strip():
-                    print("❌ No report content generated")
+                    logger.error("❌ No report content generated")
                     return "Error: Empty report generated"
 
                 # Save final report
@@ -68,50 +102,22 @@ class AnalystAgent(BaseAgent):
                     "description": "Final Analysis Report"
                 }
                 
-                print("\n📝 Saving final report...")
+                logger.info("\n📝 Saving final report...")
                 report_file = self.fs_manager.create_or_update_file(report_file_info)
                 if not report_file:
-                    print("❌ Failed to save final report")
+                    logger.error("❌ Failed to save final report")
                     return "Error: Failed to save final report"
                 
-                print(f"✅ Final report saved at: {report_file}")
+                logger.info("✅ Final report saved at: %s", report_file)
                 return report
             else:
-                print("\n⚠️ Analysis needs revision before proceeding")
+                logger.warning("\n⚠️ Analysis needs revision before proceeding")
                 return result.content
 
         except Exception as e:
-            print(f"\n❌ Error in analysis process: {e}")
+            logger.error("\n❌ Error in analysis process: %s", e)
             return f"Error executing agent: {str(e)}"
 
     def _format_technical_analysis(self, content: str) -> str:
-        """Format technical analysis as markdown"""
-        sections = [
-            "# Technical Requirements Analysis\n",
-            "## Overview\n",
-            "## Components\n",
-            "## Technical Specifications\n",
-            "## Implementation Details\n"
-        ]
-        
-        formatted = sections[0]
-        
-        # Extract and format each section
-        if "OVERVIEW:" in content:
-            overview = content.split("OVERVIEW:")[1].split("COMPONENTS:")[0].strip()
-            formatted += f"{sections[1]}{overview}\n\n"
-            
-        if "COMPONENTS:" in content:
-            components = content.split("COMPONENTS:")[1].split("TECHNICAL SPECIFICATIONS:")[0].strip()
-            formatted += f"{sections[2]}{components}\n\n"
-            
-        if "TECHNICAL SPECIFICATIONS:" in content:
-            specs = content.split("TECHNICAL SPECIFICATIONS:")[1].split("IMPLEMENTATION DETAILS:")[0].strip()
-            formatted += f"{sections[3]}{specs}\n\n"
-            
-        if "IMPLEMENTATION DETAILS:" in content:
-            impl = content.split("IMPLEMENTATION DETAILS:")[1].strip()
-            formatted += f"{sections[4]}{impl}\n"
-            
-        return formatted
-
+        """Format technical analysis as markdown on the shared task executor"""
+        return TaskExecutor().run(format_technical_analysis, content)
@@ -2,6 +2,9 @@ from typing import Dict, Any, NamedTuple
 from pathlib import Path
 import json
 from Vincius.Agents.Analyst.prompts import AnalystPrompts
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class AnalysisResult(NamedTuple):
     content: str
@@ -17,16 +20,16 @@ class RequirementsAnalyzer:
             # Parse structured content
             structured_content = self._extract_sections(result)
             if not structured_content:
-                print("⚠️ No valid analysis structure found")
-                print("\nRaw response:")
-                print(result[:500] + "..." if len(result) > 500 else result)
+                logger.warning("⚠️ No valid analysis structure found")
+                logger.debug("\nRaw response:")
+                logger.debug("%s", result[:500] + "..." if len(result) > 500 else result)
                 return AnalysisResult(result, {})
                 
-            print("✅ Analysis generated successfully")
+            logger.info("✅ Analysis generated successfully")
             return AnalysisResult(result, structured_content)
             
         except Exception as e:
-            print(f"❌ Error analyzing requirements: {e}")
+            logger.error("❌ Error analyzing requirements: %s", e)
             return AnalysisResult("Error in analysis", {})
 
     def _extract_sections(self, text: str) -> Dict[str, Any]:
@@ -87,7 +90,7 @@ class RequirementsAnalyzer:
             return sections
 
         except Exception as e:
-            print(f"❌ Error extracting sections: {e}")
+            logger.error("❌ Error extracting sections: %s", e)
             return {}
 
     def _process_section(self, section: str, content: list[str]) -> Any:
@@ -1,5 +1,8 @@
 from typing import Dict, Any, List
 from Vincius.Agents.Analyst.prompts import AnalystPrompts
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class AnalysisReviewer:
     def __init__(self):
@@ -8,14 +11,14 @@ class AnalysisReviewer:
     def review_analysis(self, analysis: str, brain: Any, config: Dict) -> bool:
         """Review the generated analysis"""
         try:
-            print("\n🔍 Reviewing analysis...")
+            logger.info("\n🔍 Reviewing analysis...")
             
             # Generate review using prompt
             review_prompt = self.prompts.review_analysis(analysis)
             review_result = brain.generate(review_prompt, config)
             
             if "VALIDATION_PASSED" in review_result:
-                print("✅ Analysis validation passed - All requirements met")
+                logger.info("✅ Analysis validation passed - All requirements met")
                 return True
             
             # If improvements needed, display them
@@ -26,13 +29,13 @@ class AnalysisReviewer:
                 missing_sections = self._get_missing_sections(analysis)
                 if missing_sections:
                     improvement_prompt = self.prompts.request_improvements(missing_sections)
-                    print("\n📝 Requested improvements:")
-                    print(improvement_prompt)
+                    logger.info("\n📝 Requested improvements:")
+                    logger.debug("%s", improvement_prompt)
                 
             return False
             
         except Exception as e:
-            print(f"❌ Error reviewing analysis: {e}")
+            logger.error("❌ Error reviewing analysis: %s", e)
             return False
 
     def _get_missing_sections(self, analysis: str) -> List[str]:
@@ -43,7 +46,7 @@ class AnalysisReviewer:
     def _display_improvements(self, review_result: str) -> None:
         """Display improvement suggestions"""
         improvements = review_result.split("IMPROVEMENTS NEEDED:")[1].strip()
-        print("\n⚠️ Required Improvements:")
+        logger.warning("\n⚠️ Required Improvements:")
         for line in improvements.splitlines():
             if line.strip():
-                print(f"  • {line.strip()}")
+                logger.info("  • %s", line.strip())
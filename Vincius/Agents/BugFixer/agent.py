@@ -1,6 +1,9 @@
 import random
-from google import genai
 from typing import List, Dict, Optional
+from Vincius.Agents.base_agent import BaseAgent
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class BugFixerAgent(BaseAgent):
     def __init__(self, agent_name: str = "BugFixerAgent"):
@@ -40,7 +43,7 @@ class BugFixerAgent(BaseAgent):
             fix_content += " ".join([random.choice(self._get_keywords()) for _ in range(response_length // 5)])
             return fix_content.strip()
         except Exception as e:
-            print(f"Error generating simulated bug fixes: {e}")
+            logger.error("❌ Error generating simulated bug fixes: %s", e)
             return "Bug fix generation failed. Check the configurations."
 
     def _get_keywords(self) -> List[str]:
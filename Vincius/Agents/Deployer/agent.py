@@ -4,6 +4,9 @@ from Vincius.Core.brain_model import BrainModel
 from Vincius.Core.file_system_manager import FileSystemManager
 from Vincius.Agents.base_agent import BaseAgent
 from Vincius.Agents.Deployer.prompts import DeployerPrompts
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class DeployerAgent(BaseAgent):
     def __init__(self, config: Dict[str, Any]):
@@ -13,9 +16,9 @@ class DeployerAgent(BaseAgent):
 
     def execute(self, input_data: Any = None) -> str:
         try:
-            print("\n🚀 Starting deployment process...")
+            logger.info("\n🚀 Starting deployment process...")
             return "Deployment process placeholder"
             
         except Exception as e:
-            print(f"\n❌ Error in deployment process: {e}")
+            logger.error("\n❌ Error in deployment process: %s", e)
             return f"Error executing agent: {str(e)}"
@@ -5,6 +5,9 @@ from Vincius.Core.file_system_manager import FileSystemManager
 from Vincius.Agents.base_agent import BaseAgent
 from Vincius.Agents.Developer.code_creator import CodeCreator
 from Vincius.Agents.Developer.code_reviewer import CodeReviewer
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class DeveloperAgent(BaseAgent):
     def __init__(self, config: Dict[str, Any]):
@@ -15,11 +18,11 @@ class DeveloperAgent(BaseAgent):
         self.code_creator = CodeCreator()
         self.code_reviewer = CodeReviewer()
         self.fs_manager = FileSystemManager(agent=self)  # Pass self reference
-        print(f"🔧 Initialized {self.name} agent with UUID: {self.uuid[:8]}")
+        logger.info("🔧 Initialized %s agent with UUID: %s", self.name, self.uuid[:8])
 
     def execute(self, input_data: Any = None) -> str:
         try:
-            print("\n🚀 Starting code generation...")
+            logger.info("\n🚀 Starting code generation...")
             
             # Generate and create code files
             result = self.code_creator.create_from_analysis(
@@ -31,18 +34,18 @@ class DeveloperAgent(BaseAgent):
             if not result.saved_files:
                 return "No files were created"
             
-            print(f"\n📁 Created {len(result.saved_files)} files")
+            logger.info("\n📁 Created %s files", len(result.saved_files))
             
             # Verify structure using fs_manager
             if self.fs_manager.verify_structure(result.saved_files, self.brain, self.config):
-                print("\n🔍 Starting code review phase...")
+                logger.info("\n🔍 Starting code review phase...")
                 self.code_reviewer.review_files(result.saved_files, self.brain, self.config)
-                print("\n✅ Development completed successfully")
+                logger.info("\n✅ Development completed successfully")
             else:
-                print("\n⚠️ Project structure verification failed")
+                logger.warning("\n⚠️ Project structure verification failed")
             
             return result.content
             
         except Exception as e:
-            print(f"\n❌ Error in development process: {e}")
+            logger.error("\n❌ Error in development process: %s", e)
             return f"Error executing agent: {str(e)}"
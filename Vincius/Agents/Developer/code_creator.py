@@ -2,6 +2,9 @@ from pathlib import Path
 from typing import Dict, Any, NamedTuple, List, Optional
 from Vincius.Core.file_system_manager import FileSystemManager
 from Vincius.Agents.Developer.prompts import DeveloperPrompts
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class CreationResult(NamedTuple):
     content: str
@@ -10,7 +13,7 @@ class CreationResult(NamedTuple):
 class CodeCreator:  # Remove BaseAgent inheritance
     def __init__(self):
         self.fs_manager = FileSystemManager()
-        print("🔧 Initialized CodeCreator")
+        logger.info("🔧 Initialized CodeCreator")
 
     def create_from_analysis(self, input_data: Any, brain: Any, config: Dict) -> CreationResult:
         """Create code files from analysis"""
@@ -33,12 +36,12 @@ class CodeCreator:  # Remove BaseAgent inheritance
 
             # Get recent file operations from logger
             recent_files = self.fs_manager.logger.get_recent_files()
-            print("\n📝 Recently created/modified files:")
+            logger.info("\n📝 Recently created/modified files:")
             for log in recent_files:
-                print(f"- {log['file_path']} ({log['operation']} at {log['timestamp']})")
+                logger.info("- %s (%s at %s)", log['file_path'], log['operation'], log['timestamp'])
 
             return CreationResult(result, saved_files)
 
         except Exception as e:
-            print(f"❌ Error in create_from_analysis: {e}")
+            logger.error("❌ Error in create_from_analysis: %s", e)
             return CreationResult("", [])
@@ -1,79 +1,180 @@
+import re
+import time
+import threading
+from difflib import SequenceMatcher
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from Vincius.Core.config_manager import ConfigManager
+from Vincius.Core import run_context
 from Vincius.Core.file_system_manager import FileSystemManager
+from Vincius.Core.metrics import MetricsRecorder
+from Vincius.Core.patch_applier import PatchError, apply_hunks, group_by_path, parse_patch
+from Vincius.Core.prompt_budget import ChunkPlanner, chunk_budget, estimate_tokens, pack_batches, run_concurrently
+from Vincius.Core.review_ledger import ReviewLedger
 from Vincius.Agents.Developer.prompts import DeveloperPrompts
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+BATCH_FILE_OVERHEAD_TOKENS = 20  # Per-file header and verdict line in a batched prompt
+
+# Start of one file's answer in a batched reply: "FILE: path" or "VALIDATION_PASSED: path"
+BATCH_ANSWER = re.compile(r'^[ \t]*(?:\*\*)?(FILE|VALIDATION_PASSED)(?:\*\*)?:(?:\*\*)?[ \t]*`?([^\s`*]+)`?', re.MULTILINE)
+
+class ReviewBudget:
+    """Wall time and model tokens the review phase of one run may use, read from the run's metrics"""
+
+    _by_run: Dict[Optional[str], 'ReviewBudget'] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def for_run(cls, seconds: Optional[float] = None, tokens: Optional[int] = None) -> 'ReviewBudget':
+        """The current run's budget, started by its first review; every review_files call shares it"""
+        run_id = run_context.current().run_id
+        with cls._lock:
+            budget = cls._by_run.get(run_id)
+            if budget is None:
+                budget = cls._by_run[run_id] = cls(seconds, tokens)
+            return budget
+
+    def __init__(self, seconds: Optional[float] = None, tokens: Optional[int] = None):
+        self.seconds = seconds
+        self.tokens = tokens
+        self.metrics = MetricsRecorder()
+        self.started = time.monotonic()
+        self.tokens_at_start = self._run_tokens()
+
+    def _run_tokens(self) -> int:
+        totals = self.metrics.run_totals()
+        return totals["prompt_tokens"] + totals["response_tokens"]
+
+    def exhausted(self) -> Optional[str]:
+        """Why the budget is spent, or None while it still has room"""
+        elapsed = time.monotonic() - self.started
+        if self.seconds and elapsed >= self.seconds:
+            return f"{elapsed:.0f}s of {self.seconds}s used"
+        spent = self._run_tokens() - self.tokens_at_start
+        if self.tokens and spent >= self.tokens:
+            return f"{spent} of {self.tokens} tokens used"
+        return None
+
+def change_ratio(before: str, after: str) -> float:
+    """Share of lines that differ between two versions (0 = identical, 1 = nothing in common)"""
+    return 1.0 - SequenceMatcher(None, before.splitlines(), after.splitlines(), autojunk=False).ratio()
 
 class CodeReviewer:
     def __init__(self):
         self.fs_manager = FileSystemManager()
+        self.ledger = ReviewLedger()
         
     def review_files(self, files: List[Path], brain: Any, config: Dict[str, Any]) -> bool:
         """Review a list of files and suggest improvements"""
         try:
-            print(f"\n🔍 Starting code review phase...")
+            logger.info("\n🔍 Starting code review phase...")
             
             # Get all files from directory if not provided
             if not files:
                 files = self.fs_manager.list_files()
                 
             if not files:
-                print("⚠️ No files found in Code directory")
+                logger.warning("⚠️ No files found in Code directory")
                 return False
                 
-            # Review each file
+            # Later passes re-review only the files the previous pass changed, until they converge
+            settings = self._review_settings(config)
+            max_passes = max(1, settings.get('max_passes', 1))
+            budget = ReviewBudget.for_run(settings.get('time_budget_seconds'), settings.get('token_budget'))
             improvements_needed = False
-            for file_path in files:
-                is_improved = self.review_file(file_path, brain, config)
-                improvements_needed = improvements_needed or is_improved
-                
+            for review_pass in range(1, max_passes + 1):
+                reason = budget.exhausted()
+                if reason:
+                    logger.info("⏱️ Stopping review before pass %s: the run's review budget is spent (%s)", review_pass, reason)
+                    break
+                if review_pass > 1:
+                    logger.info("\n🔁 Review pass %s/%s for %s files", review_pass, max_passes, len(files))
+
+                before = self._snapshot(files) if review_pass < max_passes else {}
+                improved = self._review_pass(files, brain, config, budget)
+                improvements_needed = improvements_needed or improved
+                if not improved or review_pass == max_passes:
+                    break
+                files = self._still_changing(before, settings.get('min_change_ratio', 0.02))
+                if not files:
+                    logger.info("✅ Review converged after %s passes", review_pass)
+                    break
+
             if not improvements_needed:
-                print("\n✅ Code review passed: No improvements needed")
+                logger.info("\n✅ Code review passed: No improvements needed")
                 
             return True
             
         except Exception as e:
-            print(f"❌ Error scanning directory: {e}")
+            logger.error("❌ Error scanning directory: %s", e)
             return False
+        finally:
+            # One ledger write per review phase rather than one per approval
+            self.ledger.flush()
             
     def review_file(self, file_path: Path, brain: Any, config: Dict[str, Any]) -> bool:
         """Review a single file and apply improvements if needed"""
         try:
             # Check if file exists and is supported
             if not self._is_reviewable(file_path):
-                print(f"⚠️ Skipping review for {file_path} (not reviewable)")
+                logger.warning("⚠️ Skipping review for %s (not reviewable)", file_path)
                 return False
                 
             # Get file content
             content = self.fs_manager.get_file_content(file_path)
             if not content:
-                print(f"⚠️ Unable to read content of {file_path}")
+                logger.warning("⚠️ Unable to read content of %s", file_path)
                 return False
                 
             # Generate review prompt with improved format
             file_type = file_path.suffix.lstrip('.')
             relative_path = file_path.relative_to(self.fs_manager.base_dir)  # Use base_dir instead of code_dir
-            prompt = DeveloperPrompts.generate_review_prompt(
-                str(relative_path),
-                file_type,
-                content
-            )
-            
-            # Get feedback from LLM
-            print(f"\n🔍 Reviewing: {relative_path}")
-            feedback = brain.generate(prompt, config)
+            if self._is_approved(str(relative_path), content, config):
+                logger.info("⏭️ Skipping %s: unchanged since its last approved review", relative_path)
+                return False
+
+            planner = ChunkPlanner(chunk_budget(config))
+            logger.info("\n🔍 Reviewing: %s", relative_path)
+            if self._use_patches(content, config):
+                applied = self._review_with_patches(str(relative_path), file_type, content, brain, config)
+                if applied is not None:
+                    return applied
+                logger.info("↩️ Falling back to a full rewrite review of %s", relative_path)
+
+            if planner.needs_chunking(content):
+                # Review oversized files part by part; never regenerate the whole file on retry
+                prompt = None
+                feedback = self._review_in_chunks(planner, str(relative_path), file_type, content, brain, config)
+            else:
+                prompt = DeveloperPrompts.generate_review_prompt(
+                    str(relative_path),
+                    file_type,
+                    content
+                )
+                
+                # Get feedback from LLM
+                feedback = brain.generate(prompt, config)
             
+            if not feedback:
+                logger.warning("⚠️ No usable review for %s, keeping it unchanged", relative_path)
+                return False
+
             # Check if improvements are needed
             if "VALIDATION_PASSED" in feedback:
-                print(f"✅ No improvements needed for {relative_path}")
+                logger.info("✅ No improvements needed for %s", relative_path)
+                self._approve(str(relative_path), content, config)
                 return False
                 
             # Debug the received feedback
-            print(f"\n🔍 DEBUG: Review feedback received ({len(feedback)} chars)")
-            print(f"Feedback preview: {feedback[:200]}...\n")
+            logger.debug("\n🔍 Review feedback received (%s chars)", len(feedback))
+            logger.debug("Feedback preview: %s...\n", feedback[:200])
             
             # Process feedback to create/update files
             try:
-                print(f"🔄 Applying suggested improvements...")
+                logger.info("🔄 Applying suggested improvements...")
                 updated_files = self.fs_manager.process_content(
                     feedback,
                     brain=brain,
@@ -82,24 +183,320 @@ class CodeReviewer:
                 )
                 
                 if updated_files:
-                    print(f"✅ Applied improvements to {len(updated_files)} files")
+                    logger.info("✅ Applied improvements to %s files", len(updated_files))
                     return True
                     
-                print(f"⚠️ No valid improvements found for {relative_path}")
+                logger.warning("⚠️ No valid improvements found for %s", relative_path)
                 return False
                 
             except Exception as e:
-                print(f"⚠️ Failed to process improvements: {e}")
+                logger.warning("⚠️ Failed to process improvements: %s", e)
                 # Try to directly extract any code blocks
-                print("🔄 Attempting alternative processing...")
+                logger.info("🔄 Attempting alternative processing...")
                 # Fallback: At least try to update the current file
                 self._apply_fallback_improvement(file_path, feedback, relative_path)
                 return True
             
         except Exception as e:
-            print(f"❌ Error reviewing file {file_path}: {e}")
+            logger.error("❌ Error reviewing file %s: %s", file_path, e)
             return False
             
+    def _review_pass(self, files: List[Path], brain: Any, config: Dict[str, Any],
+                     budget: Optional[ReviewBudget] = None) -> bool:
+        """Review every file once; small files several per prompt, then the rest one by one"""
+        improvements_needed = False
+        if self._review_settings(config).get('batch_small_files', True) and not (budget and budget.exhausted()):
+            improvements_needed, files = self._review_in_batches(files, brain, config)
+
+        for file_path in files:
+            reason = budget.exhausted() if budget else None
+            if reason:
+                logger.info("⏱️ Review budget spent (%s), leaving remaining files as they are", reason)
+                break
+            is_improved = self.review_file(file_path, brain, config)
+            improvements_needed = improvements_needed or is_improved
+        return improvements_needed
+
+    def _snapshot(self, files: List[Path]) -> Dict[Path, str]:
+        """Current content of each readable file, to measure what a pass changed"""
+        snapshot = {}
+        for file_path in files:
+            try:
+                snapshot[file_path] = file_path.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+        return snapshot
+
+    def _still_changing(self, before: Dict[Path, str], min_change_ratio: float) -> List[Path]:
+        """Files worth another pass: changed by the last one by at least min_change_ratio"""
+        pending = []
+        for file_path, previous in before.items():
+            try:
+                current = file_path.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+            if current == previous:
+                continue
+            delta = change_ratio(previous, current)
+            if delta < min_change_ratio:
+                logger.info("✅ %s converged (%.1f%% of lines changed)", file_path.name, delta * 100)
+                continue
+            pending.append(file_path)
+        return pending
+
+    def _review_settings(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """CODE_REVIEW settings with the step's review_mode and review_passes overrides applied"""
+        settings = dict(ConfigManager().get('CODE_REVIEW', {}) or {})
+        if config.get('review_mode'):
+            settings['mode'] = config['review_mode']
+        if config.get('review_passes'):
+            settings['max_passes'] = config['review_passes']
+        return settings
+
+    def _review_in_batches(self, files: List[Path], brain: Any, config: Dict[str, Any]) -> Tuple[bool, List[Path]]:
+        """Pack small files into shared prompts up to the chunk budget.
+
+        Returns whether any file was improved, and the files still needing a
+        single review: large or unreadable ones, and any the batched reply
+        gave no usable verdict for.
+        """
+        settings = self._review_settings(config)
+        max_file_tokens = settings.get('batch_max_file_tokens', 500)
+        candidates, remaining = [], []
+        for file_path in files:
+            try:
+                relative_path = str(file_path.relative_to(self.fs_manager.base_dir))
+            except ValueError:
+                remaining.append(file_path)
+                continue
+            content = self.fs_manager.get_file_content(file_path) if self._is_reviewable(file_path) else None
+            if not content or estimate_tokens(content) > max_file_tokens:
+                remaining.append(file_path)
+            elif self._is_approved(relative_path, content, config):
+                logger.info("⏭️ Skipping %s: unchanged since its last approved review", relative_path)
+            else:
+                candidates.append((file_path, relative_path, content))
+
+        if len(candidates) < 2:
+            return False, remaining + [file_path for file_path, _, _ in candidates]
+
+        sizes = [estimate_tokens(content) + BATCH_FILE_OVERHEAD_TOKENS for _, _, content in candidates]
+        batches = pack_batches(candidates, sizes, chunk_budget(config), settings.get('batch_max_files', 10))
+        remaining += [batch[0][0] for batch in batches if len(batch) == 1]
+        batches = [batch for batch in batches if len(batch) > 1]
+        if not batches:
+            return False, remaining
+
+        logger.info("📦 Reviewing %s small files in %s prompts",
+                    sum(len(batch) for batch in batches), len(batches))
+        results = run_concurrently(lambda batch: self._review_batch(batch, brain, config),
+                                   batches, config.get('chunk_workers', 4))
+        improved = any(result[0] for result in results)
+        return improved, remaining + [file_path for _, unresolved in results for file_path in unresolved]
+
+    def _review_batch(self, batch: List[Tuple[Path, str, str]], brain: Any,
+                      config: Dict[str, Any]) -> Tuple[bool, List[Path]]:
+        """Review one packed prompt and apply its per-file answers in a single transaction"""
+        prompt = DeveloperPrompts.generate_batch_review_prompt(
+            [(relative_path, file_path.suffix.lstrip('.'), content) for file_path, relative_path, content in batch]
+        )
+        try:
+            reply = brain.generate(prompt, config)
+        except Exception as e:
+            logger.warning("⚠️ Batched review failed, reviewing its files one by one: %s", e)
+            return False, [file_path for file_path, _, _ in batch]
+
+        answers = self._split_batch_reply(reply or "", [relative_path for _, relative_path, _ in batch], config)
+        files_info, unresolved = [], []
+        for file_path, relative_path, content in batch:
+            kind, answer = answers.get(relative_path, (None, None))
+            if kind == "VALIDATION_PASSED":
+                logger.info("✅ No improvements needed for %s", relative_path)
+                self._approve(relative_path, content, config)
+                continue
+            sections = self.fs_manager.content_parser.parse_files_section(answer) if answer else []
+            if not sections:
+                logger.warning("⚠️ No usable verdict for %s in the batched review", relative_path)
+                unresolved.append(file_path)
+                continue
+            files_info.append({**sections[0], "path": relative_path, "modifications": True})
+
+        if not files_info:
+            return False, unresolved
+        try:
+            updated_files = self.fs_manager.write_files(files_info)
+        except Exception as e:
+            logger.warning("⚠️ Failed to apply batched improvements: %s", e)
+            return False, unresolved + [self.fs_manager.base_dir / info["path"] for info in files_info]
+        logger.info("✅ Applied improvements to %s files", len(updated_files))
+        return bool(updated_files), unresolved
+
+    def _split_batch_reply(self, reply: str, paths: List[str], config: Dict[str, Any]) -> Dict[str, Tuple[str, str]]:
+        """Cut a batched reply into (kind, text) answers keyed by file path.
+
+        Only the first answer line naming each batch path, outside code fences,
+        starts an answer, so FILE: lines inside a file's content do not cut it
+        short. When the reply looks truncated its last answer is dropped and that
+        file reviewed alone.
+        """
+        boundaries, seen = [], set()
+        for match in BATCH_ANSWER.finditer(reply):
+            path = match.group(2)
+            path = path[2:] if path.startswith('./') else path
+            inside_fence = sum(1 for line in reply[:match.start()].splitlines()
+                               if line.lstrip().startswith('```')) % 2 == 1
+            if inside_fence:
+                continue
+            if path in paths and path not in seen:
+                seen.add(path)
+                boundaries.append((match, path))
+            elif path not in paths:
+                logger.debug("Ignoring batched answer line for unexpected path %s", path)
+
+        answers: Dict[str, Tuple[str, str]] = {}
+        for (match, path), following in zip(boundaries, boundaries[1:] + [None]):
+            end = following[0].start() if following else len(reply)
+            answers[path] = (match.group(1), reply[match.start():end])
+
+        if boundaries and self._looks_truncated(reply, config):
+            logger.warning("⚠️ Batched review reply looks truncated, dropping its answer for %s", boundaries[-1][1])
+            del answers[boundaries[-1][1]]
+        return answers
+
+    @staticmethod
+    def _looks_truncated(reply: str, config: Dict[str, Any]) -> bool:
+        """Whether the reply stopped mid-answer: an unclosed code fence, or output at the max_tokens limit"""
+        fences = sum(1 for line in reply.splitlines() if line.lstrip().startswith('```'))
+        max_tokens = config.get('max_tokens') or (ConfigManager().get('MODEL_CONFIG', {}) or {}).get('max_tokens')
+        return fences % 2 == 1 or bool(max_tokens and estimate_tokens(reply) >= max_tokens * 0.95)
+
+    def _is_approved(self, relative_path: str, content: str, config: Dict[str, Any]) -> bool:
+        """Whether this exact content passed review before, so the model call can be skipped"""
+        if not self._review_settings(config).get('skip_approved', True):
+            return False
+        return self.ledger.is_approved(relative_path, content, DeveloperPrompts.REVIEW_PROMPT_VERSION)
+
+    def _approve(self, relative_path: str, content: str, config: Dict[str, Any]) -> None:
+        if self._review_settings(config).get('skip_approved', True):
+            self.ledger.record(relative_path, content, DeveloperPrompts.REVIEW_PROMPT_VERSION)
+
+    def _use_patches(self, content: str, config: Dict[str, Any]) -> bool:
+        """Patch mode suits files long enough that re-emitting them is costly, yet that fit one prompt"""
+        settings = self._review_settings(config)
+        if settings.get('mode', 'full') != 'patch':
+            return False
+        if content.count('\n') + 1 < settings.get('patch_min_lines', 0):
+            return False
+        return estimate_tokens(content) <= chunk_budget(config, output_bound=False)
+
+    def _review_with_patches(self, relative_path: str, file_type: str, content: str,
+                             brain: Any, config: Dict[str, Any]) -> Optional[bool]:
+        """Review by requesting hunks and applying them locally.
+
+        Returns True when improvements were written, False when none were needed,
+        and None when the reply could not be applied and a full rewrite is due.
+        """
+        prompt = DeveloperPrompts.generate_patch_review_prompt(relative_path, file_type, content)
+        feedback = brain.generate(prompt, config)
+        if not feedback:
+            return None
+        if "VALIDATION_PASSED" in feedback:
+            logger.info("✅ No improvements needed for %s", relative_path)
+            self._approve(relative_path, content, config)
+            return False
+
+        try:
+            hunks = parse_patch(feedback, default_path=relative_path)
+        except PatchError as e:
+            logger.warning("⚠️ Unusable patch for %s: %s", relative_path, e)
+            return None
+        if not hunks:
+            logger.warning("⚠️ Review of %s returned no hunks", relative_path)
+            return None
+
+        fuzz = self._review_settings(config).get('patch_fuzz', 0.85)
+        description = re.search(r'^Description:[ \t]*(.+)$', feedback, re.MULTILINE)
+        files_info = []
+        for path, file_hunks in group_by_path(hunks).items():
+            original = content if path == relative_path else self.fs_manager.get_file_content(Path(path))
+            if original is None and any(hunk.old for hunk in file_hunks):
+                logger.warning("⚠️ Patch targets missing file %s", path)
+                return None
+            try:
+                patched = apply_hunks(original or "", file_hunks, fuzz)
+            except PatchError as e:
+                logger.warning("⚠️ %s", e)
+                return None
+            if patched != original:
+                files_info.append({
+                    "path": path,
+                    "content": patched,
+                    "description": description.group(1).strip() if description else "Applied review patch",
+                    "modifications": original is not None
+                })
+
+        if not files_info:
+            logger.info("✅ Patch for %s changed nothing", relative_path)
+            return False
+
+        # Every hunk matched; write all patched files together or not at all
+        try:
+            updated_files = self.fs_manager.write_files(files_info)
+        except Exception as e:
+            logger.warning("⚠️ Failed to write patched files: %s", e)
+            return False
+        logger.info("🩹 Applied %s hunks to %s files (%s reply chars for %s file chars)",
+                    len(hunks), len(updated_files), len(feedback), len(content))
+        return bool(updated_files)
+
+    def _review_in_chunks(self, planner: ChunkPlanner, relative_path: str, file_type: str,
+                          content: str, brain: Any, config: Dict[str, Any]) -> str:
+        """Review chunks concurrently and stitch improved chunks back into one FILE: section"""
+        chunks = planner.plan(relative_path, content)
+        header = planner.header(relative_path, content)
+        logger.info("✂️ %s exceeds the prompt budget, reviewing %s parts concurrently", relative_path, len(chunks))
+
+        def review_chunk(chunk):
+            prompt = DeveloperPrompts.generate_chunk_review_prompt(
+                relative_path,
+                file_type,
+                chunk.content,
+                chunk.describe(),
+                context=header if chunk.index else ""
+            )
+            feedback = brain.generate(prompt, config)
+            if feedback and "VALIDATION_PASSED" in feedback:
+                return None
+            sections = self.fs_manager.content_parser.parse_files_section(feedback) if feedback else []
+            if not sections:
+                logger.warning("⚠️ Unparseable review for %s, keeping original", chunk.describe())
+                return False
+            return sections[0]
+
+        reviews = run_concurrently(review_chunk, chunks, config.get('chunk_workers', 4))
+        if not any(reviews):
+            # Only a file whose every part passed counts as approved
+            if False in reviews:
+                return ""
+            return "VALIDATION_PASSED: Code follows best practices. No improvements needed."
+
+        parts, descriptions = [], []
+        for chunk, review in zip(chunks, reviews):
+            if review:
+                improved = self.fs_manager.content_parser.clean_code_block(review["content"])
+                # Parsing strips the first line; chunks inside a class must keep their indent
+                indent = re.match(r'[ \t]*', chunk.content.lstrip('\n')).group(0)
+                if indent and not improved.startswith(indent):
+                    improved = indent + improved.lstrip()
+                parts.append(improved.rstrip("\n"))
+                if review.get("description"):
+                    descriptions.append(f"{chunk.describe()}: {review['description']}")
+            else:
+                parts.append(chunk.content.rstrip("\n"))
+
+        merged = "\n\n".join(parts) + "\n"
+        return f"FILE: {relative_path}\nDescription: {'; '.join(descriptions)}\nContent:\n{merged}"
+
     def _apply_fallback_improvement(self, file_path: Path, feedback: str, relative_path: str) -> bool:
         """Fallback method to extract and apply improvements when regular parsing fails"""
         try:
@@ -122,14 +519,14 @@ class CodeReviewer:
                 # Update file directly
                 updated_path = self.fs_manager.create_or_update_file(file_info)
                 if updated_path:
-                    print(f"✅ Applied improvements using fallback method to {relative_path}")
+                    logger.info("✅ Applied improvements using fallback method to %s", relative_path)
                     return True
             
-            print("⚠️ Could not extract improvements even with fallback method")
+            logger.warning("⚠️ Could not extract improvements even with fallback method")
             return False
             
         except Exception as e:
-            print(f"❌ Error in fallback improvement: {e}")
+            logger.error("❌ Error in fallback improvement: %s", e)
             return False
             
     def _is_reviewable(self, file_path: Path) -> bool:
@@ -1,6 +1,9 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Sequence, Tuple
 
 class DeveloperPrompts:
+    # Bump when the review prompts change what counts as approved; stored verdicts then expire
+    REVIEW_PROMPT_VERSION = "1"
+
     @staticmethod
     def code_creation(input_data: str, guidelines: List[str]) -> str:
         guidelines_text = "\n".join(f"- {g}" for g in guidelines)
@@ -188,4 +191,95 @@ If no improvements are needed, respond exactly with:
 "VALIDATION_PASSED: Code follows best practices. No improvements needed."
 
 Remember to maintain proper indentation and formatting in your code examples.
-"""
\ No newline at end of file
+"""
+
+    @staticmethod
+    def generate_chunk_review_prompt(file_path: str, file_type: str, content: str, part: str, context: str = "") -> str:
+        """Review prompt for one part of a file too large to review in a single prompt"""
+        return f"""
+As a senior code reviewer, analyze this part of a larger file for improvements.
+
+File: {file_path}
+Type: {file_type}
+Section: {part}
+
+File header for context only (do not repeat it unless this section starts the file):
+{context}
+
+Current content of this section:
+{content}
+
+You must respond in a specific format:
+
+If you find issues that need improvements, respond with ONLY the improved version of this section:
+
+FILE: {file_path}
+Description: [Explain what issues were found and what improvements are being made]
+Content:
+[Complete improved version of this section only]
+
+Do not include code from other sections and do not suggest additional files.
+
+If no improvements are needed, respond exactly with:
+"VALIDATION_PASSED: Code follows best practices. No improvements needed."
+"""
+
+    @staticmethod
+    def generate_patch_review_prompt(file_path: str, file_type: str, content: str) -> str:
+        """Review prompt that asks for targeted edits instead of the whole improved file"""
+        return f"""
+As a senior code reviewer, analyze this code for improvements.
+
+File: {file_path}
+Type: {file_type}
+
+Current content:
+{content}
+
+You must respond in a specific format:
+
+If you find issues that need improvements, respond with ONLY the changes, as search/replace blocks:
+
+FILE: {file_path}
+Description: [Explain what issues were found and what improvements are being made]
+<<<<<<< SEARCH
+[Existing lines to change, copied exactly, with two or three unchanged lines of context]
+=======
+[The same lines after your change]
+>>>>>>> REPLACE
+
+Use one block per change, in file order. Each SEARCH section must match the current
+content exactly and only once. Do not repeat unchanged parts of the file.
+A unified diff (@@ -start,count +start,count @@ hunks) is also accepted.
+
+If no improvements are needed, respond exactly with:
+"VALIDATION_PASSED: Code follows best practices. No improvements needed."
+"""
+
+    @staticmethod
+    def generate_batch_review_prompt(files: Sequence[Tuple[str, str, str]]) -> str:
+        """Review prompt covering several small files, answered with one verdict per file"""
+        sections = "\n\n".join(
+            f"=== File: {path} (type: {file_type}) ===\n{content}" for path, file_type, content in files
+        )
+        return f"""
+As a senior code reviewer, analyze each of these {len(files)} files for improvements.
+
+{sections}
+
+You must answer for EVERY file, in the same order, with one of these two forms.
+
+If the file needs no improvements:
+
+VALIDATION_PASSED: path/of/the/file
+
+If the file needs improvements:
+
+FILE: path/of/the/file
+Description: [Explain what issues were found and what improvements are being made]
+Content:
+[Complete improved version of the file]
+
+Use the exact paths shown above. Do not suggest additional files.
+Remember to maintain proper indentation and formatting in your code.
+"""
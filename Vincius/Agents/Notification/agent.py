@@ -5,6 +5,9 @@ from Vincius.Core.file_system_manager import FileSystemManager
 from Vincius.Agents.base_agent import BaseAgent
 from Vincius.Agents.Notification.notification_creator import NotificationCreator
 from Vincius.Agents.Notification.Channels import available_channels, NotificationChannel
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class NotificationAgent(BaseAgent):
     def __init__(self, config: Dict[str, Any]):
@@ -12,7 +15,7 @@ class NotificationAgent(BaseAgent):
         self.brain = BrainModel()
         self.notification_creator = NotificationCreator()
         
-        print("\n🔍 Initializing NotificationAgent...")
+        logger.info("\n🔍 Initializing NotificationAgent...")
         
         # Initialize requested channels from config
         self.channels = []
@@ -20,39 +23,39 @@ class NotificationAgent(BaseAgent):
         # Get channels directly from config since it's already flattened
         channel_configs = config.get('channels', [])
         
-        print(f"\n📋 Channel Configuration:")
-        print(f"- Channel configs found: {channel_configs}")
-        print(f"- Available channels: {[c().get_channel_name() for c in available_channels]}")
+        logger.info("\n📋 Channel Configuration:")
+        logger.info("- Channel configs found: %s", channel_configs)
+        logger.info("- Available channels: %s", [c().get_channel_name() for c in available_channels])
         
         # Create instances of available channels that match config
         for channel_class in available_channels:
             try:
                 channel = channel_class()
                 channel_name = channel.get_channel_name()
-                print(f"\nProcessing channel: {channel_name}")
-                print(f"Looking for match in: {channel_configs}")
+                logger.info("\nProcessing channel: %s", channel_name)
+                logger.info("Looking for match in: %s", channel_configs)
                 
                 if channel_name in channel_configs:
-                    print(f"✅ Loading channel: {channel_name}")
+                    logger.info("✅ Loading channel: %s", channel_name)
                     self.channels.append(channel)
                 else:
-                    print(f"⚠️ Channel not configured: {channel_name}")
+                    logger.warning("⚠️ Channel not configured: %s", channel_name)
                     
             except Exception as e:
-                print(f"❌ Error loading channel {channel_class.__name__}: {e}")
+                logger.error("❌ Error loading channel %s: %s", channel_class.__name__, e)
 
-        print(f"\n📊 Channel Loading Summary:")
-        print(f"- Total channels available: {len(available_channels)}")
-        print(f"- Channels configured: {len(channel_configs)}")
-        print(f"- Channels loaded: {len(self.channels)}")
+        logger.info("\n📊 Channel Loading Summary:")
+        logger.info("- Total channels available: %s", len(available_channels))
+        logger.info("- Channels configured: %s", len(channel_configs))
+        logger.info("- Channels loaded: %s", len(self.channels))
         if self.channels:
-            print(f"- Active channels: {[c.get_channel_name() for c in self.channels]}")
+            logger.info("- Active channels: %s", [c.get_channel_name() for c in self.channels])
         else:
-            print("⚠️ No channels were loaded!")
+            logger.warning("⚠️ No channels were loaded!")
 
     def execute(self, input_data: Any = None) -> Any:
         try:
-            print("\n📢 Starting notification generation...")
+            logger.info("\n📢 Starting notification generation...")
             
             if not input_data:
                 return "Error: No notification data provided"
@@ -71,11 +74,11 @@ class NotificationAgent(BaseAgent):
             if not created_files:
                 return "Error: Failed to create notifications"
 
-            print(f"✅ Created {len(created_files)} notifications")
+            logger.info("✅ Created %s notifications", len(created_files))
             
             # Retorna o mesmo input_data para manter consistência entre tasks_result e notification_result
             return input_data
             
         except Exception as e:
-            print(f"\n❌ Error in notification process: {e}")
+            logger.error("\n❌ Error in notification process: %s", e)
             return f"Error executing agent: {str(e)}"
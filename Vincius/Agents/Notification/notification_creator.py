@@ -1,9 +1,12 @@
 from typing import Dict, Any, List, Union
 from pathlib import Path
 from Vincius.Core.file_system_manager import FileSystemManager
-from Core.content_parser import ContentParser
+from Vincius.Core.content_parser import ContentParser
 from Vincius.Agents.Notification.Channels.base_channel import NotificationChannel
 from Vincius.Agents.Notification.prompts import NotificationPrompts
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class NotificationCreator:
     def __init__(self):
@@ -17,7 +20,7 @@ class NotificationCreator:
         try:
             for channel in channels:
                 try:
-                    print(f"\n📝 Generating content for {channel.get_channel_name()} channel...")
+                    logger.info("\n📝 Generating content for %s channel...", channel.get_channel_name())
                     rules = channel.get_channel_rules()
                     
                     # Generate notification content
@@ -29,13 +32,13 @@ class NotificationCreator:
                     
                     response = brain.generate(prompt, config)
                     if not response:
-                        print(f"❌ Failed to generate content for {channel.get_channel_name()}")
+                        logger.error("❌ Failed to generate content for %s", channel.get_channel_name())
                         continue
 
                     # Extract and clean content
                     content = self._extract_content(response)
                     if content is None:
-                        print(f"❌ Invalid content format for {channel.get_channel_name()}")
+                        logger.error("❌ Invalid content format for %s", channel.get_channel_name())
                         continue
 
                     # Format and save notification
@@ -43,19 +46,19 @@ class NotificationCreator:
                         file_info = channel.format_notification(content)
                         if path := self.fs_manager.create_or_update_file(file_info):
                             created_files.append(path)
-                            print(f"✅ Created notification for {channel.get_channel_name()}: {path}")
+                            logger.info("✅ Created notification for %s: %s", channel.get_channel_name(), path)
                     except Exception as format_error:
-                        print(f"❌ Error formatting notification: {format_error}")
+                        logger.error("❌ Error formatting notification: %s", format_error)
                         continue
                     
                 except Exception as e:
-                    print(f"❌ Error processing channel {channel.get_channel_name()}: {e}")
+                    logger.error("❌ Error processing channel %s: %s", channel.get_channel_name(), e)
                     continue
 
             return created_files
             
         except Exception as e:
-            print(f"❌ Error creating notifications: {e}")
+            logger.error("❌ Error creating notifications: %s", e)
             return []
 
     def _extract_content(self, response: Any) -> Union[str, Dict, None]:
@@ -84,9 +87,9 @@ class NotificationCreator:
                 # Return as string if not JSON
                 return content
 
-            print(f"⚠️ Unexpected response type: {type(response)}")
+            logger.warning("⚠️ Unexpected response type: %s", type(response))
             return str(response)
 
         except Exception as e:
-            print(f"❌ Error extracting content: {e}")
+            logger.error("❌ Error extracting content: %s", e)
             return str(response)  # Return as string as fallback
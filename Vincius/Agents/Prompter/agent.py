@@ -2,6 +2,9 @@ from typing import Dict, Any
 from Vincius.Core.brain_model import BrainModel
 from Vincius.Agents.base_agent import BaseAgent
 from Vincius.Core.file_system_manager import FileSystemManager
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class PrompterAgent(BaseAgent):
     """
@@ -14,7 +17,7 @@ class PrompterAgent(BaseAgent):
         self.config = config
         self.brain = BrainModel()
         self.fs_manager = FileSystemManager(agent=self)
-        print(f"🔧 Initialized {self.name} agent with UUID: {self.uuid[:8]}")
+        logger.info("🔧 Initialized %s agent with UUID: %s", self.name, self.uuid[:8])
 
     def execute(self, input_data: Any = None) -> str:
         """
@@ -29,15 +32,15 @@ class PrompterAgent(BaseAgent):
             if input_data:
                 prompt = prompt.format(input_data)
 
-            print("\n📝 Executing prompt...")
+            logger.info("\n📝 Executing prompt...")
             output = self.brain.generate(prompt, self.config)
 
             if not output:
                 raise ValueError("No output generated from prompt.")
 
-            print(f"✅ Prompt executed successfully.")
+            logger.info("✅ Prompt executed successfully.")
             return output
 
         except Exception as e:
-            print(f"\n❌ Error executing prompt: {e}")
+            logger.error("\n❌ Error executing prompt: %s", e)
             return f"Error executing prompt: {str(e)}"
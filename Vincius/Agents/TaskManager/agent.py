@@ -1,11 +1,13 @@
 from typing import Dict, Any
-import logging
 import traceback
 from pathlib import Path
 from Vincius.Core.brain_model import BrainModel
 from Vincius.Core.file_system_manager import FileSystemManager
 from Vincius.Agents.base_agent import BaseAgent
 from Vincius.Agents.TaskManager.task_creator import TaskCreator
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class TaskManagerAgent(BaseAgent):
     def __init__(self, config: Dict[str, Any]):
@@ -16,7 +18,7 @@ class TaskManagerAgent(BaseAgent):
 
     def execute(self, input_data: Any = None) -> str:
         try:
-            print("\n📋 Starting task breakdown...")
+            logger.info("\n📋 Starting task breakdown...")
             
             if not input_data:
                 return "Error: No analysis result provided"
@@ -31,9 +33,9 @@ class TaskManagerAgent(BaseAgent):
             if not tasks:
                 return "Error: Failed to create tasks"
 
-            print("✅ Tasks created successfully")
+            logger.info("✅ Tasks created successfully")
             return tasks
             
         except Exception as e:
-            print(f"\n❌ Error in task creation process: {e}")
+            logger.error("\n❌ Error in task creation process: %s", e)
             return f"Error executing agent: {str(e)}"
@@ -6,47 +6,77 @@ from Vincius.Agents.base_agent import BaseAgent
 from Vincius.Agents.Testing.test_generator import TestGenerator
 from Vincius.Agents.Testing.test_runner import TestRunner
 from Vincius.Agents.Testing.prompts import TestingPrompts
+from Vincius.Agents.Testing.test_impact import TestImpactMap
+from Vincius.Agents.Testing.file_classifier import TestCandidateClassifier, normalize_path, parse_selected_files
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class TesterAgent(BaseAgent):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.brain = BrainModel()
         self.test_generator = TestGenerator()
-        self.test_runner = TestRunner()
         self.fs_manager = FileSystemManager()
+        self.test_runner = TestRunner(self.fs_manager.base_dir)
+        self.impact_map = TestImpactMap(self.fs_manager)
+        self.classifier = TestCandidateClassifier(**config.get('test_selection', {}))
 
-    def execute(self, input_data: Any = None) -> str:
+    def execute(self, input_data: Any = None) -> Any:
         try:
-            print("\n🧪 Starting test analysis and generation...")
+            logger.info("\n🧪 Starting test analysis and generation...")
             
             # 1. Analyze technical documentation
             docs = self._read_technical_docs()
             if not docs:
-                print("⚠️ No technical documentation found, proceeding with file analysis only")
+                logger.warning("⚠️ No technical documentation found, proceeding with file analysis only")
             
             # 2. Find all implementation files
             implementation_files = self._find_implementation_files()
             if not implementation_files:
                 return "❌ No implementation files found to test"
             
-            print(f"\n📁 Found {len(implementation_files)} files to analyze for testing")
+            logger.info("\n📁 Found %s files to analyze for testing", len(implementation_files))
             
-            # 3. Generate and create tests
-            test_files = self.test_generator.generate_tests(
-                implementation_files=implementation_files,
+            # 3. Regenerate tests only for sources changed since their tests were made
+            affected = self.impact_map.affected_sources(implementation_files)
+            unchanged = [f for f in implementation_files if f not in affected]
+            logger.info("🎯 %s changed files need new tests, %s are up to date", len(affected), len(unchanged))
+
+            tests_by_source = self.test_generator.generate_tests_by_source(
+                implementation_files=affected,
                 technical_docs=docs,
                 brain=self.brain,
                 config=self.config
-            )
-            
-            if not test_files:
+            ) if affected else {}
+
+            for source, tests in tests_by_source.items():
+                self.impact_map.record(source, tests)
+            self.impact_map.save()
+
+            test_files = [test for tests in tests_by_source.values() for test in tests]
+            if not test_files and affected:
                 return "❌ Failed to generate tests"
             
-            print(f"\n✅ Generated {len(test_files)} test files")
-            return f"Successfully created {len(test_files)} test files"
+            logger.info("\n✅ Generated %s test files", len(test_files))
+            if not self.config.get('run_tests', True):
+                return f"Successfully created {len(test_files)} test files"
+
+            # Rerun only tests for changed sources unless a full run is requested
+            run_sources = implementation_files if self.config.get('run_all_tests', False) else affected
+            tests_to_run = sorted({
+                test
+                for source in run_sources
+                for test in tests_by_source.get(source) or self.impact_map.tests_for(source)
+            })
+
+            # 4. Execute the generated tests and hand the report to the workflow
+            report = self.test_runner.run_tests(tests_to_run, self.config)
+            report["generated_files"] = [str(f) for f in test_files]
+            return report
             
         except Exception as e:
-            print(f"\n❌ Error in testing process: {e}")
+            logger.error("\n❌ Error in testing process: %s", e)
             return f"Error executing agent: {str(e)}"
 
     def _read_technical_docs(self) -> Dict[str, str]:
@@ -63,61 +93,72 @@ class TesterAgent(BaseAgent):
                     docs[file.name] = content
 
             if docs:
-                print(f"\n📚 Found {len(docs)} technical documentation files")
+                logger.info("\n📚 Found %s technical documentation files", len(docs))
             
             return docs
         except Exception as e:
-            print(f"⚠️ Error reading documentation: {e}")
+            logger.warning("⚠️ Error reading documentation: %s", e)
             return {}
 
     def _find_implementation_files(self) -> List[Path]:
-        """Find all files that need tests using AI analysis"""
+        """Find all files that need tests using local filtering, then AI analysis"""
         try:
-            # Get all files recursively (excluding hidden and special directories)
+            # Look up all indexed files (ignored and special directories are skipped)
+            base_dir = self.fs_manager.base_dir
+            sizes = {
+                entry.path.relative_to(base_dir): entry.size
+                for entry in self.fs_manager.file_index.entries(base_dir)
+            }
             all_files = [
-                f.relative_to(self.fs_manager.code_dir) 
-                for f in self.fs_manager.code_dir.rglob('*')
-                if f.is_file() and not any(part.startswith(('.', '__')) for part in f.parts)
+                f for f in sizes
+                if not any(part.startswith(('.', '__')) for part in f.parts)
             ]
             
             if not all_files:
                 return []
 
-            # Ask model which files need tests
-            files_content = "\n".join(f"- {f}" for f in sorted(all_files))
+            # Prune obvious non-candidates before spending prompt tokens on them
+            tracked = set(self.impact_map.tracked_sources())
+            candidates, pruned = self.classifier.classify(all_files, sizes, tracked)
+            logger.info("🔎 Local pre-filter kept %s of %s files", len(candidates), len(all_files))
+            for file, reason in sorted(pruned.items()):
+                logger.info("   ⏭️ %s: %s", file, reason)
+
+            # Sources with generated tests were already selected on an earlier run
+            known = [f for f in candidates if f in tracked]
+            candidates = [f for f in candidates if f not in tracked]
+            if not candidates:
+                return known
+
+            # Ask model which of the remaining files need tests
+            files_content = "\n".join(f"- {f}" for f in candidates)
             prompt = TestingPrompts.analyze_files_for_testing(files_content)
             
             response = self.brain.generate(prompt, self.config)
             if not response:
-                return []
+                return known
+
+            # Parse response once into a set of paths for O(1) membership checks
+            selected = parse_selected_files(response)
+            by_name = {}
+            for file in candidates:
+                by_name.setdefault(file.name, []).append(file)
 
-            # Parse response to get files that need testing
             files_to_test = []
-            for file in all_files:
-                file_str = str(file)
-                if file_str in response:
-                    # Get the reason if provided
-                    reason = self._extract_reason(response, file_str)
-                    if reason:
-                        print(f"✅ File needs tests: {file_str}")
-                        print(f"   Reason: {reason}")
-                    files_to_test.append(file)
-
-            return sorted(files_to_test)
+            for file in candidates:
+                key = normalize_path(str(file))
+                if key not in selected and len(by_name[file.name]) == 1:
+                    key = file.name  # Model answered with a unique bare file name
+                if key not in selected:
+                    continue
+
+                logger.info("✅ File needs tests: %s", file)
+                if selected[key]:
+                    logger.info("   Reason: %s", selected[key])
+                files_to_test.append(file)
+
+            return sorted(files_to_test + known)
             
         except Exception as e:
-            print(f"⚠️ Error finding implementation files: {e}")
+            logger.warning("⚠️ Error finding implementation files: %s", e)
             return []
-
-    def _extract_reason(self, response: str, file_path: str) -> Optional[str]:
-        """Extract reason why file needs tests from model response"""
-        try:
-            lines = response.split('\n')
-            for i, line in enumerate(lines):
-                if file_path in line:
-                    # Try to get the next line as reason if it starts with a reason indicator
-                    if i + 1 < len(lines) and any(lines[i + 1].strip().startswith(x) for x in ['- ', '• ', '* ', 'Reason:']):
-                        return lines[i + 1].strip().lstrip('- •*').replace('Reason:', '').strip()
-            return None
-        except Exception:
-            return None
@@ -0,0 +1,150 @@
+import re
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+class Classification(NamedTuple):
+    candidates: List[Path]
+    pruned: Dict[Path, str]
+
+class TestCandidateClassifier:
+    """Cheap local filter that drops files which obviously need no generated tests"""
+
+    SOURCE_EXTENSIONS = {
+        '.py', '.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs', '.vue', '.svelte',
+        '.java', '.kt', '.go', '.rb', '.php', '.cs', '.c', '.cpp', '.h', '.hpp',
+        '.rs', '.swift', '.scala'
+    }
+    TEST_DIRECTORIES = {'test', 'tests', '__tests__', 'spec', 'specs'}
+    SKIP_DIRECTORIES = {'migrations', 'dist', 'build', 'vendor', 'coverage', 'fixtures', 'mocks'}
+    TEST_FILE_PATTERNS = [
+        re.compile(r'^test_.+'),
+        re.compile(r'.+_test\.[^.]+$'),
+        re.compile(r'.+\.(test|spec)\.[^.]+$'),
+        re.compile(r'.+Tests?\.(java|kt|cs|swift|scala)$'),
+        re.compile(r'^conftest\.py$')
+    ]
+    CONFIG_FILE_PATTERNS = [
+        re.compile(r'.+\.config\.[^.]+$'),
+        re.compile(r'.+\.min\.js$'),
+        re.compile(r'^(setup|manage|wsgi|asgi|__init__)\.py$'),
+        re.compile(r'^(index)\.d\.ts$')
+    ]
+
+    def __init__(self, min_size: int = 64, max_size: int = 200_000, skip_directories: Iterable[str] = ()):
+        self.min_size = min_size
+        self.max_size = max_size
+        # Project-specific directories to leave out, added to the built-in ones
+        self.skip_directories = self.SKIP_DIRECTORIES | {name.lower() for name in skip_directories}
+
+    def classify(self, files: Iterable[Path], sizes: Optional[Dict[Path, int]] = None,
+                 tracked: Iterable[Path] = ()) -> Classification:
+        """Split relative file paths into test candidates and pruned files with reasons.
+
+        Tracked files already have generated tests whose freshness is checked elsewhere,
+        so they are exempt from the "already has tests" rule.
+        """
+        files = list(files)
+        sizes = sizes or {}
+        tracked = set(tracked)
+        tested = self._tested_sources(files)
+
+        candidates, pruned = [], {}
+        for file in files:
+            reason = self._prune_reason(file, sizes.get(file), set() if file in tracked else tested)
+            if reason:
+                pruned[file] = reason
+            else:
+                candidates.append(file)
+
+        return Classification(sorted(candidates), pruned)
+
+    def _prune_reason(self, file: Path, size: Optional[int], tested: Set[Tuple[str, str]]) -> Optional[str]:
+        name = file.name
+        parts = {part.lower() for part in file.parts[:-1]}
+
+        if file.suffix.lower() not in self.SOURCE_EXTENSIONS:
+            return "not a source file"
+        if parts & self.TEST_DIRECTORIES or self._is_test_file(name):
+            return "is a test file"
+        if parts & self.skip_directories:
+            return "generated, vendored or fixture path"
+        if any(pattern.match(name) for pattern in self.CONFIG_FILE_PATTERNS):
+            return "configuration or entry-point boilerplate"
+        if size is not None and size < self.min_size:
+            return f"too small ({size} bytes)"
+        if size is not None and size > self.max_size:
+            return f"too large to be hand-written ({size} bytes)"
+        if self._source_keys(file) & tested:
+            return "already has tests"
+        return None
+
+    def _is_test_file(self, name: str) -> bool:
+        return any(pattern.match(name) for pattern in self.TEST_FILE_PATTERNS)
+
+    def _tested_sources(self, files: List[Path]) -> Set[Tuple[str, str]]:
+        """Collect (directory, stem) of sources that already have a matching test file.
+
+        A test covers the source of its stem next to it, or in the directory its
+        test folders mirror (tests/pkg/test_mod.py covers pkg/mod.py).
+        """
+        tested = set()
+        for file in files:
+            name = file.name
+            if not self._is_test_file(name):
+                continue
+            stem = re.sub(r'^test_|_test$|\.(test|spec)$|Tests?$', '', self._stem(name))
+            parent = PurePosixPath(*file.parts[:-1])
+            mirrored = PurePosixPath(*[part for part in file.parts[:-1] if part.lower() not in self.TEST_DIRECTORIES])
+            tested.update({(str(parent), stem), (str(mirrored), stem)})
+        return tested
+
+    def _source_keys(self, file: Path) -> Set[Tuple[str, str]]:
+        """Keys a test for this source would be recorded under; src/ layouts mirror without src"""
+        parts = file.parts[:-1]
+        keys = {(str(PurePosixPath(*parts)), self._stem(file.name))}
+        if parts and parts[0] == 'src':
+            keys.add((str(PurePosixPath(*parts[1:])), self._stem(file.name)))
+        return keys
+
+    @staticmethod
+    def _stem(name: str) -> str:
+        return name.split('.', 1)[0] if not name.startswith('.') else name
+
+PATH_PATTERN = re.compile(r'[\w@~./\\-]*\w\.[A-Za-z0-9]+')
+# Between the paths a line lists and the reason that follows them: "a.py, b.py: reason"
+REASON_SEPARATOR = re.compile(r':\s|\s[-–—]\s')
+
+def normalize_path(path: str) -> str:
+    """Normalise a model-written path so it can be compared with indexed paths"""
+    path = path.strip().strip('`"\'[]()*,:').replace('\\', '/')
+    while path.startswith('./'):
+        path = path[2:]
+    return str(PurePosixPath(path)) if path else path
+
+def parse_selected_files(response: str) -> Dict[str, Optional[str]]:
+    """Parse a model reply into {normalised path: reason} in one pass over its lines"""
+    selected: Dict[str, Optional[str]] = {}
+    last_paths: List[str] = []
+
+    for line in response.splitlines():
+        stripped = line.strip().lstrip('-•*>').strip()
+        if not stripped:
+            continue
+
+        if stripped.lower().startswith('reason:'):
+            for path in last_paths:
+                if not selected.get(path):
+                    selected[path] = stripped[len('reason:'):].strip()
+            continue
+
+        listed, *rest = REASON_SEPARATOR.split(stripped, 1)
+        paths = [normalize_path(path) for path in PATH_PATTERN.findall(listed)]
+        if not paths:
+            continue
+
+        inline_reason = rest[0].strip().lstrip(':-–—`]* ').strip() if rest else ""
+        for path in paths:
+            selected.setdefault(path, inline_reason or None)
+        last_paths = paths
+
+    return selected
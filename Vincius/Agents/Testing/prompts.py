@@ -2,12 +2,19 @@ from typing import Dict, List
 
 class TestingPrompts:
     @staticmethod
-    def analyze_for_tests(file_name: str, content: str, test_types: List[str]) -> str:
+    def analyze_for_tests(file_name: str, content: str, test_types: List[str], part: str = "", context: str = "") -> str:
+        part_text = f"""
+This is {part} of the file. Only write tests for the code in this part.
+Definitions from other parts exist and can be imported normally.
+File header for context (do not test it separately):
+{context}
+""" if part else ""
         return f"""
 You are a senior test engineer. Analyze this file and determine appropriate test cases.
 Consider implementing these test types: {', '.join(test_types)}
 
 File: {file_name}
+{part_text}
 Content:
 {content}
 
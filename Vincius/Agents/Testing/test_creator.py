@@ -3,6 +3,9 @@ from pathlib import Path
 import yaml
 from ...Core.file_system_manager import FileSystemManager
 from .prompts import TestingPrompts
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class TestCreator:
     def __init__(self):
@@ -38,12 +41,12 @@ class TestCreator:
                         created_files.append(path)
                         
             except yaml.YAMLError as e:
-                print(f"❌ Error parsing test implementation: {e}")
+                logger.error("❌ Error parsing test implementation: %s", e)
                 
             return created_files
             
         except Exception as e:
-            print(f"❌ Error creating tests: {e}")
+            logger.error("❌ Error creating tests: %s", e)
             return []
 
     def _extract_yaml(self, text: str) -> Optional[str]:
@@ -80,5 +83,5 @@ class TestCreator:
             return "\n".join(lines)
             
         except Exception as e:
-            print(f"❌ Error extracting YAML: {e}")
+            logger.error("❌ Error extracting YAML: %s", e)
             return None
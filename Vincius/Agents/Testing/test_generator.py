@@ -1,8 +1,12 @@
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from Vincius.Core.file_system_manager import FileSystemManager
-from Core.content_parser import ContentParser
+from Vincius.Core.content_parser import ContentParser
+from Vincius.Core.prompt_budget import ChunkPlanner, chunk_budget, run_concurrently
 from .prompts import TestingPrompts
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class TestGenerator:
     def __init__(self):
@@ -15,10 +19,19 @@ class TestGenerator:
                       brain: Any, 
                       config: Dict) -> List[Path]:
         """Generate test files based on implementation and documentation"""
-        generated_files = []
+        tests_by_source = self.generate_tests_by_source(implementation_files, technical_docs, brain, config)
+        return [path for paths in tests_by_source.values() for path in paths]
+
+    def generate_tests_by_source(self, 
+                                 implementation_files: List[Path], 
+                                 technical_docs: Dict[str, str],
+                                 brain: Any, 
+                                 config: Dict) -> Dict[Path, List[Path]]:
+        """Generate test files and return them grouped by the source file they cover"""
+        tests_by_source = {}
         
         for file_path in implementation_files:
-            print(f"\n🔍 Analyzing {file_path} for test generation")
+            logger.info("\n🔍 Analyzing %s for test generation", file_path)
             
             # Get file content
             content = self.fs_manager.get_file_content(file_path)
@@ -28,30 +41,52 @@ class TestGenerator:
             # Determine appropriate test types
             test_types = self._determine_test_types(file_path, content, technical_docs)
             
-            # Generate test analysis
-            analysis_prompt = TestingPrompts.analyze_for_tests(
-                str(file_path),
-                content,
-                test_types
-            )
-            analysis_result = brain.generate(analysis_prompt, config)
+            # Generate test analysis, split into parts when the file exceeds the prompt budget
+            test_files = self._generate_test_sections(file_path, content, test_types, brain, config)
             
-            if analysis_result:
-                # Parse FILE: sections from response
-                test_files = self.content_parser.parse_files_section(analysis_result)
-                
-                # Create test files
-                for file_info in test_files:
-                    if path := self.fs_manager.create_or_update_file(file_info):
-                        generated_files.append(path)
-                        print(f"✅ Created test file: {path}")
+            # Create test files
+            generated_files = []
+            for file_info in test_files:
+                if path := self.fs_manager.create_or_update_file(file_info):
+                    generated_files.append(path)
+                    logger.info("✅ Created test file: %s", path)
+            if generated_files:
+                tests_by_source[file_path] = generated_files
             
-        return generated_files
+        return tests_by_source
+
+    def _generate_test_sections(self, file_path: Path, content: str, test_types: List[str],
+                                brain: Any, config: Dict) -> List[Dict]:
+        """Get FILE: sections with tests for a file, chunking it if it is too large"""
+        # Test output does not echo the source back, so only the prompt bounds a chunk
+        planner = ChunkPlanner(chunk_budget(config, output_bound=False))
+        if not planner.needs_chunking(content):
+            analysis_prompt = TestingPrompts.analyze_for_tests(str(file_path), content, test_types)
+            analysis_result = brain.generate(analysis_prompt, config)
+            return self.content_parser.parse_files_section(analysis_result) if analysis_result else []
+
+        chunks = planner.plan(str(file_path), content)
+        header = planner.header(str(file_path), content)
+        logger.info("✂️ %s exceeds the prompt budget, analyzing %s parts concurrently", file_path, len(chunks))
+
+        def analyze_chunk(chunk):
+            prompt = TestingPrompts.analyze_for_tests(
+                str(file_path),
+                chunk.content,
+                test_types,
+                part=chunk.describe(),
+                context=header if chunk.index else ""
+            )
+            result = brain.generate(prompt, config)
+            return self.content_parser.parse_files_section(result) if result else []
+
+        sections = run_concurrently(analyze_chunk, chunks, config.get('chunk_workers', 4))
+        return self.content_parser.merge_file_sections(sections)
 
     def analyze_file(self, file_path: Path, brain: Any, config: Dict) -> Optional[Dict]:
         """Analyze a file and determine which tests should be created"""
         try:
-            print(f"\n🔍 Analyzing {file_path.name} for test creation")
+            logger.info("\n🔍 Analyzing %s for test creation", file_path.name)
             
             content = self.fs_manager.get_file_content(file_path)
             if not content:
@@ -77,11 +112,11 @@ class TestGenerator:
             if test_files:
                 return {"test_files": test_files}
             
-            print(f"⚠️ No tests needed for {file_path.name}")
+            logger.warning("⚠️ No tests needed for %s", file_path.name)
             return None
             
         except Exception as e:
-            print(f"❌ Error analyzing {file_path.name}: {e}")
+            logger.error("❌ Error analyzing %s: %s", file_path.name, e)
             return None
 
     def _determine_test_types(self, 
@@ -120,7 +155,7 @@ class TestGenerator:
                     
             return created_files
         except Exception as e:
-            print(f"❌ Error creating test files: {e}")
+            logger.error("❌ Error creating test files: %s", e)
             return []
 
     def _parse_implementation(self, implementation: str) -> List[Dict]:
@@ -142,13 +177,13 @@ class TestGenerator:
             result = brain.generate(prompt, config)
             
             if not result:
-                print("❌ No test implementation generated")
+                logger.error("❌ No test implementation generated")
                 return []
 
             # Parse FILE: sections using ContentParser
             files_info = self.content_parser.parse_files_section(result)
             if not files_info:
-                print("❌ No valid test files found in response")
+                logger.error("❌ No valid test files found in response")
                 return []
             
             # Process each test file
@@ -156,12 +191,12 @@ class TestGenerator:
                 # Create the test file
                 if path := self.fs_manager.create_or_update_file(file_info):
                     created_files.append(path)
-                    print(f"✅ Created test file: {path}")
+                    logger.info("✅ Created test file: %s", path)
                 else:
-                    print(f"❌ Failed to create test file: {file_info.get('path', 'unknown')}")
+                    logger.error("❌ Failed to create test file: %s", file_info.get('path', 'unknown'))
                     
             return created_files
             
         except Exception as e:
-            print(f"❌ Error creating tests: {e}")
+            logger.error("❌ Error creating tests: %s", e)
             return []
@@ -0,0 +1,89 @@
+import os
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set
+from Vincius.Core.config_manager import ConfigManager
+from Vincius.Core import run_context
+from Vincius.Core.logger_base import LoggerBase
+
+class TestImpactMap:
+    """Persistent map from source files to the tests generated from them.
+
+    Combined with the agents' file change logs it tells which sources changed since
+    their tests were generated, so only those tests are regenerated and rerun.
+    """
+
+    _save_lock = threading.Lock()
+
+    def __init__(self, fs_manager: Any, map_path: Optional[Path] = None):
+        config = ConfigManager()
+        self.fs_manager = fs_manager
+        self.base_dir = Path(fs_manager.base_dir)
+        self.logs_root = run_context.workspace_path() / config.get('PATHS', {}).get('logs_dir', 'Logs')
+        self.map_path = map_path or run_context.state_path() / 'test_impact_map.json'
+        self._map: Dict[str, Dict[str, Any]] = self._load()
+        self._recorded: Set[str] = set()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            return json.loads(self.map_path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self) -> None:
+        """Merge this map's new records into the saved map and write it atomically"""
+        with self._save_lock:
+            merged = self._load()
+            merged.update({source: self._map[source] for source in self._recorded})
+            self.map_path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.map_path.with_suffix(f'.{os.getpid()}.tmp')
+            temp.write_text(json.dumps(merged, indent=2), encoding='utf-8')
+            temp.replace(self.map_path)
+            self._map = merged
+            self._recorded.clear()
+
+    def tracked_sources(self) -> List[Path]:
+        """Get every source file that has recorded tests"""
+        return [Path(source) for source, record in self._map.items() if record.get("tests")]
+
+    def tests_for(self, source: Path) -> List[Path]:
+        """Get the recorded test files for a source file"""
+        record = self._map.get(str(source), {})
+        return [Path(test) for test in record.get("tests", [])]
+
+    def record(self, source: Path, tests: List[Path]) -> None:
+        """Remember which tests were generated from a source at its current content"""
+        self._map[str(source)] = {
+            "source_hash": self.fs_manager.get_file_hash(source),
+            "tests": [str(test) for test in tests],
+            "generated_at": datetime.now().isoformat()
+        }
+        self._recorded.add(str(source))
+
+    def affected_sources(self, sources: List[Path]) -> List[Path]:
+        """Get the sources whose tests are missing or older than their latest change"""
+        latest = LoggerBase.collect_latest_entries(self.logs_root)
+        affected = []
+
+        for source in sources:
+            record = self._map.get(str(source))
+            if not record or not record.get("tests"):
+                affected.append(source)
+                continue
+
+            if not all(Path(test).exists() for test in record["tests"]):
+                affected.append(source)
+                continue
+
+            # The change log only rules sources out; an edit reverted since (A -> B -> A)
+            # is logged but leaves the content, and so the tests, as they were
+            entry = latest.get(str(self.base_dir / source))
+            if (entry and entry.get("content_hash") == record.get("source_hash")
+                    and entry.get("timestamp", "") <= record.get("generated_at", "")):
+                continue
+            if self.fs_manager.get_file_hash(source) != record.get("source_hash"):
+                affected.append(source)
+
+        return affected
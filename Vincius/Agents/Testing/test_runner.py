@@ -1,7 +1,276 @@
-from typing import Dict, Any, List
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+import importlib.util
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Any, List, Optional
+from Vincius.Core.config_manager import ConfigManager
+from Vincius.Core import run_context
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+# The only environment generated tests see; API keys and other credentials are never passed on
+ENV_ALLOWLIST = (
+    'PATH', 'HOME', 'USER', 'LANG', 'LANGUAGE', 'LC_ALL', 'LC_CTYPE', 'TZ', 'TERM',
+    'TMPDIR', 'TEMP', 'TMP', 'SYSTEMROOT', 'COMSPEC', 'PATHEXT',
+    'PYTHONPATH', 'PYTHONIOENCODING', 'VIRTUAL_ENV', 'NODE_PATH',
+)
+
+# Runs one unittest file and writes per-test results as JSON; used when pytest is missing
+UNITTEST_RUNNER = r'''
+import json, sys, time, unittest, traceback
+from pathlib import Path
+
+class TimedResult(unittest.TestResult):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+    def startTest(self, test):
+        self._started = time.perf_counter()
+        super().startTest(test)
+    def _record(self, test, status, message=""):
+        test_id = test.id()
+        classname, _, name = test_id.rpartition(".")
+        self.records.append({"name": name, "classname": classname, "status": status,
+                             "duration": time.perf_counter() - self._started, "message": message})
+    def addSuccess(self, test):
+        super().addSuccess(test); self._record(test, "passed")
+    def addFailure(self, test, err):
+        super().addFailure(test, err); self._record(test, "failed", self.failures[-1][1])
+    def addError(self, test, err):
+        super().addError(test, err); self._record(test, "error", self.errors[-1][1])
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason); self._record(test, "skipped", reason)
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err); self._record(test, "passed")
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test); self._record(test, "failed", "unexpected success")
+
+test_file, output = Path(sys.argv[1]), sys.argv[2]
+sys.path.insert(0, str(test_file.parent))
+result = TimedResult()
+try:
+    suite = unittest.defaultTestLoader.discover(str(test_file.parent), pattern=test_file.name)
+    suite.run(result)
+except Exception:
+    result.records.append({"name": test_file.stem, "classname": "", "status": "error",
+                           "duration": 0.0, "message": traceback.format_exc()})
+Path(output).write_text(json.dumps(result.records))
+'''
 
 class TestRunner:
+    """Runs generated tests in subprocesses spread over the available CPU cores"""
+
+    PYTHON_SUFFIXES = {'.py'}
+    JS_SUFFIXES = {'.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs'}
+
+    def __init__(self, base_dir: Optional[Path] = None):
+        self.base_dir = Path(base_dir) if base_dir else None
+
     def run_tests(self, test_files: List[Path], config: Dict) -> Dict[str, Any]:
-        """Execute the generated tests"""
-        pass
+        """Execute the generated tests and return a structured report"""
+        started = time.perf_counter()
+        timeout = config.get('test_timeout', 120)
+        workers = max(1, min(config.get('test_workers') or os.cpu_count() or 1, len(test_files) or 1))
+
+        # Longest files first so the slowest shards start early
+        ordered = sorted(
+            (Path(f) for f in test_files if Path(f).exists()),
+            key=lambda f: f.stat().st_size,
+            reverse=True
+        )
+        logger.info("\n🧪 Running %s test files on %s workers (timeout %ss per file)", len(ordered), workers, timeout)
+
+        with tempfile.TemporaryDirectory(prefix="vincius-tests-") as work_dir:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(
+                    lambda item: self._run_file(item[1], Path(work_dir) / str(item[0]), timeout),
+                    enumerate(ordered)
+                ))
+
+        tests = [test for file_results in results for test in file_results]
+        report = self._summarize(tests, workers, time.perf_counter() - started)
+        report["report_path"] = str(self._write_junit(tests, report))
+        logger.info("📊 Tests: %s passed, %s failed, %s errors, %s skipped in %.2fs",
+                    report['passed'], report['failed'], report['errors'], report['skipped'], report['duration'])
+        return report
+
+    def detect_framework(self, test_file: Path) -> Optional[str]:
+        """Detect which runner can execute a test file on this machine"""
+        suffix = test_file.suffix.lower()
+        if suffix in self.PYTHON_SUFFIXES:
+            if importlib.util.find_spec('pytest'):
+                return 'pytest'
+            return 'unittest'
+        if suffix in self.JS_SUFFIXES and self._local_bin(test_file, 'jest'):
+            return 'jest'
+        return None
+
+    def _local_bin(self, test_file: Path, name: str) -> Optional[Path]:
+        """Find a locally installed node binary; never download one"""
+        for directory in [test_file.parent, *test_file.parents]:
+            candidate = directory / 'node_modules' / '.bin' / name
+            if candidate.exists():
+                return candidate
+            if self.base_dir and directory == self.base_dir:
+                break
+        return None
+
+    def _run_file(self, test_file: Path, work_dir: Path, timeout: int) -> List[Dict[str, Any]]:
+        work_dir.mkdir(parents=True, exist_ok=True)
+        framework = self.detect_framework(test_file)
+        if not framework:
+            return [self._file_result(test_file, 'skipped', 0.0, "No local runner available for this file type")]
+
+        command, output = self._build_command(framework, test_file, work_dir, timeout)
+        cwd = self.base_dir or test_file.parent
+        env = {name: os.environ[name] for name in ENV_ALLOWLIST if name in os.environ}
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(cwd), os.environ.get("PYTHONPATH")]))
+
+        started = time.perf_counter()
+        try:
+            completed = subprocess.run(
+                command, cwd=cwd, env=env, capture_output=True, text=True, timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            return [self._file_result(test_file, 'error', timeout, f"Timed out after {timeout}s")]
+        except OSError as e:
+            return [self._file_result(test_file, 'error', 0.0, f"Failed to start {framework}: {e}")]
+        duration = time.perf_counter() - started
+
+        parser = getattr(self, f"_parse_{framework}")
+        tests = parser(output) if output.exists() else []
+        if not tests:
+            message = (completed.stdout + completed.stderr)[-2000:]
+            # A clean exit without results means nothing was collected (pytest exits 5 for that)
+            if completed.returncode == 0 or (framework == 'pytest' and completed.returncode == 5):
+                return [self._file_result(test_file, 'skipped', duration, f"No tests collected\n{message}".strip())]
+            return [self._file_result(test_file, 'error', duration, message)]
+
+        for test in tests:
+            test["file"] = str(test_file)
+            test["framework"] = framework
+        return tests
+
+    def _build_command(self, framework: str, test_file: Path, work_dir: Path, timeout: int) -> tuple:
+        if framework == 'pytest':
+            output = work_dir / 'junit.xml'
+            command = [sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider',
+                       f'--junitxml={output}', str(test_file)]
+            if importlib.util.find_spec('pytest_timeout'):
+                command.append(f'--timeout={timeout}')
+            return command, output
+        if framework == 'unittest':
+            output = work_dir / 'results.json'
+            return [sys.executable, '-c', UNITTEST_RUNNER, str(test_file), str(output)], output
+        output = work_dir / 'jest.json'
+        return [str(self._local_bin(test_file, 'jest')), '--ci', '--json',
+                f'--outputFile={output}', str(test_file)], output
+
+    def _parse_pytest(self, output: Path) -> List[Dict[str, Any]]:
+        tests = []
+        for case in ET.parse(output).getroot().iter('testcase'):
+            status, message = 'passed', ""
+            for tag, outcome in (('failure', 'failed'), ('error', 'error'), ('skipped', 'skipped')):
+                element = case.find(tag)
+                if element is not None:
+                    status = outcome
+                    message = element.get('message') or element.text or ""
+                    break
+            tests.append({
+                "name": case.get('name', ''),
+                "classname": case.get('classname', ''),
+                "status": status,
+                "duration": float(case.get('time') or 0.0),
+                "message": message
+            })
+        return tests
+
+    def _parse_unittest(self, output: Path) -> List[Dict[str, Any]]:
+        return json.loads(output.read_text(encoding='utf-8'))
+
+    def _parse_jest(self, output: Path) -> List[Dict[str, Any]]:
+        statuses = {'passed': 'passed', 'failed': 'failed', 'pending': 'skipped', 'skipped': 'skipped', 'todo': 'skipped'}
+        tests = []
+        for suite in json.loads(output.read_text(encoding='utf-8')).get('testResults', []):
+            for assertion in suite.get('assertionResults', []):
+                tests.append({
+                    "name": assertion.get('title', ''),
+                    "classname": " ".join(assertion.get('ancestorTitles', [])),
+                    "status": statuses.get(assertion.get('status'), 'error'),
+                    "duration": (assertion.get('duration') or 0) / 1000,
+                    "message": "\n".join(assertion.get('failureMessages', []))
+                })
+        return tests
+
+    def _file_result(self, test_file: Path, status: str, duration: float, message: str) -> Dict[str, Any]:
+        return {
+            "name": test_file.name,
+            "classname": "",
+            "file": str(test_file),
+            "framework": self.detect_framework(test_file),
+            "status": status,
+            "duration": duration,
+            "message": message
+        }
+
+    def _summarize(self, tests: List[Dict[str, Any]], workers: int, duration: float) -> Dict[str, Any]:
+        counts = {status: sum(1 for t in tests if t["status"] == status)
+                  for status in ('passed', 'failed', 'error', 'skipped')}
+        return {
+            "total": len(tests),
+            "passed": counts['passed'],
+            "failed": counts['failed'],
+            "errors": counts['error'],
+            "skipped": counts['skipped'],
+            "success": counts['failed'] == 0 and counts['error'] == 0,
+            "workers": workers,
+            "duration": duration,
+            "tests": tests
+        }
+
+    def _write_junit(self, tests: List[Dict[str, Any]], report: Dict[str, Any]) -> Path:
+        """Write all results as one JUnit XML document"""
+        root = ET.Element('testsuites', {
+            "tests": str(report["total"]),
+            "failures": str(report["failed"]),
+            "errors": str(report["errors"]),
+            "skipped": str(report["skipped"]),
+            "time": f"{report['duration']:.3f}"
+        })
+
+        suites: Dict[str, ET.Element] = {}
+        for test in tests:
+            suite = suites.get(test["file"])
+            if suite is None:
+                suite = suites[test["file"]] = ET.SubElement(root, 'testsuite', {"name": test["file"]})
+            case = ET.SubElement(suite, 'testcase', {
+                "classname": test["classname"],
+                "name": test["name"],
+                "time": f"{test['duration']:.3f}"
+            })
+            tag = {'failed': 'failure', 'error': 'error', 'skipped': 'skipped'}.get(test["status"])
+            if tag:
+                ET.SubElement(case, tag, {"message": test["message"][:200]}).text = test["message"]
+
+        for suite in suites.values():
+            cases = list(suite)
+            suite.set("tests", str(len(cases)))
+            suite.set("failures", str(sum(1 for c in cases if c.find('failure') is not None)))
+            suite.set("errors", str(sum(1 for c in cases if c.find('error') is not None)))
+            suite.set("time", f"{sum(float(c.get('time')) for c in cases):.3f}")
+
+        # One report per run, so concurrent runs sharing a workspace keep their own
+        logs_dir = ConfigManager().get('PATHS', {}).get('logs_dir', 'Logs')
+        report_dir = run_context.workspace_path() / logs_dir / 'Testing'
+        report_dir.mkdir(parents=True, exist_ok=True)
+        run_id = run_context.current().run_id
+        report_path = report_dir / (f'junit_{run_id}.xml' if run_id else 'junit.xml')
+        ET.ElementTree(root).write(report_path, encoding='utf-8', xml_declaration=True)
+        return report_path
@@ -1,7 +1,10 @@
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-import os
 from Vincius.Core.logger_base import LoggerBase
+from Vincius.Core import run_context
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class AgentLogger(LoggerBase):
     """Universal logger for all agent types"""
@@ -10,12 +13,12 @@ class AgentLogger(LoggerBase):
         # Try to get the UUID from the agent object if provided
         if agent and hasattr(agent, 'uuid'):
             agent_uuid = agent.uuid
-        # Fall back to environment variable if still not set
+        # Fall back to the run context if still not set
         elif agent_uuid is None:
-            agent_uuid = os.environ.get('CURRENT_AGENT_UUID', 'unknown')
+            agent_uuid = run_context.current().agent_uuid or 'unknown'
             
         super().__init__(base_path, agent_type, agent_uuid)
-        print(f"📝 Logger initialized for agent {agent_type} with UUID: {agent_uuid[:8] if agent_uuid else 'unknown'}")
+        logger.info("📝 Logger initialized for agent %s with UUID: %s", agent_type, agent_uuid[:8] if agent_uuid else 'unknown')
         
     def log_file_creation(self, file_path: Path, description: str = "", 
                          is_modification: bool = False, content: str = ""):
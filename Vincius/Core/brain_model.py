@@ -1,12 +1,30 @@
 import os
-import yaml
 import time
-import google.generativeai as genai
+import hashlib
 from typing import Dict, Any, Optional
-from pathlib import Path
 from .config_manager import ConfigManager
+from .metrics import MetricsRecorder, usage_from_response
+from .prompt_budget import estimate_tokens
+from .tracing import span
+from .rate_limiter import AdaptiveLimiter, RateLimiter
+from .semantic_cache import SemanticCache
+from .model_backends import create_backend
+from .model_router import ModelRouter
+from .retry_policy import QUOTA, InvalidResponseError, RetryError, RetryPolicy
+from .single_flight import SingleFlight
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MODEL = 'gemini-2.0-flash'
 
 class BrainModel:
+    """Process-wide model pool shared by all runs.
+
+    Calls go through a backend chosen by MODEL_BACKEND: live Gemini clients, or
+    record/replay/stub for offline and deterministic runs.
+    """
+
     _instance = None
 
     def __new__(cls):
@@ -20,16 +38,60 @@ class BrainModel:
             return
             
         self._initialized = True
-        self.max_retries = 3
-        self.retry_delay = 1
-        self.model = None
         self.config_manager = ConfigManager()
+        self.metrics = MetricsRecorder()
 
-        print("🔄 Initializing Google Generative AI...")
-        genai.configure(api_key=self.config_manager.api_key)
-        
-        self._initialize_model(self.default_model_config)
-        print(f"✅ Model initialized with {self.default_sleep}s default sleep time")
+        pool_config = self.config_manager.get('MODEL_POOL', {}) or {}
+        if pool_config.get('adaptive', True):
+            self.limiter = AdaptiveLimiter(
+                max_concurrent=pool_config.get('max_concurrent', 4),
+                min_concurrent=pool_config.get('min_concurrent', 1),
+                requests_per_minute=pool_config.get('requests_per_minute'),
+                max_requests_per_minute=pool_config.get('max_requests_per_minute'),
+                min_requests_per_minute=pool_config.get('min_requests_per_minute', 4.0),
+                rate_increase=pool_config.get('rate_increase', 1.0),
+                decrease_factor=pool_config.get('decrease_factor', 0.5),
+                latency_factor=pool_config.get('latency_factor', 3.0),
+                state_file=self.config_manager.state_path / pool_config.get('limits_file', 'model_limits.json')
+            )
+        else:
+            self.limiter = RateLimiter(
+                max_concurrent=pool_config.get('max_concurrent', 4),
+                requests_per_minute=pool_config.get('requests_per_minute')
+            )
+        self.coalesce = pool_config.get('coalesce', True)
+        self._in_flight = SingleFlight()
+
+        cache_config = self.config_manager.get('SEMANTIC_CACHE', {}) or {}
+        self.semantic_cache = None
+        if cache_config.get('enabled', True):
+            self.semantic_cache = SemanticCache(
+                threshold=cache_config.get('threshold', 0.9),
+                num_perm=cache_config.get('num_perm', 64),
+                bands=cache_config.get('bands', 16),
+                shingle_size=cache_config.get('shingle_size', 5),
+                max_entries=cache_config.get('max_entries', 500),
+                volatile_patterns=cache_config.get('volatile_patterns')
+            )
+
+        backend_settings = dict(self.config_manager.get('MODEL_BACKEND', {}) or {})
+        if os.environ.get('VINCIUS_MODEL_BACKEND'):
+            backend_settings['mode'] = os.environ['VINCIUS_MODEL_BACKEND']
+        def backend_for(mode: str):
+            return create_backend(
+                {**backend_settings, 'mode': mode},
+                api_key=self.config_manager.api_key,
+                safety_settings=self.config_manager.get('SAFETY_SETTINGS'),
+                state_path=self.config_manager.state_path
+            )
+
+        self.backend = backend_for(backend_settings.get('mode', 'live'))
+        self.router = ModelRouter.from_config(self.config_manager.get('MODEL_ROUTER', {}) or {},
+                                              self.backend, backend_for)
+        default_config = self.default_model_config
+        self.backend.warm_up(default_config.get('model', DEFAULT_MODEL), self._generation_config(default_config))
+        logger.info("✅ Using %s model backend", self.backend.name)
+        logger.info("✅ Model initialized with %ss default sleep time", self.default_sleep)
 
     @property
     def default_sleep(self) -> int:
@@ -66,81 +128,130 @@ class BrainModel:
 
     def generate(self, prompt: str, model_config: Dict[str, Any]) -> Optional[str]:
         """Generate content with improved retry mechanism and rate limiting handling"""
-        # Only update model if configuration changes, don't reconfigure API
-        current_model = getattr(self.model, 'model_name', None)
-        if model_config.get('model') != current_model:
-            print(f"Switching model from {current_model} to {model_config.get('model')}")
-            self._initialize_model(model_config)
-        
-        base_wait_time = 10  # Start with 10 seconds
-        for attempt in range(self.max_retries):
-            try:
-                print(f"\n🤖 Generating content (attempt {attempt + 1}/{self.max_retries})...")
-                
-                # Exponential backoff wait time
-                if attempt > 0:
-                    wait_time = base_wait_time * (2 ** (attempt - 1))  # Exponential backoff
-                    print(f"⏳ Waiting {wait_time} seconds before retry (rate limit backoff)...")
-                    time.sleep(wait_time)
-
-                # Generate response
-                response = self.model.generate_content(prompt)
-                
-                # Validate response
-                if not response or not hasattr(response, 'text'):
-                    raise ValueError("Invalid response format from model")
-                
-                text = response.text
-                if not isinstance(text, str) or not text.strip():
-                    raise ValueError("Empty or invalid response text")
-                
-                print("✅ Content generated successfully")
-                return text
-
-            except Exception as e:
-                error_str = str(e)
-                print(f"⚠️ Generation attempt {attempt + 1} failed: {error_str}")
-                
-                # Handle specific error types
-                if "429" in error_str or "quota" in error_str.lower():
-                    print("📢 Rate limit or quota exceeded. Using longer backoff...")
-                    base_wait_time *= 2  # Double the base wait time for rate limits
-                
-                if attempt == self.max_retries - 1:
-                    print("\n❌ All generation attempts failed")
-                    if "429" in error_str or "quota" in error_str.lower():
-                        print("💡 Suggestion: Wait a few minutes before trying again or check your API quota")
-                    return None
-
-        return None
-
-    def _initialize_model(self, config: Dict[str, Any]) -> None:
-        """Initialize the model with configuration"""
+        with span("BrainModel.generate", "model", model=model_config.get('model'), prompt_chars=len(prompt)) as current:
+            cache_settings = self._cache_settings(model_config)
+            if cache_settings is None:
+                return self._generate_shared(prompt, model_config)
+
+            model_key = self._model_key(model_config)
+            started = time.perf_counter()
+            hit = self.semantic_cache.lookup(prompt, model_key, cache_settings.get('threshold'))
+            if hit:
+                logger.info("♻️ Semantic cache hit (similarity %.2f)", hit.similarity)
+                current.set(cache="hit", similarity=round(hit.similarity, 3))
+                self.metrics.record_call(model=model_config.get('model', DEFAULT_MODEL), prompt_tokens=0,
+                                         response_tokens=0, latency=time.perf_counter() - started, cache="hit")
+                return hit.response
+
+            current.set(cache="miss")
+            text = self._generate_shared(prompt, model_config, cache="miss")
+            if text:
+                self.semantic_cache.store(prompt, model_key, text)
+            return text
+
+    def _generate_shared(self, prompt: str, model_config: Dict[str, Any], cache: str = "none") -> Optional[str]:
+        """Generate, sharing one call between concurrent requests for the same model, settings and prompt"""
+        if not self.coalesce:
+            return self._generate(prompt, model_config, cache)
+
+        key = hashlib.sha256(f"{self._model_key(model_config)}|{prompt}".encode('utf-8')).hexdigest()
+        started = time.perf_counter()
+        text, shared = self._in_flight.do(key, lambda: self._generate(prompt, model_config, cache))
+        if shared:
+            logger.info("🔗 Reused the result of an identical in-flight request")
+            self.metrics.record_call(model=model_config.get('model', DEFAULT_MODEL), prompt_tokens=0,
+                                     response_tokens=0, latency=time.perf_counter() - started,
+                                     cache="coalesced", success=text is not None)
+        return text
+
+    def _cache_settings(self, model_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Get the step's semantic cache settings; steps opt in with `semantic_cache: true` or a dict"""
+        setting = model_config.get('semantic_cache')
+        if not setting or self.semantic_cache is None:
+            return None
+        return setting if isinstance(setting, dict) else {}
+
+    def _model_key(self, model_config: Dict[str, Any]) -> str:
+        generation_config = self._generation_config(model_config)
+        return f"{model_config.get('model', DEFAULT_MODEL)}|{sorted(generation_config.items())}"
+
+    def _generate(self, prompt: str, model_config: Dict[str, Any], cache: str = "none") -> Optional[str]:
+        # Each call names its own model and settings, so concurrent runs never swap models under each other
+        model_name = model_config.get('model', DEFAULT_MODEL)
+        generation_config = self._generation_config(model_config)
+        prompt_tokens = estimate_tokens(prompt)
+        started = time.perf_counter()
+
+        def attempt():
+            logger.info("\n🤖 Generating content...")
+
+            # Generate response within the shared concurrency and rate budget
+            with self.limiter:
+                call_started = time.perf_counter()
+                response, route = self.router.generate(prompt, model_config, model_name,
+                                                       generation_config, prompt_tokens)
+                self.limiter.on_success(time.perf_counter() - call_started)
+
+            # Validate response
+            if not response or not hasattr(response, 'text'):
+                raise InvalidResponseError("Invalid response format from model")
+            text = response.text
+            if not isinstance(text, str) or not text.strip():
+                raise InvalidResponseError("Empty or invalid response text")
+            return text, response, route
+
+        def on_error(error: BaseException, kind: str) -> None:
+            if kind == QUOTA:
+                logger.info("📢 Rate limit or quota exceeded. Lowering request limits...")
+                self.limiter.on_throttle()
+
+        def delay_hint(error: BaseException, kind: str) -> Optional[float]:
+            # After a throttle the limiter has already cut the rate, so a short wait is enough
+            return self.limiter.retry_after() if kind == QUOTA else None
+
         try:
-            # Extract model name from config
-            model_name = config.pop('model', 'gemini-2.0-flash')
-            
-            # Get generation config without model name
-            generation_config = {
-                "temperature": config.get('temperature'),
-                "top_p": config.get('top_p'),
-                "top_k": config.get('top_k'),
-                "max_output_tokens": config.get('max_tokens')
-            }
-            
-            # Remove None values
-            generation_config = {k: v for k, v in generation_config.items() if v is not None}
-            
-            safety_settings = self.config_manager.get('SAFETY_SETTINGS')
-            
-            self.model = genai.GenerativeModel(
-                model_name=model_name,
-                generation_config=generation_config,
-                safety_settings=safety_settings
-            )
-            
-            print(f"✅ Model {model_name} initialized successfully")
-            
-        except Exception as e:
-            print(f"❌ Error initializing model: {e}")
-            raise
+            result = RetryPolicy.from_config(model_config).run(
+                attempt, name="Generation", on_error=on_error, delay_hint=delay_hint)
+        except RetryError as e:
+            logger.error("\n❌ All generation attempts failed")
+            self._record_call(model_name, prompt, "", None, started, e.attempts, e.waited,
+                              cache=cache, error=str(e.error))
+            if e.kind == QUOTA:
+                logger.info("💡 Suggestion: Wait a few minutes before trying again or check your API quota")
+            return None
+
+        text, response, route = result.value
+        logger.info("✅ Content generated successfully")
+        self._record_call(route.model, prompt, text, response, started, result.attempts, result.waited, cache=cache)
+        return text
+
+    def _record_call(self, model_name: str, prompt: str, text: str, response: Any, started: float,
+                     attempts: int, backoff_seconds: float, cache: str = "none",
+                     error: Optional[str] = None) -> None:
+        """Record token usage and latency for one generate() call"""
+        usage = usage_from_response(response)
+        self.metrics.record_call(
+            model=model_name,
+            prompt_tokens=usage["prompt_tokens"] if usage else estimate_tokens(prompt),
+            response_tokens=usage["response_tokens"] if usage else estimate_tokens(text),
+            latency=time.perf_counter() - started - backoff_seconds,
+            attempts=attempts,
+            backoff_seconds=backoff_seconds,
+            cache=cache,
+            limits=self.limiter.snapshot(),
+            success=error is None,
+            estimated=usage is None,
+            error=error
+        )
+
+    @staticmethod
+    def _generation_config(config: Dict[str, Any]) -> Dict[str, Any]:
+        generation_config = {
+            "temperature": config.get('temperature'),
+            "top_p": config.get('top_p'),
+            "top_k": config.get('top_k'),
+            "max_output_tokens": config.get('max_tokens')
+        }
+        
+        # Remove None values
+        return {k: v for k, v in generation_config.items() if v is not None}
@@ -2,6 +2,9 @@ import os
 from pathlib import Path
 import yaml
 from typing import Any, Dict, Optional
+from Vincius.Core.log_config import get_logger, configure_logging
+
+logger = get_logger(__name__)
 
 class ConfigManager:
     _instance = None
@@ -46,8 +49,8 @@ class ConfigManager:
             if not cls._base_path:
                 cls._base_path = Path.cwd()
             
-            print(f"📂 Project root identified as: {cls._base_path}")
-            print(f"📂 Main.py location: {(cls._base_path / 'main.py').absolute()}")
+            logger.info("📂 Project root identified as: %s", cls._base_path)
+            logger.debug("📂 Main.py location: %s", (cls._base_path / 'main.py').absolute())
             
         return cls._base_path.resolve()
 
@@ -75,7 +78,7 @@ class ConfigManager:
         config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(config_path, 'w', encoding='utf-8') as f:
             yaml.safe_dump(default_config, f)
-        print(f"✅ Created default config at: {config_path}")
+        logger.info("✅ Created default config at: %s", config_path)
         return default_config
 
     def _create_default_workflow(self, workflow_path: Path) -> None:
@@ -100,7 +103,7 @@ class ConfigManager:
         workflow_path.parent.mkdir(parents=True, exist_ok=True)
         with open(workflow_path, 'w', encoding='utf-8') as f:
             yaml.safe_dump(workflow_config, f)
-        print(f"✅ Created default workflow at: {workflow_path}")
+        logger.info("✅ Created default workflow at: %s", workflow_path)
 
     def _load_config(self) -> None:
         """Load configuration from multiple sources with priority"""
@@ -109,8 +112,8 @@ class ConfigManager:
         config_path = self.base_path / "Vincius/Config" / "config.yaml"
         workflow_path = self.base_path / "Vincius/Config" / "Workflows" / "workflow.yaml"
         
-        print(f"Looking for config at: {config_path}")
-        print(f"Looking for workflow at: {workflow_path}")
+        logger.debug("Looking for config at: %s", config_path)
+        logger.debug("Looking for workflow at: %s", workflow_path)
         
         try:
             # Load or create main config
@@ -119,7 +122,7 @@ class ConfigManager:
             else:
                 with open(config_path, 'r', encoding='utf-8') as f:
                     self._config = yaml.safe_load(f) or {}
-                    print(f"✅ Loaded config from: {config_path.absolute()}")
+                    logger.info("✅ Loaded config from: %s", config_path.absolute())
             
             # Load or create workflow config
             if not workflow_path.exists():
@@ -128,17 +131,18 @@ class ConfigManager:
             with open(workflow_path, 'r', encoding='utf-8') as f:
                 workflow_config = yaml.safe_load(f) or {}
                 self._config['workflow'] = workflow_config.get('workflow', {})
-                print(f"✅ Loaded workflow from: {workflow_path.absolute()}")
-                print(f"Found {len(self._config['workflow'])} workflow steps")
+                logger.info("✅ Loaded workflow from: %s", workflow_path.absolute())
+                logger.info("Found %s workflow steps", len(self._config['workflow']))
             
         except Exception as e:
-            print(f"⚠️ Failed to load config: {e}")
-            print(f"Current working directory: {Path.cwd()}")
-            print(f"Config manager file location: {Path(__file__).resolve()}")
+            logger.warning("⚠️ Failed to load config: %s", e)
+            logger.info("Current working directory: %s", Path.cwd())
+            logger.info("Config manager file location: %s", Path(__file__).resolve())
             self._config = {}
         
         # Set defaults if needed
         self._set_defaults()
+        configure_logging(self._config.get('LOGGING'))
 
     def _set_defaults(self) -> None:
         """Set default configurations if not present"""
@@ -154,7 +158,9 @@ class ConfigManager:
                 'temperature': 0.7,
                 'top_p': 0.8,
                 'top_k': 40,
-                'max_tokens': 2048
+                'max_tokens': 2048,
+                'max_prompt_tokens': 8000,   # Budget for file content embedded in one prompt
+                'chunk_output_ratio': 0.6    # Share of max_tokens a chunk may take, as replies re-emit it
             },
             'SAFETY_SETTINGS': [
                 {
@@ -179,6 +185,107 @@ class ConfigManager:
                 'top_p': 0.8,
                 'top_k': 40,
                 'max_output_tokens': 2048
+            },
+            'LOGGING': {
+                'level': 'INFO',
+                'format': 'text',   # text, verbose or json
+                'quiet': False,     # Warnings and errors only
+                'modules': {}       # Per-logger levels, e.g. Vincius.Core.file_system_manager: DEBUG
+            },
+            'TRACING': {
+                'enabled': True,
+                'dir': 'Logs/Traces'   # Chrome trace JSON, opens in ui.perfetto.dev
+            },
+            'SERVER': {
+                'host': '127.0.0.1',
+                'port': 8765,
+                'socket': None,    # Unix socket path; replaces TCP when set
+                'workers': 1
+            },
+            'MODEL_BACKEND': {
+                'mode': 'live',                    # live, record, replay or stub
+                'archive': 'model_archive.sqlite', # Under the state dir; written by record, read by replay
+                'replay_latency': 0,               # Seconds per replayed call, or "recorded"
+                'latency_scale': 1.0,              # Multiplier for recorded latency
+                'replay_miss': 'error',            # error or stub when a prompt was never recorded
+                'stub_responses': [],              # [{match: regex, response: text}] for stub mode
+                'stub_latency': 0.0,
+                'volatile_patterns': None          # Regexes ignored when matching prompts; None = built-in set
+            },
+            'MODEL_ROUTER': {
+                'routes': {},              # name -> {model, backend, max_prompt_tokens, failover_only}; empty = step model only
+                'cooldown_seconds': 60,    # How long a throttled route is skipped
+                'latency_window': 50       # Recent calls used for each route's p95 latency
+            },
+            'RETRY': {
+                'max_attempts': 3,
+                'base_delay': 2.0,             # Seconds before the first retry, doubling after
+                'max_delay': 60.0,
+                'jitter': 'full',              # full, equal or none
+                'step_retry_seconds': 300,     # Backoff and re-attempt time allowed across all retries in one step
+                'step_max_retries': 6,         # Retries, regenerations and repair calls allowed in one step
+                'kinds': {
+                    'quota': {'max_attempts': 4},
+                    'transient': {'max_attempts': 3},
+                    'invalid': {'max_attempts': 2},
+                    'parse': {'max_attempts': 3},
+                    'fatal': {'retry': False}
+                }
+            },
+            'OUTPUT_REPAIR': {
+                'local': True,             # Rewrite near-miss formats (headed code blocks, ...) into FILE: blocks
+                'model': True,             # Then ask for a reformat of just the raw response
+                'max_chars': 40000         # Larger responses go straight to regeneration
+            },
+            'CODE_REVIEW': {
+                'mode': 'full',            # full re-emits improved files; patch asks for search/replace hunks
+                'patch_min_lines': 40,     # Smaller files are cheap to re-emit and use full mode
+                'patch_fuzz': 0.85,        # Minimum similarity for a hunk whose context drifted
+                'skip_approved': True,     # Skip files whose content already passed this prompt version
+                'batch_small_files': True, # Review small files several per prompt
+                'batch_max_file_tokens': 500,  # Larger files get a prompt of their own
+                'batch_max_files': 10,
+                'max_passes': 1,           # Review-improve passes; later passes cover only files still changing
+                'min_change_ratio': 0.02,  # A pass changing fewer lines than this share counts as converged
+                'time_budget_seconds': 600,  # Per run; no further passes or files once spent
+                'token_budget': 200000,    # Model tokens the review phase of a run may use
+                'verdicts_file': 'review_verdicts.json'  # Under the run workspace's state dir
+            },
+            'MODEL_POOL': {
+                'max_concurrent': 4,           # Model requests in flight across all runs
+                'requests_per_minute': None,   # Spacing between requests; None to disable
+                'coalesce': True,              # Identical concurrent requests share one call
+                'adaptive': True,              # Learn limits from 429s and latency (AIMD)
+                'min_concurrent': 1,
+                'max_requests_per_minute': None,
+                'min_requests_per_minute': 4.0,  # Floor for the learned rate
+                'rate_increase': 1.0,          # Requests/min added per success
+                'decrease_factor': 0.5,        # Multiplier for window and rate on a 429
+                'latency_factor': 3.0,         # Latency over this multiple of the best narrows the window
+                'limits_file': 'model_limits.json'  # Learned limits, under the state dir
+            },
+            'JOB_RUNNER': {
+                'max_workers': 4,
+                'isolate_workspaces': False,   # Give each run its own copy of agent folders and logs
+                'runs_dir': 'Runs'
+            },
+            'SEMANTIC_CACHE': {
+                'enabled': True,           # Master switch; steps opt in with semantic_cache in agent_config
+                'threshold': 0.9,          # Minimum estimated similarity to reuse a response
+                'num_perm': 64,
+                'bands': 16,
+                'shingle_size': 5,
+                'max_entries': 500,
+                'volatile_patterns': None  # Regexes blanked before matching; None uses the built-in set
+            },
+            'EXECUTOR': {
+                'mode': 'inline',          # inline, thread or process for CPU-bound post-processing
+                'min_offload_chars': 20000,  # Smaller payloads always run inline
+                'max_workers': None,       # Pool default when None
+                'start_method': 'spawn'
+            },
+            'FILE_INDEX': {
+                'ignore': ['.*', '__pycache__', 'backups', 'node_modules', 'venv', '*.bak']
             }
         }
         
@@ -217,9 +324,16 @@ class ConfigManager:
         # Always use base_path (project root) for codebase
         codebase = self.base_path / self.get('PATHS', {}).get('codebase_dir', 'Codebase')
         codebase.mkdir(parents=True, exist_ok=True)
-        print(f"📂 Using codebase directory: {codebase.absolute()}")
+        logger.info("📂 Using codebase directory: %s", codebase.absolute())
         return codebase
 
+    @property
+    def state_path(self) -> Path:
+        """Get directory for state persisted between runs"""
+        state = self.base_path / self.get('PATHS', {}).get('state_dir', 'Logs/state')
+        state.mkdir(parents=True, exist_ok=True)
+        return state
+
     def _load_workflow(self) -> Dict[str, Any]:
         """Load workflow configuration file"""
         workflow_path = self.base_path / "Vincius" / "Config" / "Workflows" / "workflow.yaml"
@@ -227,7 +341,7 @@ class ConfigManager:
             with open(workflow_path, 'r') as f:
                 return yaml.safe_load(f)
         except Exception as e:
-            print(f"❌ Error loading workflow: {e}")
+            logger.error("❌ Error loading workflow: %s", e)
             return {}
 
     def get_workflow(self) -> Dict[str, Any]:
@@ -243,9 +357,9 @@ class ConfigManager:
         if not workflow:
             raise ValueError("Empty workflow configuration")
             
-        print(f"📋 Loaded workflow with {len(workflow)} steps:")
+        logger.info("📋 Loaded workflow with %s steps:", len(workflow))
         for step_name, step_config in workflow.items():
-            print(f"  - {step_name}: {step_config.get('description', 'No description')}")
+            logger.info("  - %s: %s", step_name, step_config.get('description', 'No description'))
             
         return self._workflow
 
@@ -259,14 +373,14 @@ class ConfigManager:
                 action = step.get('action', {})
                 if action.get('class', '').replace('Agent', '') == agent_name:
                     agent_config = action.get('agent_config', {})
-                    print(f"📝 Found configuration for agent {agent_name}")
+                    logger.info("📝 Found configuration for agent %s", agent_name)
                     return agent_config
                     
-            print(f"⚠️ No configuration found for agent {agent_name}")
+            logger.warning("⚠️ No configuration found for agent %s", agent_name)
             return None
             
         except Exception as e:
-            print(f"❌ Error getting agent config: {e}")
+            logger.error("❌ Error getting agent config: %s", e)
             return None
 
     def get_base_path(self, key: str) -> Path:
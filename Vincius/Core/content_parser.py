@@ -1,12 +1,11 @@
 import re
 from typing import List, Dict, Any, Optional
-import commonmark
+from Vincius.Core.tracing import traced
+from Vincius.Core.log_config import get_logger
 
-class ContentParser:
-    def __init__(self):
-        self.parser = commonmark.Parser()
-        self.renderer = commonmark.HtmlRenderer()
+logger = get_logger(__name__)
 
+class ContentParser:
     @staticmethod
     def clean_code_block(content: str) -> str:
         """Clean content from markdown code blocks and extra formatting"""
@@ -21,10 +20,11 @@ class ContentParser:
         return content.strip()
 
     @classmethod
+    @traced("ContentParser.parse_files_section", "parse")
     def parse_files_section(cls, content: str) -> List[Dict[str, Any]]:
         """Parse file sections from content string"""
         if not content:
-            print("⚠️ Empty content provided to parser")
+            logger.warning("⚠️ Empty content provided to parser")
             return []
             
         # First try standard parsing approach
@@ -42,10 +42,34 @@ class ContentParser:
         if files:
             return files
             
-        print("⚠️ No file sections found in the content")
-        print(f"Content preview:\n{content[:200]}...")
+        logger.warning("⚠️ No file sections found in the content")
+        logger.debug("Content preview:\n%s...", content[:200])
         return []
     
+    IMPORT_LINE = re.compile(r'^\s*(?:import\s|from\s+\S+\s+import\s|#include\s|using\s|require\(|const\s+\w+\s*=\s*require\()')
+
+    @classmethod
+    def merge_file_sections(cls, section_lists: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Merge file sections produced from separate chunks, joining sections for the same path"""
+        merged: Dict[str, Dict[str, Any]] = {}
+        
+        for sections in section_lists:
+            for section in sections:
+                path = section.get("path")
+                if path not in merged:
+                    merged[path] = dict(section)
+                    continue
+                
+                # Drop import lines the earlier part already has
+                existing = merged[path]
+                seen_imports = {line.strip() for line in existing["content"].splitlines()
+                                if cls.IMPORT_LINE.match(line)}
+                body = "\n".join(line for line in cls.clean_code_block(section["content"]).splitlines()
+                                 if line.strip() not in seen_imports)
+                existing["content"] = f"{cls.clean_code_block(existing['content']).rstrip()}\n\n\n{body.strip()}\n"
+        
+        return list(merged.values())
+
     @classmethod
     def _try_standard_parsing(cls, content: str) -> List[Dict[str, Any]]:
         """Try standard pattern parsing first"""
@@ -73,7 +97,7 @@ class ContentParser:
             })
         
         if files:
-            print(f"✅ Found {len(files)} file sections using standard pattern")
+            logger.info("✅ Found %s file sections using standard pattern", len(files))
             
         return files
     
@@ -116,7 +140,7 @@ class ContentParser:
             })
         
         if files:
-            print(f"✅ Found {len(files)} file sections using direct header parsing")
+            logger.info("✅ Found %s file sections using direct header parsing", len(files))
             
         return files
     
@@ -129,7 +153,7 @@ class ContentParser:
             files = cls._extract_filepath_and_content(content)
             
         if files:
-            print(f"✅ Found {len(files)} file sections using fallback parsing")
+            logger.info("✅ Found %s file sections using fallback parsing", len(files))
             
         return files
 
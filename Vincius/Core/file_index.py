@@ -0,0 +1,158 @@
+import os
+import hashlib
+import threading
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+class FileEntry(NamedTuple):
+    path: Path
+    size: int
+    mtime_ns: int
+
+class _DirectoryRecord(NamedTuple):
+    mtime_ns: int
+    files: Dict[str, FileEntry]
+    subdirs: List[str]
+
+class FileIndex:
+    """Cached index of a directory tree, refreshed incrementally from directory mtimes.
+
+    A directory is only re-listed when its own mtime changes, so a refresh costs one
+    stat per directory instead of one per file. Writes made through FileSystemManager
+    are reported with touch() so in-place edits are picked up without a rescan.
+    """
+
+    DEFAULT_IGNORES = ['.*', '__pycache__', 'backups', 'node_modules', 'venv', '*.bak']
+
+    _indexes: Dict[Tuple[Path, Tuple[str, ...]], 'FileIndex'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, root: Path, ignore: Optional[List[str]] = None):
+        self.root = Path(root).resolve()
+        self.ignore = list(ignore) if ignore is not None else list(self.DEFAULT_IGNORES)
+        self._dirs: Dict[Path, _DirectoryRecord] = {}
+        self._hashes: Dict[Path, tuple] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_directory(cls, root: Path, ignore: Optional[List[str]] = None) -> 'FileIndex':
+        """Get the shared index for a directory and ignore rules, creating it on first use"""
+        root = Path(root).resolve()
+        ignore = list(ignore) if ignore is not None else list(cls.DEFAULT_IGNORES)
+        key = (root, tuple(sorted(set(ignore))))
+        with cls._registry_lock:
+            index = cls._indexes.get(key)
+            if index is None:
+                index = cls(root, ignore)
+                cls._indexes[key] = index
+            return index
+
+    def is_ignored(self, name: str) -> bool:
+        """Check a single path component against the ignore rules"""
+        return any(fnmatch(name, pattern) for pattern in self.ignore)
+
+    def refresh(self) -> None:
+        """Bring the index up to date, re-listing only directories that changed"""
+        with self._lock:
+            seen = set()
+            self._scan_directory(self.root, seen)
+            for stale in set(self._dirs) - seen:
+                del self._dirs[stale]
+
+    def _scan_directory(self, directory: Path, seen: set) -> None:
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return
+
+        seen.add(directory)
+        record = self._dirs.get(directory)
+        if record is None or record.mtime_ns != mtime_ns:
+            record = self._list_directory(directory, mtime_ns)
+            self._dirs[directory] = record
+
+        for name in record.subdirs:
+            self._scan_directory(directory / name, seen)
+
+    def _list_directory(self, directory: Path, mtime_ns: int) -> _DirectoryRecord:
+        files, subdirs = {}, []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if self.is_ignored(entry.name):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        files[entry.name] = FileEntry(Path(entry.path), stat.st_size, stat.st_mtime_ns)
+        except OSError as e:
+            logger.warning("⚠️ Unable to index %s: %s", directory, e)
+        return _DirectoryRecord(mtime_ns, files, subdirs)
+
+    def touch(self, paths: Iterable[Path]) -> None:
+        """Record writes made by this process so the next lookup sees them"""
+        with self._lock:
+            for path in paths:
+                path = Path(path).resolve()
+                record = self._dirs.get(path.parent)
+                if record is None:
+                    continue
+                try:
+                    stat = path.stat()
+                    record.files[path.name] = FileEntry(path, stat.st_size, stat.st_mtime_ns)
+                except OSError:
+                    record.files.pop(path.name, None)
+
+    def entries(self, directory: Optional[Path] = None) -> List[FileEntry]:
+        """Get indexed files below a directory (the whole root by default)"""
+        self.refresh()
+        base = Path(directory).resolve() if directory else self.root
+        with self._lock:
+            found = [
+                entry
+                for dir_path, record in self._dirs.items()
+                if dir_path == base or base in dir_path.parents
+                for entry in record.files.values()
+            ]
+        return sorted(found, key=lambda entry: entry.path)
+
+    def list_files(self, directory: Optional[Path] = None) -> List[Path]:
+        """Get paths of indexed files below a directory"""
+        return [entry.path for entry in self.entries(directory)]
+
+    def get_entry(self, path: Path) -> Optional[FileEntry]:
+        """Look up a single file without touching the rest of the tree"""
+        path = Path(path).resolve()
+        with self._lock:
+            record = self._dirs.get(path.parent)
+            if record is not None and path.name in record.files:
+                return record.files[path.name]
+        try:
+            stat = path.stat()
+            return FileEntry(path, stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            return None
+
+    def get_hash(self, path: Path) -> Optional[str]:
+        """Get the MD5 of a file, recomputed only when its size or mtime changed"""
+        path = Path(path).resolve()
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        signature = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._hashes.get(path)
+            if cached and cached[0] == signature:
+                return cached[1]
+
+        digest = hashlib.md5(path.read_bytes()).hexdigest()
+        with self._lock:
+            self._hashes[path] = (signature, digest)
+        return digest
@@ -1,4 +1,5 @@
 import os
+import logging
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import shutil
@@ -9,7 +10,17 @@ from Vincius.Core.content_parser import ContentParser
 from Vincius.Core.config_manager import ConfigManager
 from Vincius.Core.agent_logger import AgentLogger
 from Vincius.Core.logger_base import LoggerBase
+from Vincius.Core.file_transaction import FileTransaction
+from Vincius.Core.file_index import FileIndex
 from importlib import import_module
+from Vincius.Core.tracing import span, traced
+from Vincius.Core.output_repair import expected_paths, reformat_prompt, repair_locally
+from Vincius.Core import run_context
+from Vincius.Core.model_backends import NonRetryableError
+from Vincius.Core.retry_policy import PARSE, ParseError, RetryError, RetryPolicy, take_retry
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class FileSystemManager:
     """Manages file system operations for code generation and modifications"""
@@ -17,26 +28,32 @@ class FileSystemManager:
     def __init__(self, agent=None):
         self.config_manager = ConfigManager()
         self.content_parser = ContentParser()
-        self.project_root = self.config_manager.base_path
+        self.project_root = run_context.workspace_path()
         self.agent = agent  # Store reference to the agent if provided
         
         # Initialize logger based on current agent type and UUID
-        self.current_agent = os.environ.get('CURRENT_AGENT_TYPE', 'Developer')
+        context = run_context.current()
+        self.current_agent = context.agent_type or 'Developer'
         self.agent_uuid = None
         
         # Get UUID directly from agent if provided
         if self.agent and hasattr(self.agent, 'uuid'):
             self.agent_uuid = self.agent.uuid  # Extract UUID from agent
         else:
-            self.agent_uuid = os.environ.get('CURRENT_AGENT_UUID', None)
+            self.agent_uuid = context.agent_uuid
             
         self.agent_config = self._get_agent_config()
         
         # Create and initialize base directory
         self.base_dir = self._initialize_base_directory()
         self.logger = self._initialize_logger()
+        self.file_index = FileIndex.for_directory(
+            self.base_dir,
+            ignore=self.config_manager.get('FILE_INDEX', {}).get('ignore')
+        )
         
-        print(f"🔧 Initialized {self.current_agent} agent (ID: {self.agent_uuid[:8] if self.agent_uuid else 'unknown'}) in {self.base_dir}")
+        logger.info("🔧 Initialized %s agent (ID: %s) in %s",
+                    self.current_agent, self.agent_uuid[:8] if self.agent_uuid else 'unknown', self.base_dir)
 
     def _get_agent_config(self) -> Dict:
         """Get agent configuration from workflow"""
@@ -80,11 +97,22 @@ class FileSystemManager:
         clean = clean.replace('\\', '/')     # Normalize slashes
         return clean.strip()
 
+    def _resolve_path(self, path: str) -> Path:
+        """Resolve a file path against the agent's base directory"""
+        file_path = Path(str(path))
+        if not file_path.is_absolute():
+            return self.base_dir / file_path
+        try:
+            return self.base_dir / file_path.relative_to(self.base_dir)
+        except ValueError:
+            return file_path
+
+    @traced("FileSystemManager.create_or_update_file", "io")
     def create_or_update_file(self, file_info: Dict[str, Any]) -> Optional[Path]:
         """Create or update a file with its directory structure"""
         try:
             if not isinstance(file_info, dict) or 'path' not in file_info or 'content' not in file_info:
-                print("⚠️ Invalid file info structure")
+                logger.warning("⚠️ Invalid file info structure")
                 return None
 
             path = file_info["path"]
@@ -93,44 +121,35 @@ class FileSystemManager:
             description = file_info.get("description", "")
 
             if not content:
-                print(f"⚠️ No content provided for {path}")
+                logger.warning("⚠️ No content provided for %s", path)
                 return None
 
             # Always use absolute paths and verify directory
             file_path = Path(str(path))
 
             # Use the agent's base directory
-            if not file_path.is_absolute():
-                full_path = self.base_dir / file_path
-            else:
-                try:
-                    rel_path = file_path.relative_to(self.base_dir)
-                    full_path = self.base_dir / rel_path
-                except ValueError:
-                    full_path = file_path
-
-            print(f"\n📝 File operation details:")
-            print(f"Path: {file_path}")
-            print(f"Full path: {full_path}")
-            print(f"Absolute path: {full_path.absolute()}")
-            print(f"Operation: {'Modifying' if is_modification else 'Creating'}")
+            full_path = self._resolve_path(path)
+
+            logger.info("📄 %s: %s", 'Modifying' if is_modification else 'Creating', full_path)
+            logger.debug("Path: %s", file_path)
+            logger.debug("Absolute path: %s", full_path.absolute())
             if description:
-                print(f"Description: {description}")
+                logger.debug("Description: %s", description)
 
             # Create directory structure with explicit error checking
             try:
                 os.makedirs(full_path.parent, exist_ok=True)
                 if not full_path.parent.exists():
                     raise IOError(f"Failed to create directory: {full_path.parent}")
-                print(f"📁 Created/Verified directory: {full_path.parent}")
+                logger.debug("📁 Created/Verified directory: %s", full_path.parent)
             except Exception as e:
-                print(f"❌ Failed to create directory: {e}")
+                logger.error("❌ Failed to create directory: %s", e)
                 raise
 
             # Backup if modifying existing file
             if is_modification and full_path.exists():
                 backup_path = self.backup_file(full_path)
-                print(f"💾 Backup created: {backup_path.name}")
+                logger.info("💾 Backup created: %s", backup_path.name)
 
             # Write file content with explicit verification
             try:
@@ -145,8 +164,9 @@ class FileSystemManager:
                 if not written_content:
                     raise IOError(f"File was created but content is empty: {full_path}")
                 
-                print(f"✅ File written successfully: {full_path}")
-                print(f"✅ Content length: {len(written_content)} characters")
+                logger.info("✅ File written successfully: %s", full_path)
+                logger.debug("✅ Content length: %s characters", len(written_content))
+                self.file_index.touch([full_path])
                 
                 # Log using the current agent's logger
                 self.logger.log_file_creation(
@@ -155,94 +175,132 @@ class FileSystemManager:
                     is_modification=file_info.get("modifications", False),
                     content=content
                 )
-                print(f"📝 Logged by {self.current_agent} agent")
+                logger.info("📝 Logged by %s agent", self.current_agent)
                 return full_path
 
             except Exception as e:
-                print(f"❌ Failed to write file: {e}")
-                print(f"Directory exists: {full_path.parent.exists()}")
-                print(f"Is directory writable: {os.access(full_path.parent, os.W_OK)}")
-                print(f"Current permissions: {oct(os.stat(full_path.parent).st_mode)[-3:]}")
+                logger.error("❌ Failed to write file: %s", e)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Directory exists: %s", full_path.parent.exists())
+                    logger.debug("Is directory writable: %s", os.access(full_path.parent, os.W_OK))
+                    logger.debug("Current permissions: %s", oct(os.stat(full_path.parent).st_mode)[-3:])
                 raise
 
         except Exception as e:
-            print(f"❌ Error processing file: {e}")
-            print(f"Stack trace:")
-            import traceback
-            print(traceback.format_exc())
+            logger.error("❌ Error processing file: %s", e)
+            logger.debug("Stack trace:", exc_info=True)
             return None
 
+    def write_files(self, files_info: List[Dict[str, Any]]) -> List[Path]:
+        """Write several files in one transaction; nothing is left half-written on failure"""
+        transaction = FileTransaction(self.logger, backup=self.backup_file)
+        
+        for file_info in files_info:
+            if not isinstance(file_info, dict) or 'path' not in file_info or 'content' not in file_info:
+                logger.warning("⚠️ Invalid file info structure")
+                continue
+
+            content = self.content_parser.clean_code_block(file_info['content'])
+            if not content:
+                logger.warning("⚠️ No content provided for %s", file_info['path'])
+                continue
+
+            full_path = self._resolve_path(file_info['path'])
+            is_modification = file_info.get("modifications", False)
+            logger.debug("📄 %s: %s", 'Modifying' if is_modification else 'Creating', full_path)
+            transaction.stage(
+                full_path,
+                content,
+                description=file_info.get("description", ""),
+                is_modification=is_modification
+            )
+
+        processed_files = transaction.commit()
+        self.file_index.touch(processed_files)
+        if processed_files:
+            logger.info("📝 Logged by %s agent", self.current_agent)
+        return processed_files
+
     def process_content(self, content: str, brain: Any = None, config: Dict = None, retry_prompt: str = None) -> List[Path]:
         """Process content in text format and create files"""
-        print("\n🔍 DEBUG: File System Manager - Process Content Start")
-        print("=" * 50)
-        print(f"Content length: {len(content)} characters")
-        print(f"Content preview:\n{content[:200]}...")
+        logger.debug("\n🔍 File System Manager - Process Content Start")
+        logger.debug("Content length: %s characters", len(content))
+        logger.debug("Content preview:\n%s...", content[:200])
         
         # Create a ContentParser instance to use non-static methods
         parser = ContentParser()
-        
-        processed_files = []
-        max_retries = 3
-        current_try = 0
-        
-        while current_try < max_retries:
-            try:
-                print(f"\n📝 DEBUG: Parsing attempt {current_try + 1}")
-                
-                # Use the improved parsing methods
-                files_info = parser.parse_files_section(content)
-                
-                if not files_info:
-                    # Try even more aggressive parsing for file sections
-                    print("⚠️ Standard parsing failed, trying emergency parsing...")
-                    files_info = self._emergency_parse_files(content)
-                
-                if not files_info:
-                    print("⚠️ DEBUG: No valid file sections found in content")
-                    print("Content structure might not match expected format")
-                    raise ValueError("No valid file sections found")
+        can_regenerate = bool(brain and config and retry_prompt)
+        paths = expected_paths(retry_prompt)
+        state = {"content": content, "attempts": 0}
+
+        def attempt() -> List[Path]:
+            state["attempts"] += 1
+            if state["attempts"] > 1:
+                logger.info("\n🔄 Requesting new implementation...")
+                state["content"] = brain.generate(retry_prompt, config)
+                if not state["content"]:
+                    raise NonRetryableError("No content generated for the retry prompt")
+
+            logger.debug("\n📝 Parsing attempt %s", state["attempts"])
+            
+            # Use the improved parsing methods
+            files_info = parser.parse_files_section(state["content"])
+            
+            if not files_info:
+                # Try even more aggressive parsing for file sections
+                logger.warning("⚠️ Standard parsing failed, trying emergency parsing...")
+                files_info = self._emergency_parse_files(state["content"])
 
-                print(f"\n🔄 DEBUG: Processing {len(files_info)} files...")
-                
-                for file_info in files_info:
-                    print(f"\n📄 DEBUG: Processing file: {file_info.get('path', 'unknown')}")
-                    if path := self.create_or_update_file(file_info):
-                        print(f"✅ DEBUG: Successfully created: {path}")
-                        processed_files.append(path)
-                    else:
-                        print(f"❌ DEBUG: Failed to create file")
-
-                if processed_files:
-                    print(f"\n✅ DEBUG: Successfully processed files:")
-                    for path in processed_files:
-                        print(f"- {path}")
-                        # Verify file exists and has content
-                        if path.exists():
-                            content_length = len(path.read_text(encoding='utf-8'))
-                            print(f"  Content length: {content_length} chars")
-                        else:
-                            print(f"  ⚠️ File does not exist!")
-                    return processed_files
-                    
-                raise ValueError("No files were processed successfully")
+            if not files_info:
+                files_info = self._repair_output(parser, state["content"], brain, config, paths)
+            
+            if not files_info:
+                logger.debug("Content structure might not match expected format")
+                raise ParseError("No valid file sections found")
 
-            except Exception as e:
-                current_try += 1
-                print(f"\n⚠️ DEBUG: Attempt {current_try} failed: {str(e)}")
-                print(f"Stack trace:")
-                import traceback
-                print(traceback.format_exc())
-                
-                if brain and config and retry_prompt and current_try < max_retries:
-                    print("\n🔄 DEBUG: Requesting new implementation...")
-                    content = brain.generate(retry_prompt, config)
-                else:
-                    print("❌ DEBUG: No retry possible")
+            logger.debug("\n🔄 Processing %s files...", len(files_info))
+            
+            # Stage every file and commit them together
+            processed_files = self.write_files(files_info)
+            if not processed_files:
+                raise ParseError("No files were processed successfully")
+            return processed_files
+
+        try:
+            # Only parse failures are worth a new generation; the same content would fail the same way
+            processed_files = RetryPolicy.from_config(config).run(
+                attempt, name="Parsing", retry_kinds={PARSE} if can_regenerate else ()).value
+        except RetryError:
+            logger.error("\n❌ All attempts failed")
+            return []
 
-        print("\n❌ DEBUG: All attempts failed")
+        logger.info("\n✅ Successfully processed %s files", len(processed_files))
+        for path in processed_files:
+            logger.debug("- %s", path)
         return processed_files
 
+    def _repair_output(self, parser: ContentParser, content: str, brain: Any = None,
+                       config: Dict = None, paths: List[str] = ()) -> List[Dict[str, Any]]:
+        """Recover file sections from a badly formatted response before paying for a full regeneration"""
+        settings = self.config_manager.get('OUTPUT_REPAIR', {}) or {}
+        
+        if settings.get('local', True):
+            repaired = repair_locally(content, paths)
+            if repaired:
+                files_info = parser.parse_files_section(repaired)
+                if files_info:
+                    return files_info
+
+        # A reformat prompt carries only the raw response, so it is far cheaper than the original request
+        if (brain and config and settings.get('model', True) and content
+                and len(content) <= settings.get('max_chars', 40000) and take_retry("Output repair")):
+            logger.info("🩹 Asking the model to reformat the response into FILE: blocks...")
+            with span("repair output", "parse", chars=len(content)):
+                reformatted = brain.generate(reformat_prompt(content, paths), config)
+            if reformatted:
+                return parser.parse_files_section(reformatted)
+        return []
+
     def _emergency_parse_files(self, content: str) -> List[Dict[str, Any]]:
         """Last resort parsing for file sections when all else fails"""
         files = []
@@ -295,7 +353,7 @@ class FileSystemManager:
                     })
         
         if files:
-            print(f"✅ Found {len(files)} file sections using emergency parsing")
+            logger.info("✅ Found %s file sections using emergency parsing", len(files))
             
         return files
 
@@ -316,29 +374,29 @@ class FileSystemManager:
         try:
             full_path = self.base_dir / file_path  # Use base_dir instead of code_dir
             if not full_path.exists():
-                print(f"⚠️ File not found: {file_path}")
+                logger.warning("⚠️ File not found: %s", file_path)
                 return None
             return full_path.read_text(encoding='utf-8')
         except Exception as e:
-            print(f"❌ Error reading file {file_path}: {e}")
+            logger.error("❌ Error reading file %s: %s", file_path, e)
             return None
 
     def verify_structure(self, files: List[Path], brain: Any, config: Dict) -> bool:
         """Verify project structure and create missing files if needed"""
         try:
             structure = self._create_structure_representation(files)
-            print("\n🔍 Verifying project structure...")
+            logger.info("\n🔍 Verifying project structure...")
             
             if not files:
-                print("⚠️ No files to verify")
+                logger.warning("⚠️ No files to verify")
                 return False
 
-            print("\nCurrent structure:")
-            print(structure)
+            logger.info("\nCurrent structure:")
+            logger.info("%s", structure)
             return True
             
         except Exception as e:
-            print(f"❌ Error verifying structure: {e}")
+            logger.error("❌ Error verifying structure: %s", e)
             return False
 
     def _create_structure_representation(self, files: List[Path]) -> str:
@@ -353,41 +411,45 @@ class FileSystemManager:
             
             return "\n".join(structure)
         except Exception as e:
-            print(f"❌ Error creating structure representation: {e}")
+            logger.error("❌ Error creating structure representation: %s", e)
             return ""
 
     def list_files(self, directory: Optional[str] = None) -> List[Path]:
-        """List all files in directory"""
+        """List all indexed files in directory, skipping ignored paths"""
         try:
             search_dir = self.base_dir  # Use base_dir instead of code_dir
             if directory:
                 search_dir = search_dir / directory
             
             if not search_dir.exists():
-                print(f"⚠️ Directory not found: {directory}")
+                logger.warning("⚠️ Directory not found: %s", directory)
                 return []
 
-            files = list(search_dir.rglob('*'))
-            return [f for f in files if f.is_file()]
+            return self.file_index.list_files(search_dir)
         except Exception as e:
-            print(f"❌ Error listing files: {e}")
+            logger.error("❌ Error listing files: %s", e)
             return []
 
+    def get_file_hash(self, file_path: Path) -> Optional[str]:
+        """Get the content hash of a file from the index"""
+        return self.file_index.get_hash(self._resolve_path(file_path))
+
     def delete_file(self, file_path: Path, backup: bool = True) -> bool:
         """Safely delete a file with optional backup"""
         try:
             full_path = self.base_dir / file_path  # Use base_dir instead of code_dir
             if not full_path.exists():
-                print(f"⚠️ File not found: {file_path}")
+                logger.warning("⚠️ File not found: %s", file_path)
                 return False
 
             if backup:
                 self.backup_file(full_path)
-                print(f"💾 Backup created before deletion")
+                logger.info("💾 Backup created before deletion")
 
             full_path.unlink()
-            print(f"🗑️ Deleted: {file_path}")
+            self.file_index.touch([full_path])
+            logger.info("🗑️ Deleted: %s", file_path)
             return True
         except Exception as e:
-            print(f"❌ Error deleting file {file_path}: {e}")
+            logger.error("❌ Error deleting file %s: %s", file_path, e)
             return False
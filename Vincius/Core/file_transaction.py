@@ -0,0 +1,142 @@
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from Vincius.Core.tracing import span
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+class FileTransaction:
+    """Stages a batch of file writes and commits them all-or-nothing"""
+
+    MAX_WORKERS = 8
+
+    def __init__(self, logger: Any = None, backup: Optional[Callable[[Path], Path]] = None):
+        self.logger = logger
+        self.backup = backup
+        self._staged: Dict[Path, Dict[str, Any]] = {}
+        self._temp_files: Dict[Path, Path] = {}
+        self._originals: Dict[Path, Optional[bytes]] = {}
+        self._committed: List[Path] = []
+
+    def stage(self, full_path: Path, content: str, description: str = "",
+              is_modification: bool = False) -> None:
+        """Stage a file write; a later write to the same path replaces the earlier one"""
+        self._staged[Path(full_path)] = {
+            "content": content,
+            "description": description,
+            "is_modification": is_modification
+        }
+
+    @property
+    def staged_paths(self) -> List[Path]:
+        return list(self._staged)
+
+    def commit(self) -> List[Path]:
+        """Write every staged file, then log them together; roll back on any failure"""
+        if not self._staged:
+            return []
+
+        try:
+            with span("FileTransaction.commit", "io", files=len(self._staged)):
+                self._create_directories()
+                self._write_temp_files()
+                self._snapshot_and_backup()
+                self._swap_in()
+        except Exception as e:
+            logger.error("❌ Transaction failed, rolling back %s files: %s", len(self._staged), e)
+            self.rollback()
+            raise
+
+        if self.logger:
+            self.logger.log_file_creations([
+                {
+                    "file_path": path,
+                    "description": entry["description"],
+                    "is_modification": entry["is_modification"],
+                    "content": entry["content"]
+                }
+                for path, entry in self._staged.items()
+            ])
+
+        logger.info("✅ Committed %s files in one transaction", len(self._committed))
+        return list(self._committed)
+
+    def rollback(self) -> None:
+        """Restore every file touched by this transaction and drop temp files"""
+        for path in reversed(self._committed):
+            original = self._originals.get(path)
+            try:
+                if original is None:
+                    path.unlink(missing_ok=True)
+                else:
+                    path.write_bytes(original)
+            except Exception as e:
+                logger.warning("⚠️ Failed to restore %s: %s", path, e)
+
+        for temp_path in self._temp_files.values():
+            try:
+                temp_path.unlink(missing_ok=True)
+            except Exception:
+                pass
+
+        self._committed = []
+        self._temp_files = {}
+
+    def _create_directories(self) -> None:
+        """Create each distinct parent directory once"""
+        for directory in {path.parent for path in self._staged}:
+            os.makedirs(directory, exist_ok=True)
+
+    def _write_temp_files(self) -> None:
+        """Write staged content next to its target in parallel"""
+        workers = min(self.MAX_WORKERS, len(self._staged))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                path: pool.submit(self._write_temp_file, path, entry["content"])
+                for path, entry in self._staged.items()
+            }
+            errors = []
+            for path, future in futures.items():
+                try:
+                    self._temp_files[path] = future.result()
+                except Exception as e:
+                    errors.append(f"{path}: {e}")
+
+        if errors:
+            raise IOError(f"Failed to write {len(errors)} files: {'; '.join(errors)}")
+
+    @staticmethod
+    def _write_temp_file(path: Path, content: str) -> Path:
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+                written = f.write(content)
+            if written != len(content):
+                raise IOError(f"Short write: {written} of {len(content)} characters")
+            os.chmod(temp_name, 0o644)  # mkstemp creates 0600 files
+        except Exception:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        return Path(temp_name)
+
+    def _snapshot_and_backup(self) -> None:
+        """Keep original bytes for rollback and back up files being modified"""
+        for path, entry in self._staged.items():
+            if path.exists():
+                self._originals[path] = path.read_bytes()
+                shutil.copymode(path, self._temp_files[path])
+                if entry["is_modification"] and self.backup:
+                    backup_path = self.backup(path)
+                    logger.info("💾 Backup created: %s", backup_path.name)
+            else:
+                self._originals[path] = None
+
+    def _swap_in(self) -> None:
+        """Move every temp file over its target"""
+        for path in self._staged:
+            os.replace(self._temp_files.pop(path), path)
+            self._committed.append(path)
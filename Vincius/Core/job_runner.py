@@ -0,0 +1,84 @@
+import uuid
+import threading
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from Vincius.Core.config_manager import ConfigManager
+from Vincius.Core import run_context
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+class JobRunner:
+    """Runs independent workflow instances concurrently in one process.
+
+    Each run executes in a fresh context holding its own run id, agent identity
+    and workspace, so runs never see each other's state. Model calls from every
+    run go through the shared, rate-limited BrainModel pool.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, isolate_workspaces: Optional[bool] = None):
+        settings = ConfigManager().get('JOB_RUNNER', {}) or {}
+        self.max_workers = max(1, max_workers or settings.get('max_workers', 4))
+        self.isolate_workspaces = (settings.get('isolate_workspaces', False)
+                                   if isolate_workspaces is None else isolate_workspaces)
+        self.runs_dir = ConfigManager().base_path / settings.get('runs_dir', 'Runs')
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        # The pool starts on the first submit; callers running workflows on their own threads never need it
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="workflow-run")
+            return self._pool
+
+    def _workspace_for(self, run_id: str, workspace: Optional[Path]) -> Optional[Path]:
+        if workspace:
+            return Path(workspace)
+        if self.isolate_workspaces:
+            return self.runs_dir / run_id
+        return None  # Share the project root, as a single run does
+
+    def run_workflow(self, input_data: Any = None, run_id: Optional[str] = None,
+                     workspace: Optional[Path] = None) -> Optional[Dict]:
+        """Run one workflow to completion on the calling thread, isolated from other runs"""
+        run_id = run_id or f"{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:6]}"
+        workspace = self._workspace_for(run_id, workspace)
+
+        def run() -> Optional[Dict]:
+            from Vincius.Core.workflow_manager import WorkflowManager
+
+            run_context.update(run_id=run_id, workspace=workspace)
+            if workspace:
+                workspace.mkdir(parents=True, exist_ok=True)
+                logger.info("📂 Run %s uses workspace %s", run_id, workspace)
+            return WorkflowManager(run_id=run_id).execute(input_data)
+
+        # A new, empty context rather than a copy: nothing leaks in from the caller
+        return contextvars.Context().run(run)
+
+    def submit(self, input_data: Any = None, run_id: Optional[str] = None,
+               workspace: Optional[Path] = None) -> Future:
+        """Queue a workflow run on the pool and return its future"""
+        return self._executor().submit(self.run_workflow, input_data, run_id, workspace)
+
+    def run_many(self, inputs: List[Any]) -> List[Optional[Dict]]:
+        """Run one workflow per input concurrently, returning results in input order"""
+        futures = [self.submit(input_data) for input_data in inputs]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error("❌ Workflow run failed: %s", e, exc_info=True)
+                results.append(None)
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait)
+                self._pool = None
@@ -0,0 +1,82 @@
+import os
+import sys
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+from Vincius.Core import run_context
+
+ROOT_LOGGER = "Vincius"
+TEXT_FORMAT = "%(message)s"
+VERBOSE_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+# Attributes every LogRecord has; anything else came in through `extra=`
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line for log shippers"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        context = run_context.current()
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage().strip(),
+            "run_id": context.run_id,
+            "step": context.step,
+            "agent_type": context.agent_type,
+            "agent_uuid": context.agent_uuid
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _RESERVED})
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+def get_logger(name: str) -> logging.Logger:
+    """Get a logger below the Vincius root; pass the module's __name__"""
+    if name != ROOT_LOGGER and not name.startswith(ROOT_LOGGER + "."):
+        name = f"{ROOT_LOGGER}.{name}"
+    return logging.getLogger(name)
+
+def _level(value: Any, default: int = logging.INFO) -> int:
+    if isinstance(value, int):
+        return value
+    return logging.getLevelName(str(value).upper()) if value else default
+
+def configure_logging(settings: Optional[Dict[str, Any]] = None) -> None:
+    """Apply the LOGGING config section; environment variables take priority.
+
+    Keys: level, format (text, verbose or json), quiet, file and modules, a map of
+    logger names (e.g. Vincius.Core.file_system_manager) to their own level.
+    """
+    settings = settings or {}
+    root = logging.getLogger(ROOT_LOGGER)
+
+    quiet = os.environ.get('VINCIUS_QUIET', str(settings.get('quiet', False))).lower() in ('1', 'true', 'yes')
+    level = _level(os.environ.get('VINCIUS_LOG_LEVEL') or settings.get('level'))
+    if quiet:
+        level = max(level, logging.WARNING)
+    root.setLevel(level)
+    root.propagate = False
+
+    log_format = os.environ.get('VINCIUS_LOG_FORMAT') or settings.get('format', 'text')
+    if log_format == 'json':
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(VERBOSE_FORMAT if log_format == 'verbose' else TEXT_FORMAT)
+
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if settings.get('file'):
+        handlers.append(logging.FileHandler(settings['file'], encoding='utf-8'))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+
+    for name, module_level in (settings.get('modules') or {}).items():
+        get_logger(name).setLevel(_level(module_level))
+
+# Usable before the config file is read; ConfigManager re-applies its LOGGING section
+configure_logging()
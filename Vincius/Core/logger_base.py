@@ -1,31 +1,43 @@
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import hashlib
 from Vincius.Core.config_manager import ConfigManager  # Add this import
+from Vincius.Core import run_context
+from Vincius.Core.task_executor import TaskExecutor
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+def hash_content(content: str) -> str:
+    """Calculate hash of file content"""
+    return hashlib.md5(content.encode('utf-8')).hexdigest()
 
 class LoggerBase:
+    _write_lock = threading.Lock()  # Serializes read-modify-write of log files across concurrent runs
+
     def __init__(self, base_path: Path, agent_type: str, agent_uuid: str = None):
         """Initialize logger with specific agent type and UUID"""
         self.agent_type = agent_type
         self.agent_uuid = agent_uuid or "unknown"
         config = ConfigManager()
-        logs_dir = config.base_path / config.get('PATHS.logs_dir', 'Logs')  # Use config for logs directory
+        logs_dir = run_context.workspace_path() / config.get('PATHS.logs_dir', 'Logs')  # Use config for logs directory
         
         self.log_dir = logs_dir / agent_type  # Create agent-specific directory
         self.log_file = self.log_dir / f"{agent_type.lower()}_logs.json" # Name log file correctly
         self._initialize_log_directory()
-        print(f"📝 {agent_type} logs will be saved to: {self.log_file}")
+        logger.info("📝 %s logs will be saved to: %s", agent_type, self.log_file)
 
     def _initialize_log_directory(self):
         try:
             self.log_dir.mkdir(parents=True, exist_ok=True)
             if not self.log_file.exists():
                 self._write_log_file([])
-                print(f"✅ Initialized new log file at: {self.log_file}")
+                logger.info("✅ Initialized new log file at: %s", self.log_file)
         except Exception as e:
-            print(f"❌ Error initializing log directory: {e}")
+            logger.error("❌ Error initializing log directory: %s", e)
             raise
 
     def _read_log_file(self) -> List[Dict[str, Any]]:
@@ -37,21 +49,23 @@ class LoggerBase:
     def _write_log_file(self, logs: List[Dict[str, Any]]):
         self.log_file.write_text(json.dumps(logs, indent=2), encoding='utf-8')
 
-    def _get_file_version(self, file_path: str, content: str) -> int:
+    def _get_file_version(self, file_path: str, content: str, logs: List[Dict[str, Any]] = None) -> int:
         """Get the next version number for a file"""
-        logs = self._read_log_file()
+        if logs is None:
+            logs = self._read_log_file()
         versions = [log.get('version', 1) for log in logs 
                    if log['file_path'] == file_path]
         return max(versions, default=0) + 1
 
     def _calculate_hash(self, content: str) -> str:
         """Calculate hash of file content"""
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        return hash_content(content)
 
-    def log_file_creation(self, file_path: Path, description: str = "", 
-                         is_modification: bool = False, content: str = ""):
-        """Log a file creation or modification event with version control"""
-        logs = self._read_log_file()
+    def _build_log_entry(self, logs: List[Dict[str, Any]], file_path: Path, description: str = "",
+                         is_modification: bool = False, content: str = "",
+                         precomputed_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Build a log entry against already loaded logs, or None if the content is already logged"""
+        file_path = Path(file_path)
         file_path_str = str(file_path)
         
         # Get file content if not provided
@@ -59,19 +73,22 @@ class LoggerBase:
             content = file_path.read_text(encoding='utf-8')
 
         # Calculate content hash
-        content_hash = self._calculate_hash(content) if content else ""
+        if precomputed_hash is not None:
+            content_hash = precomputed_hash
+        else:
+            content_hash = self._calculate_hash(content) if content else ""
         
         # Check if this exact content was already logged
         for log in logs:
             if (log['file_path'] == file_path_str and 
                 log.get('content_hash') == content_hash):
-                print(f"⚠️ Skipping log: identical content already exists")
-                return
+                logger.warning("⚠️ Skipping log: identical content already exists")
+                return None
 
         # Get next version number
-        version = self._get_file_version(file_path_str, content)
+        version = self._get_file_version(file_path_str, content, logs)
         
-        log_entry = {
+        return {
             "timestamp": datetime.now().isoformat(),
             "file_path": file_path_str,
             "operation": "modification" if is_modification else "creation",
@@ -81,13 +98,59 @@ class LoggerBase:
             "content_hash": content_hash,
             "agent_uuid": self.agent_uuid  # Add agent UUID to the log entry
         }
-        
-        logs.append(log_entry)
-        self._write_log_file(logs)
-        print(f"📝 Logged {log_entry['operation']} of {file_path_str} (v{version}) by agent {self.agent_uuid[:8]}")
+
+    def log_file_creation(self, file_path: Path, description: str = "", 
+                         is_modification: bool = False, content: str = ""):
+        """Log a file creation or modification event with version control"""
+        with self._write_lock:
+            logs = self._read_log_file()
+            log_entry = self._build_log_entry(logs, file_path, description, is_modification, content)
+            if not log_entry:
+                return
+            
+            logs.append(log_entry)
+            self._write_log_file(logs)
+        logger.debug("📝 Logged %s of %s (v%s) by agent %s",
+                     log_entry['operation'], log_entry['file_path'], log_entry['version'], self.agent_uuid[:8])
+
+    def log_file_creations(self, entries: List[Dict[str, Any]]):
+        """Log several file events with a single read and write of the log file"""
+        # Hash the batch on the task executor before taking the lock
+        contents = [entry.get('content', '') for entry in entries]
+        hashes = TaskExecutor().map(hash_content, contents) if all(contents) else [None] * len(entries)
+        entries = [{**entry, 'precomputed_hash': hashed} for entry, hashed in zip(entries, hashes)]
+
+        with self._write_lock:
+            logs = self._read_log_file()
+            added = 0
+            
+            for entry in entries:
+                log_entry = self._build_log_entry(logs, **entry)
+                if log_entry:
+                    logs.append(log_entry)
+                    added += 1
+
+            if added:
+                self._write_log_file(logs)
+            logger.info("📝 Logged %s file operations by agent %s", added, self.agent_uuid[:8])
 
     def get_file_history(self, file_path: str) -> List[Dict[str, Any]]:
         """Get version history of a specific file"""
         logs = self._read_log_file()
         history = [log for log in logs if log["file_path"] == file_path]
         return sorted(history, key=lambda x: x.get('version', 1))
+
+    @staticmethod
+    def collect_latest_entries(logs_root: Path) -> Dict[str, Dict[str, Any]]:
+        """Get the newest log entry per file path across every agent's log"""
+        latest = {}
+        for log_file in Path(logs_root).glob('*/*_logs.json'):
+            try:
+                logs = json.loads(log_file.read_text(encoding='utf-8'))
+            except (OSError, json.JSONDecodeError):
+                continue
+            for log in logs:
+                current = latest.get(log.get('file_path'))
+                if current is None or log.get('timestamp', '') > current.get('timestamp', ''):
+                    latest[log.get('file_path')] = log
+        return latest
@@ -0,0 +1,221 @@
+import json
+import time
+import uuid
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+from Vincius.Core.config_manager import ConfigManager
+from Vincius.Core import run_context
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+UNATTRIBUTED_RUN = "unattributed"
+
+class MetricsRecorder:
+    """Collects per-call model metrics, appends them to a JSONL file and aggregates them per step.
+
+    Totals are kept per run; calls are attributed to the run in the caller's run
+    context, so concurrent workflows in one process do not mix their numbers.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(MetricsRecorder, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        self._lock = threading.Lock()
+        self._runs: Dict[str, Dict[str, Any]] = {}
+        self.logs_dir = ConfigManager().get('PATHS', {}).get('logs_dir', 'Logs')
+        self.run_id: Optional[str] = None  # Set by start_run(); the workflow entry point starts each run
+
+    def start_run(self, run_id: Optional[str] = None) -> str:
+        """Begin a run; calls made under its run context are aggregated and written under it"""
+        run_id = run_id or f"{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:6]}"
+        with self._lock:
+            self._runs[run_id] = self._new_run()
+            self.run_id = run_id  # Default for calls made outside any run context
+        return run_id
+
+    def finish_run(self, run_id: Optional[str] = None) -> None:
+        """Drop the in-memory totals of a finished run"""
+        with self._lock:
+            run_id = self._active_run(run_id)
+            self._runs.pop(run_id, None)
+            if self.run_id == run_id:
+                self.run_id = None
+
+    @staticmethod
+    def _new_run() -> Dict[str, Any]:
+        return {"step": None, "started": time.perf_counter(), "steps": {}, "order": []}
+
+    def _active_run(self, run_id: Optional[str] = None) -> str:
+        # Calls made before any run started, e.g. by an agent used on its own, are kept apart
+        return run_id or run_context.current().run_id or self.run_id or UNATTRIBUTED_RUN
+
+    def _run_state(self, run_id: str) -> Dict[str, Any]:
+        state = self._runs.get(run_id)
+        if state is None:
+            state = self._runs[run_id] = self._new_run()
+        return state
+
+    @property
+    def metrics_dir(self) -> Path:
+        """Metrics directory of the caller's run workspace"""
+        return run_context.workspace_path() / self.logs_dir / 'Metrics'
+
+    def metrics_file_for(self, run_id: Optional[str] = None) -> Path:
+        return self.metrics_dir / f"{self._active_run(run_id)}.jsonl"
+
+    @property
+    def metrics_file(self) -> Path:
+        return self.metrics_file_for()
+
+    def set_step(self, step: Optional[str], run_id: Optional[str] = None) -> None:
+        """Attribute the following calls of a run to a workflow step"""
+        with self._lock:
+            self._run_state(self._active_run(run_id))["step"] = step
+
+    def record_call(self, model: str, prompt_tokens: int, response_tokens: int, latency: float,
+                    attempts: int = 1, backoff_seconds: float = 0.0, cache: str = "none",
+                    success: bool = True, estimated: bool = False, error: Optional[str] = None,
+                    limits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Store one model call and fold it into the step totals of the caller's run"""
+        context = run_context.current()
+        run_id = self._active_run()
+        with self._lock:
+            step = context.step or self._run_state(run_id)["step"]
+        record = {
+            "timestamp": datetime.now().isoformat(),
+            "run_id": run_id,
+            "step": step,
+            "agent_type": context.agent_type,
+            "agent_uuid": context.agent_uuid,
+            "model": model,
+            "prompt_tokens": prompt_tokens,
+            "response_tokens": response_tokens,
+            "total_tokens": prompt_tokens + response_tokens,
+            "tokens_estimated": estimated,
+            "latency": round(latency, 4),
+            "attempts": attempts,
+            "retries": max(0, attempts - 1),
+            "backoff_seconds": round(backoff_seconds, 3),
+            "cache": cache,
+            "success": success,
+            "error": error,
+            "limits": limits
+        }
+
+        with self._lock:
+            state = self._run_state(run_id)
+            self._aggregate(state, record)
+            if limits:
+                state["limits"] = limits
+            try:
+                metrics_file = self.metrics_file_for(run_id)
+                metrics_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(metrics_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record) + "\n")
+            except OSError as e:
+                logger.warning("⚠️ Unable to write metrics: %s", e)
+        return record
+
+    def _aggregate(self, state: Dict[str, Any], record: Dict[str, Any]) -> None:
+        step = record["step"] or "(no step)"
+        totals = state["steps"].get(step)
+        if totals is None:
+            totals = state["steps"][step] = {
+                "calls": 0, "failed": 0, "cache_hits": 0, "coalesced": 0, "prompt_tokens": 0, "response_tokens": 0,
+                "latency": 0.0, "retries": 0, "backoff_seconds": 0.0, "models": {}
+            }
+            state["order"].append(step)
+
+        totals["calls"] += 1
+        totals["failed"] += 0 if record["success"] else 1
+        totals["cache_hits"] += 1 if record["cache"] == "hit" else 0
+        totals["coalesced"] += 1 if record["cache"] == "coalesced" else 0
+        totals["prompt_tokens"] += record["prompt_tokens"]
+        totals["response_tokens"] += record["response_tokens"]
+        totals["latency"] += record["latency"]
+        totals["retries"] += record["retries"]
+        totals["backoff_seconds"] += record["backoff_seconds"]
+        totals["models"][record["model"]] = totals["models"].get(record["model"], 0) + 1
+
+    def step_totals(self, run_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Get aggregated metrics per step in execution order"""
+        with self._lock:
+            state = self._runs.get(self._active_run(run_id))
+            if state is None:
+                return {}
+            return {step: {**state["steps"][step], "models": dict(state["steps"][step]["models"])}
+                    for step in state["order"]}
+
+    def run_totals(self, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get aggregated metrics for the whole run"""
+        run_id = self._active_run(run_id)
+        steps = self.step_totals(run_id)
+        keys = ("calls", "failed", "cache_hits", "coalesced", "prompt_tokens", "response_tokens",
+                "latency", "retries", "backoff_seconds")
+        totals = {key: sum(step[key] for step in steps.values()) for key in keys}
+        totals["run_id"] = run_id
+        with self._lock:
+            state = self._runs.get(run_id)
+        totals["wall_time"] = time.perf_counter() - state["started"] if state else 0.0
+        totals["limits"] = state.get("limits") if state else None  # Model limits after the latest call
+        return totals
+
+    def write_summary(self, run_id: Optional[str] = None) -> Optional[Path]:
+        """Write step and run totals next to the per-call file"""
+        run_id = self._active_run(run_id)
+        steps = self.step_totals(run_id)
+        if not steps:
+            return None
+        summary_path = self.metrics_dir / f"{run_id}_summary.json"
+        try:
+            summary_path.parent.mkdir(parents=True, exist_ok=True)
+            summary = {"run": self.run_totals(run_id), "steps": steps}
+            summary_path.write_text(json.dumps(summary, indent=2), encoding='utf-8')
+        except OSError as e:
+            logger.warning("⚠️ Unable to write metrics summary: %s", e)
+            return None
+        return summary_path
+
+    def print_summary(self, run_id: Optional[str] = None) -> None:
+        """Print a per-step cost table, most expensive steps first"""
+        run_id = self._active_run(run_id)
+        steps = self.step_totals(run_id)
+        if not steps:
+            return
+        run = self.run_totals(run_id)
+
+        logger.info("\n📊 Model usage by step:")
+        row = "  %-24s %5s %9s %9s %8.1fs %7s %7.0fs"
+        logger.info("  %-24s %5s %9s %9s %9s %7s %8s", 'Step', 'Calls', 'Prompt', 'Response', 'Latency', 'Retries', 'Backoff')
+        ranked = sorted(steps.items(), key=lambda item: item[1]["prompt_tokens"] + item[1]["response_tokens"], reverse=True)
+        for step, totals in ranked:
+            logger.info(row, step[:24], totals['calls'], totals['prompt_tokens'], totals['response_tokens'],
+                        totals['latency'], totals['retries'], totals['backoff_seconds'])
+        logger.info(row, 'Total', run['calls'], run['prompt_tokens'], run['response_tokens'],
+                    run['latency'], run['retries'], run['backoff_seconds'])
+        if run.get("limits"):
+            logger.info("🎚️ Model limits: %s", ", ".join(f"{key} {value}" for key, value in run["limits"].items()))
+        logger.info("📁 Metrics written to: %s", self.metrics_file_for(run_id))
+
+def usage_from_response(response: Any) -> Optional[Dict[str, int]]:
+    """Read token counts from the SDK usage metadata, if the response carries any"""
+    usage = getattr(response, 'usage_metadata', None)
+    if usage is None:
+        return None
+    prompt_tokens = getattr(usage, 'prompt_token_count', None)
+    response_tokens = getattr(usage, 'candidates_token_count', None)
+    if prompt_tokens is None and response_tokens is None:
+        return None
+    return {"prompt_tokens": prompt_tokens or 0, "response_tokens": response_tokens or 0}
@@ -0,0 +1,290 @@
+import re
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+from Vincius.Core.semantic_cache import DEFAULT_VOLATILE_PATTERNS, normalize_prompt
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+genai = None  # google.generativeai, imported on first use by _load_genai()
+
+def _load_genai():
+    """Import the Generative AI SDK only when a model is actually needed.
+
+    It is by far the slowest import in the project, and workflows that never call
+    the model (e.g. direct API requests or replayed runs) should not pay for it.
+    """
+    global genai
+    if genai is None:
+        import google.generativeai
+        genai = google.generativeai
+    return genai
+
+class NonRetryableError(Exception):
+    """A backend failure that retrying the same prompt cannot fix"""
+
+class ReplayMissError(NonRetryableError):
+    """Replay mode found no recorded response for a prompt"""
+
+def archived_response(text: str, prompt_tokens: Optional[int] = None,
+                      response_tokens: Optional[int] = None) -> Any:
+    """Build an object shaped like an SDK response: .text and .usage_metadata"""
+    usage = None
+    if prompt_tokens is not None or response_tokens is not None:
+        usage = SimpleNamespace(prompt_token_count=prompt_tokens, candidates_token_count=response_tokens)
+    return SimpleNamespace(text=text, usage_metadata=usage)
+
+class ModelBackend:
+    """Produces a response for a prompt under a model name and generation config"""
+
+    name = "base"
+
+    def generate(self, prompt: str, model_name: str, generation_config: Dict[str, Any]) -> Any:
+        raise NotImplementedError("Backends must implement generate")
+
+    def warm_up(self, model_name: str, generation_config: Dict[str, Any]) -> None:
+        """Prepare whatever the first call would otherwise pay for"""
+
+    def close(self) -> None:
+        pass
+
+class LiveBackend(ModelBackend):
+    """Calls Gemini, keeping one client per distinct model config"""
+
+    name = "live"
+
+    def __init__(self, api_key: Optional[str], safety_settings: Any = None):
+        self.safety_settings = safety_settings
+        self._models: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+        logger.info("🔄 Initializing Google Generative AI...")
+        _load_genai().configure(api_key=api_key)
+
+    def _get_model(self, model_name: str, generation_config: Dict[str, Any]) -> Any:
+        key = (model_name, tuple(sorted(generation_config.items())))
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = self._models[key] = self._create_model(model_name, generation_config)
+        return model
+
+    def _create_model(self, model_name: str, generation_config: Dict[str, Any]) -> Any:
+        """Initialize a model client; the caller's config is never modified"""
+        try:
+            model = _load_genai().GenerativeModel(
+                model_name=model_name,
+                generation_config=generation_config,
+                safety_settings=self.safety_settings
+            )
+            logger.info("✅ Model %s initialized successfully", model_name)
+            return model
+        except Exception as e:
+            logger.error("❌ Error initializing model: %s", e)
+            raise
+
+    def warm_up(self, model_name: str, generation_config: Dict[str, Any]) -> None:
+        self._get_model(model_name, generation_config)
+
+    def generate(self, prompt: str, model_name: str, generation_config: Dict[str, Any]) -> Any:
+        return self._get_model(model_name, generation_config).generate_content(prompt)
+
+class ResponseArchive:
+    """Compact, indexed store of prompt/response pairs in SQLite.
+
+    Rows are keyed by a hash of the model, generation config and normalised
+    prompt, so volatile fields such as timestamps do not defeat replay. Prompt
+    and response text are stored zlib-compressed.
+    """
+
+    def __init__(self, path: Path, volatile_patterns: Optional[List[str]] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        patterns = DEFAULT_VOLATILE_PATTERNS if volatile_patterns is None else volatile_patterns
+        self.volatile_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                prompt BLOB NOT NULL,
+                response BLOB NOT NULL,
+                prompt_tokens INTEGER,
+                response_tokens INTEGER,
+                latency REAL NOT NULL,
+                recorded_at REAL NOT NULL
+            )""")
+        self._db.commit()
+
+    def key(self, prompt: str, model_name: str, generation_config: Dict[str, Any]) -> str:
+        normalized = normalize_prompt(prompt, self.volatile_patterns)
+        material = f"{model_name}|{sorted(generation_config.items())}|{normalized}"
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def put(self, key: str, model_name: str, prompt: str, response: str, latency: float,
+            prompt_tokens: Optional[int] = None, response_tokens: Optional[int] = None) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, model_name, zlib.compress(prompt.encode('utf-8')), zlib.compress(response.encode('utf-8')),
+                 prompt_tokens, response_tokens, latency, time.time())
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response, prompt_tokens, response_tokens, latency FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"response": zlib.decompress(row[0]).decode('utf-8'), "prompt_tokens": row[1],
+                "response_tokens": row[2], "latency": row[3]}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+class RecordBackend(ModelBackend):
+    """Calls another backend and archives every successful exchange"""
+
+    name = "record"
+
+    def __init__(self, inner: ModelBackend, archive: ResponseArchive):
+        self.inner = inner
+        self.archive = archive
+
+    def warm_up(self, model_name: str, generation_config: Dict[str, Any]) -> None:
+        self.inner.warm_up(model_name, generation_config)
+
+    def generate(self, prompt: str, model_name: str, generation_config: Dict[str, Any]) -> Any:
+        started = time.perf_counter()
+        response = self.inner.generate(prompt, model_name, generation_config)
+        latency = time.perf_counter() - started
+
+        text = getattr(response, 'text', None)
+        if isinstance(text, str) and text.strip():
+            usage = getattr(response, 'usage_metadata', None)
+            self.archive.put(
+                self.archive.key(prompt, model_name, generation_config), model_name, prompt, text, latency,
+                getattr(usage, 'prompt_token_count', None), getattr(usage, 'candidates_token_count', None)
+            )
+        return response
+
+    def close(self) -> None:
+        self.archive.close()
+
+class ReplayBackend(ModelBackend):
+    """Serves archived responses without network access.
+
+    latency is "recorded" to sleep as long as the original call took (scaled by
+    latency_scale), or a fixed number of seconds; 0 replays instantly. Unknown
+    prompts raise ReplayMissError, or fall back to the stub backend when given.
+    """
+
+    name = "replay"
+
+    def __init__(self, archive: ResponseArchive, latency: Any = 0, latency_scale: float = 1.0,
+                 fallback: Optional[ModelBackend] = None):
+        self.archive = archive
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self.fallback = fallback
+
+    def _delay(self, recorded: float) -> float:
+        if self.latency == "recorded":
+            return recorded * self.latency_scale
+        return float(self.latency or 0)
+
+    def generate(self, prompt: str, model_name: str, generation_config: Dict[str, Any]) -> Any:
+        entry = self.archive.get(self.archive.key(prompt, model_name, generation_config))
+        if entry is None:
+            if self.fallback is not None:
+                logger.warning("⚠️ No recorded response for this prompt, using %s backend", self.fallback.name)
+                return self.fallback.generate(prompt, model_name, generation_config)
+            raise ReplayMissError(f"No recorded response for prompt ({len(prompt)} chars) on {model_name}")
+
+        delay = self._delay(entry["latency"])
+        if delay > 0:
+            time.sleep(delay)
+        return archived_response(entry["response"], entry["prompt_tokens"], entry["response_tokens"])
+
+    def close(self) -> None:
+        self.archive.close()
+
+class StubBackend(ModelBackend):
+    """Returns canned FILE: outputs so workflows run end to end with no model.
+
+    responses is a list of {match: regex, response: text}; the first pattern found
+    in the prompt wins. Otherwise a single generic file section is returned, named
+    after the first concrete FILE: path in the prompt when there is one.
+    """
+
+    name = "stub"
+
+    DEFAULT_RESPONSE = """FILE: {path}
+Type: {file_type}
+Description: Stub output generated offline
+Content:
+{content}
+"""
+
+    def __init__(self, responses: Optional[List[Dict[str, str]]] = None, latency: float = 0.0):
+        self.responses = [(re.compile(item['match'], re.IGNORECASE | re.DOTALL), item['response'])
+                          for item in (responses or []) if item.get('match') and 'response' in item]
+        self.latency = float(latency or 0)
+
+    def _default(self, prompt: str) -> str:
+        paths = [match.strip() for match in re.findall(r'FILE:[ \t]*([^\s\[\]{}]+)', prompt)
+                 if not match.startswith('path/to/')]
+        digest = hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:8]
+        path = paths[0] if paths else f"stub/output_{digest}.md"
+        file_type = path.rsplit('.', 1)[-1] if '.' in path else 'text'
+        comment = '#' if file_type in ('py', 'sh', 'yaml', 'yml', 'rb') else '//' if file_type in (
+            'js', 'ts', 'java', 'go', 'php', 'c', 'cpp', 'cs') else ''
+        content = f"{comment} Stub content generated without a model call.".strip()
+        return self.DEFAULT_RESPONSE.format(path=path, file_type=file_type, content=content)
+
+    def generate(self, prompt: str, model_name: str, generation_config: Dict[str, Any]) -> Any:
+        if self.latency:
+            time.sleep(self.latency)
+        for pattern, response in self.responses:
+            if pattern.search(prompt):
+                return archived_response(response)
+        return archived_response(self._default(prompt))
+
+BACKEND_MODES = ('live', 'record', 'replay', 'stub')
+
+def create_backend(settings: Dict[str, Any], api_key: Optional[str], safety_settings: Any,
+                   state_path: Path) -> ModelBackend:
+    """Build the backend selected by the MODEL_BACKEND config section"""
+    mode = settings.get('mode', 'live')
+    if mode not in BACKEND_MODES:
+        raise ValueError(f"Unknown model backend mode: {mode} (expected one of {', '.join(BACKEND_MODES)})")
+
+    def stub() -> StubBackend:
+        return StubBackend(settings.get('stub_responses'), settings.get('stub_latency', 0.0))
+
+    if mode == 'live':
+        return LiveBackend(api_key, safety_settings)
+    if mode == 'stub':
+        return stub()
+
+    archive = ResponseArchive(state_path / settings.get('archive', 'model_archive.sqlite'),
+                              settings.get('volatile_patterns'))
+    if mode == 'record':
+        return RecordBackend(LiveBackend(api_key, safety_settings), archive)
+
+    logger.info("📼 Replaying %s recorded responses from %s", len(archive), archive.path)
+    fallback = stub() if settings.get('replay_miss', 'error') == 'stub' else None
+    return ReplayBackend(archive, settings.get('replay_latency', 0), settings.get('latency_scale', 1.0), fallback)
@@ -0,0 +1,163 @@
+import math
+import time
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from Vincius.Core.model_backends import ModelBackend
+from Vincius.Core.tracing import span
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+THROTTLE_MARKERS = ('429', 'quota', 'resource exhausted', 'resource_exhausted', 'rate limit')
+
+def is_throttled(error: Exception) -> bool:
+    """Whether an error means the model is rate limited or out of quota"""
+    message = str(error).lower()
+    return any(marker in message for marker in THROTTLE_MARKERS)
+
+class Route:
+    """One model the router can send calls to, with its observed latency and throttle state"""
+
+    def __init__(self, name: str, model: str, backend: ModelBackend,
+                 max_prompt_tokens: Optional[int] = None, window: int = 50, failover_only: bool = False):
+        self.name = name
+        self.model = model
+        self.backend = backend
+        self.max_prompt_tokens = max_prompt_tokens
+        self.failover_only = failover_only  # Stand-in (e.g. a stub) used only while the real routes cool down
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.cooldown_until = 0.0
+        self.throttles = 0
+
+    def p95(self) -> Optional[float]:
+        """95th percentile of recent successful call latencies, None before any call"""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def cooling(self, now: Optional[float] = None) -> bool:
+        return (now or time.monotonic()) < self.cooldown_until
+
+    def fits(self, prompt_tokens: int) -> bool:
+        return not self.max_prompt_tokens or prompt_tokens <= self.max_prompt_tokens
+
+class ModelRouter:
+    """Chooses a model per call and fails over when one is throttled.
+
+    Candidates come from the step config: `routes` limits the call to the named
+    routes, otherwise every route is eligible and one serving the step's `model`
+    goes first. Routes whose max_prompt_tokens the prompt exceeds are skipped,
+    and the rest are ordered by observed p95 latency; routes without samples go
+    first so every route gets measured. Failover-only routes rank after every
+    route that is not cooling down, however fast they are. A throttled route cools
+    down and the call moves to the next candidate immediately, without backing off.
+
+    With no routes configured, each call goes to the step's model on the default
+    backend, as before routing existed.
+    """
+
+    def __init__(self, routes: List[Route], default_backend: ModelBackend, cooldown_seconds: float = 60.0):
+        self.routes = {route.name: route for route in routes}
+        self.default_backend = default_backend
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._implicit: Dict[str, Route] = {}
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any], default_backend: ModelBackend,
+                    backend_factory: Callable[[str], ModelBackend]) -> 'ModelRouter':
+        """Build routes from MODEL_ROUTER; a route's `backend` picks a mode other than the default"""
+        window = settings.get('latency_window', 50)
+        backends: Dict[str, ModelBackend] = {}
+        routes = []
+        for name, route in (settings.get('routes') or {}).items():
+            mode = route.get('backend')
+            if mode and mode not in backends:
+                backends[mode] = backend_factory(mode)
+            routes.append(Route(name, route['model'], backends[mode] if mode else default_backend,
+                                route.get('max_prompt_tokens'), window, bool(route.get('failover_only'))))
+        if routes:
+            logger.info("🧭 Model router with routes: %s", ", ".join(route.name for route in routes))
+        return cls(routes, default_backend, settings.get('cooldown_seconds', 60.0))
+
+    def _implicit_route(self, model: str) -> Route:
+        with self._lock:
+            route = self._implicit.get(model)
+            if route is None:
+                route = self._implicit[model] = Route(model, model, self.default_backend)
+            return route
+
+    def candidates(self, model_config: Dict[str, Any], model_name: str, prompt_tokens: int) -> List[Route]:
+        """Routes to try for one call, best first"""
+        if not self.routes:
+            return [self._implicit_route(model_name)]
+
+        names = model_config.get('routes')
+        if isinstance(names, str):
+            names = [names]
+        eligible = [self.routes[name] for name in names if name in self.routes] if names else list(self.routes.values())
+        if not eligible:
+            logger.warning("⚠️ None of the step routes %s exist, using all routes", names)
+            eligible = list(self.routes.values())
+
+        fitting = [route for route in eligible if route.fits(prompt_tokens)]
+        if not fitting:
+            # Nothing is rated for a prompt this large; the largest route has the best chance
+            fitting = [max(eligible, key=lambda route: route.max_prompt_tokens or math.inf)]
+
+        now = time.monotonic()
+        with self._lock:
+            def rank(route: Route) -> Tuple:
+                p95 = route.p95()
+                return (route.cooling(now), route.failover_only, route.model != model_config.get('model'),
+                        p95 is not None, p95 or 0.0)
+            return sorted(fitting, key=rank)
+
+    def generate(self, prompt: str, model_config: Dict[str, Any], model_name: str,
+                 generation_config: Dict[str, Any], prompt_tokens: int) -> Tuple[Any, Route]:
+        """Send the prompt to the best route, failing over to the next one when throttled"""
+        routes = self.candidates(model_config, model_name, prompt_tokens)
+        last_error: Optional[Exception] = None
+        for route in routes:
+            started = time.perf_counter()
+            try:
+                with span(f"route {route.name}", "model", model=route.model):
+                    response = route.backend.generate(prompt, route.model, generation_config)
+            except Exception as e:
+                last_error = e
+                if not is_throttled(e) or len(routes) == 1:
+                    raise
+                self.mark_throttled(route)
+                logger.warning("🔀 %s throttled, failing over: %s", route.name, e)
+                continue
+            self.record_latency(route, time.perf_counter() - started)
+            return response, route
+        raise last_error
+
+    def record_latency(self, route: Route, latency: float) -> None:
+        with self._lock:
+            route.latencies.append(latency)
+            route.throttles = 0
+
+    def mark_throttled(self, route: Route) -> None:
+        with self._lock:
+            route.throttles += 1
+            # Repeated throttling backs the route off for longer, capped at ten cooldowns
+            route.cooldown_until = time.monotonic() + self.cooldown_seconds * min(route.throttles, 10)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Observed latency and throttle state per route"""
+        with self._lock:
+            routes = list(self.routes.values()) or list(self._implicit.values())
+            return {
+                route.name: {
+                    "model": route.model,
+                    "samples": len(route.latencies),
+                    "p95": route.p95(),
+                    "cooling": route.cooling(),
+                    "throttles": route.throttles
+                }
+                for route in routes
+            }
@@ -0,0 +1,82 @@
+import re
+from typing import List, Optional, Sequence
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+_PATH = r'[\w\-./]+\.[A-Za-z0-9]{1,8}'
+
+# A path announced right before a fenced block: "### src/app.py", "**File:** `app.py`", "app.py:"
+_HEADED_BLOCK = re.compile(
+    r'^[ \t]*(?:#{1,6}[ \t]*|\*\*|__|[-*][ \t]+)?(?:(?:file(?:name)?|path)[ \t]*:?[ \t]*)?(?:\*\*|__)?[ \t]*`?'
+    r'(?P<path>' + _PATH + r')`?[ \t]*(?:\*\*|__)?:?[ \t]*\n+'
+    r'[ \t]*```[\w+\-]*[ \t]*\n(?P<body>.*?)\n[ \t]*```',
+    re.IGNORECASE | re.MULTILINE | re.DOTALL
+)
+
+# A fenced block whose first line names the file in a comment: "# app.py", "// app.js", "<!-- index.html -->"
+_COMMENTED_BLOCK = re.compile(
+    r'```[\w+\-]*[ \t]*\n[ \t]*(?:#|//|/\*|<!--|--)[ \t]*(?:file(?:name)?|path)?[ \t]*:?[ \t]*'
+    r'(?P<path>' + _PATH + r')[ \t]*(?:\*/|-->)?[ \t]*\n(?P<body>.*?)\n[ \t]*```',
+    re.IGNORECASE | re.DOTALL
+)
+
+_ANY_BLOCK = re.compile(r'```[\w+\-]*[ \t]*\n(?P<body>.*?)\n[ \t]*```', re.DOTALL)
+
+def format_file_blocks(files: Sequence[tuple]) -> str:
+    """Render (path, content) pairs in the FILE: format the parser expects"""
+    return "\n".join(f"FILE: {path}\nDescription: Recovered from unstructured output\nContent:\n{body.strip()}\n"
+                     for path, body in files)
+
+def expected_paths(prompt: Optional[str]) -> List[str]:
+    """Concrete FILE: paths a prompt asked for, ignoring placeholders like path/to/file.ext"""
+    if not prompt:
+        return []
+    paths = []
+    for match in re.findall(r'FILE:[ \t]*([^\s\[\]{}]+)', prompt):
+        if not match.startswith('path/to/') and match not in paths:
+            paths.append(match)
+    return paths
+
+def repair_locally(content: str, paths: Sequence[str] = ()) -> Optional[str]:
+    """Rewrite common near-miss formats into FILE: blocks, or None when nothing is recoverable.
+
+    Handles files announced by a heading, bold text or list item before a fenced
+    block, fenced blocks that name their file in a first-line comment, and a
+    fenced block when the prompt asked for exactly one file. Bare text is never
+    taken as file content: a prose reply must not overwrite the file it discusses.
+    """
+    if not content or not content.strip():
+        return None
+
+    for pattern in (_HEADED_BLOCK, _COMMENTED_BLOCK):
+        files = [(match.group('path'), match.group('body')) for match in pattern.finditer(content)]
+        if files:
+            logger.info("🩹 Recovered %s file sections locally", len(files))
+            return format_file_blocks(files)
+
+    if len(paths) == 1:
+        blocks = [match.group('body') for match in _ANY_BLOCK.finditer(content)]
+        if blocks:
+            logger.info("🩹 Treating the largest code block as the content of %s", paths[0])
+            return format_file_blocks([(paths[0], max(blocks, key=len))])
+
+    return None
+
+def reformat_prompt(content: str, paths: Sequence[str] = ()) -> str:
+    """Short prompt asking only to restructure an existing answer, not to redo the work"""
+    expected = f"\nThe files expected are: {', '.join(paths)}\n" if paths else ""
+    return f"""
+The text below contains file contents but is not in the required format.
+Reformat it into FILE: blocks. Do not change, add or remove any code.
+{expected}
+Use exactly this format for every file:
+
+FILE: path/to/file.ext
+Description: Brief description
+Content:
+[file content, unchanged]
+
+TEXT TO REFORMAT:
+{content}
+"""
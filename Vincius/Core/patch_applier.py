@@ -0,0 +1,216 @@
+import re
+from difflib import SequenceMatcher
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+_FILE_LINE = re.compile(r'^FILE:[ \t]*`?([^\s`]+)`?')
+_HUNK_HEADER = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+\d+(?:,(\d+))? @@')
+_SEARCH = re.compile(r'^<{5,}[ \t]*SEARCH[ \t]*$')
+_DIVIDER = re.compile(r'^={5,}[ \t]*$')
+_REPLACE = re.compile(r'^>{5,}[ \t]*REPLACE[ \t]*$')
+
+class PatchError(ValueError):
+    """A patch could not be parsed or one of its hunks did not match the file"""
+
+class Hunk(NamedTuple):
+    path: Optional[str]
+    old: List[str]                 # Lines to find: context plus removed lines
+    new: List[str]                 # Lines that replace them: context plus added lines
+    line_hint: Optional[int] = None  # 1-based start line from a unified diff header
+
+    def describe(self) -> str:
+        where = f" near line {self.line_hint}" if self.line_hint else ""
+        first = next((line.strip() for line in self.old if line.strip()), "<insertion>")
+        return f"hunk in {self.path}{where} ({first[:60]})"
+
+def _diff_path(header: str) -> Optional[str]:
+    """Path from a ---/+++ header line, without a/ b/ prefixes or timestamps"""
+    path = header.split('\t')[0].strip()
+    if path == '/dev/null':
+        return None
+    if path[:2] in ('a/', 'b/'):
+        path = path[2:]
+    return path or None
+
+def _is_file_header(lines: List[str], i: int) -> bool:
+    return lines[i].startswith('--- ') and i + 1 < len(lines) and lines[i + 1].startswith('+++ ')
+
+def parse_patch(text: str, default_path: Optional[str] = None) -> List[Hunk]:
+    """Parse unified diff hunks and SEARCH/REPLACE blocks, in the order they appear.
+
+    A `FILE: path` line or a ---/+++ header sets the path for the hunks after it;
+    hunks before any path belong to default_path.
+    """
+    hunks: List[Hunk] = []
+    lines = (text or "").splitlines()
+    path = default_path
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        file_line = _FILE_LINE.match(stripped)
+        if file_line:
+            path = file_line.group(1)
+            i += 1
+            continue
+
+        if _is_file_header(lines, i):
+            path = _diff_path(lines[i + 1][4:]) or _diff_path(line[4:]) or path
+            i += 2
+            continue
+
+        if _SEARCH.match(stripped):
+            old, new, target = [], [], None
+            i += 1
+            while i < len(lines):
+                if target is None and _DIVIDER.match(lines[i].strip()):
+                    target = new
+                elif target is not None and _REPLACE.match(lines[i].strip()):
+                    break
+                else:
+                    (old if target is None else new).append(lines[i])
+                i += 1
+            if i >= len(lines):
+                raise PatchError(f"Unterminated SEARCH/REPLACE block for {path}")
+            hunks.append(Hunk(path, old, new))
+            i += 1
+            continue
+
+        header = _HUNK_HEADER.match(line)
+        if header:
+            # The header's line counts bound the body, so prose after the diff is never
+            # read as removed ("- note") or context lines; an omitted count means 1
+            old_left, new_left = int(header.group(2) or 1), int(header.group(3) or 1)
+            old, new, blank_tail = [], [], 0
+            i += 1
+            while i < len(lines) and (old_left > 0 or new_left > 0):
+                body = lines[i]
+                if body.startswith(('@@', '```')) or _FILE_LINE.match(body) or _is_file_header(lines, i):
+                    break
+                if body.startswith('+'):
+                    new.append(body[1:])
+                    new_left -= 1
+                elif body.startswith('-'):
+                    old.append(body[1:])
+                    old_left -= 1
+                elif body.startswith(' ') or body == '':
+                    # Models often drop the leading space of blank context lines
+                    old.append(body[1:])
+                    new.append(body[1:])
+                    old_left, new_left = old_left - 1, new_left - 1
+                elif not body.startswith('\\'):
+                    break
+                blank_tail = blank_tail + 1 if body == '' else 0
+                i += 1
+            if blank_tail and (old_left > 0 or new_left > 0):
+                # Blank lines separating a short-counted hunk from following prose are not context
+                old, new = old[:len(old) - blank_tail], new[:len(new) - blank_tail]
+            hunks.append(Hunk(path, old, new, int(header.group(1))))
+            continue
+
+        i += 1
+
+    missing = [hunk for hunk in hunks if not hunk.path]
+    if missing:
+        raise PatchError(f"{len(missing)} hunks do not say which file they change")
+    return hunks
+
+def group_by_path(hunks: Sequence[Hunk]) -> Dict[str, List[Hunk]]:
+    grouped: Dict[str, List[Hunk]] = {}
+    for hunk in hunks:
+        grouped.setdefault(hunk.path, []).append(hunk)
+    return grouped
+
+def _indent(lines: Sequence[str]) -> str:
+    first = next((line for line in lines if line.strip()), "")
+    return first[:len(first) - len(first.lstrip())]
+
+def _reindent(lines: List[str], old_indent: str, file_indent: str) -> List[str]:
+    """Shift replacement lines by the indent difference between the hunk and the file"""
+    if old_indent == file_indent:
+        return lines
+    if file_indent.startswith(old_indent):
+        extra = file_indent[len(old_indent):]
+        return [extra + line if line.strip() else line for line in lines]
+    if old_indent.startswith(file_indent):
+        cut = len(old_indent) - len(file_indent)
+        return [line[cut:] if line[:cut].strip() == "" else line.lstrip() for line in lines]
+    return lines
+
+def _nearest(found: List[int], hint: Optional[int]) -> int:
+    """Pick the match closest to the diff's line hint; without one, a repeated match is ambiguous"""
+    if len(found) > 1 and hint is None:
+        raise PatchError(f"ambiguous: matches {len(found)} places")
+    return found[0] if hint is None else min(found, key=lambda start: abs(start - hint))
+
+def _locate(lines: List[str], old: List[str], hint: Optional[int], fuzz: float) -> Tuple[int, int, str]:
+    """Find (start, length, how) of the block old in lines, trying stricter matches first"""
+    size = len(old)
+    starts = range(len(lines) - size + 1)
+    for how, normalize in (("exact", None), ("whitespace", str.rstrip), ("indent", str.strip)):
+        target = old if normalize is None else [normalize(line) for line in old]
+        normalized = lines if normalize is None else [normalize(line) for line in lines]
+        found = [start for start in starts if normalized[start:start + size] == target]
+        if found:
+            return _nearest(found, hint), size, how
+
+    # Fuzzy: the window of the same length whose text is most similar to the hunk
+    target = "\n".join(line.strip() for line in old)
+    best, best_ratio, tied = None, fuzz, False
+    for start in starts:
+        matcher = SequenceMatcher(None, target, "\n".join(line.strip() for line in lines[start:start + size]),
+                                  autojunk=False)
+        if matcher.real_quick_ratio() < best_ratio or matcher.quick_ratio() < best_ratio:
+            continue
+        ratio = matcher.ratio()
+        if ratio < fuzz:
+            continue
+        if ratio > best_ratio or best is None:
+            best, best_ratio, tied = start, ratio, False
+        elif ratio == best_ratio:
+            # Equally similar windows: only the line hint can tell them apart
+            if hint is None:
+                tied = True
+            elif abs(start - hint) < abs(best - hint):
+                best = start
+    if best is None:
+        raise PatchError("no match")
+    if tied:
+        raise PatchError(f"ambiguous: several places match equally ({best_ratio:.2f})")
+    return best, size, f"fuzzy {best_ratio:.2f}"
+
+def apply_hunks(content: str, hunks: Sequence[Hunk], fuzz: float = 0.85) -> str:
+    """Apply hunks to content in memory; raise PatchError if any hunk does not match.
+
+    Each hunk is located by exact match, then ignoring trailing whitespace, then
+    ignoring indentation (re-indenting the replacement to fit), then by the most
+    similar window scoring at least `fuzz`. Nothing is returned partially applied.
+    """
+    lines = content.splitlines()
+    offset = 0
+    for hunk in hunks:
+        hint = hunk.line_hint - 1 + offset if hunk.line_hint else None
+        if not hunk.old:
+            # Pure insertion: after the diff's line (-N,0 names the line before it),
+            # at the top for -0,0, or appended when it gives no line at all
+            start = min(hunk.line_hint + offset, len(lines)) if hunk.line_hint is not None else len(lines)
+            lines[start:start] = hunk.new
+            offset += len(hunk.new)
+            continue
+
+        try:
+            start, size, how = _locate(lines, hunk.old, hint, fuzz)
+        except PatchError as e:
+            raise PatchError(f"Could not locate {hunk.describe()}: {e}") from None
+        replacement = hunk.new
+        if how != "exact":
+            logger.debug("🩹 Matched %s (%s)", hunk.describe(), how)
+            replacement = _reindent(hunk.new, _indent(hunk.old), _indent(lines[start:start + size]))
+        lines[start:start + size] = replacement
+        offset += len(replacement) - size
+
+    patched = "\n".join(lines)
+    return patched + "\n" if content.endswith("\n") or not content else patched
@@ -0,0 +1,179 @@
+import ast
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from Vincius.Core.config_manager import ConfigManager
+from Vincius.Core import run_context
+
+CHARS_PER_TOKEN = 4
+PROMPT_OVERHEAD_TOKENS = 600  # Instructions and format text around embedded content
+MIN_CHUNK_TOKENS = 256
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (about four characters per token for code and English)"""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+def chunk_budget(config: Optional[Dict[str, Any]] = None, output_bound: bool = True) -> int:
+    """Get the token budget for file content embedded in a single prompt.
+
+    The reply has to fit in max_tokens (a review re-emits the code it was given), so
+    chunks are capped at a share of the output budget as well as the prompt budget.
+    Pass output_bound=False when the reply is small regardless of input, e.g. patches.
+    """
+    config = config or {}
+    model_config = ConfigManager().get('MODEL_CONFIG', {}) or {}
+    max_prompt = config.get('max_prompt_tokens') or model_config.get('max_prompt_tokens', 8000)
+    max_output = config.get('max_tokens') or model_config.get('max_tokens', 2048)
+    ratio = config.get('chunk_output_ratio') or model_config.get('chunk_output_ratio', 0.6)
+    if not output_bound:
+        return max(MIN_CHUNK_TOKENS, max_prompt - PROMPT_OVERHEAD_TOKENS)
+    return max(MIN_CHUNK_TOKENS, min(max_prompt - PROMPT_OVERHEAD_TOKENS, int(max_output * ratio)))
+
+class Chunk(NamedTuple):
+    index: int
+    total: int
+    start_line: int
+    end_line: int
+    content: str
+
+    def describe(self) -> str:
+        return f"part {self.index + 1} of {self.total} (lines {self.start_line}-{self.end_line})"
+
+class ChunkPlanner:
+    """Splits oversized files into chunks along top-level definitions"""
+
+    TOP_LEVEL = re.compile(
+        r'^(?:export\s+)?(?:default\s+)?(?:async\s+)?(?:abstract\s+)?'
+        r'(?:function|class|def|interface|type|enum|const|let|var|func|fn|pub\s+fn|impl|struct|'
+        r'module|namespace|public|private|protected|static|@\w+)\b'
+    )
+    COMMENT = re.compile(r'^\s*(?://|/\*|\*|#)')
+
+    def __init__(self, budget_tokens: int):
+        self.budget_tokens = budget_tokens
+
+    def needs_chunking(self, content: str) -> bool:
+        return estimate_tokens(content) > self.budget_tokens
+
+    def plan(self, file_name: str, content: str) -> List[Chunk]:
+        """Plan chunks that cover the whole file in order"""
+        lines = content.splitlines(keepends=True)
+        if not self.needs_chunking(content):
+            return [Chunk(0, 1, 1, len(lines), content)]
+
+        segments = self._segments(file_name, content, lines)
+        groups = self._group(segments, lines)
+        total = len(groups)
+        return [
+            Chunk(i, total, start + 1, end, "".join(lines[start:end]))
+            for i, (start, end) in enumerate(groups)
+        ]
+
+    def header(self, file_name: str, content: str, max_tokens: Optional[int] = None) -> str:
+        """Get the file preamble (imports, module docs) to give later chunks context"""
+        lines = content.splitlines(keepends=True)
+        boundaries = self._boundaries(file_name, content, lines)
+        first = boundaries[1] if len(boundaries) > 1 else 0
+        header = "".join(lines[:first])
+        limit = (max_tokens or self.budget_tokens // 4) * CHARS_PER_TOKEN
+        return header[:limit]
+
+    def _segments(self, file_name: str, content: str, lines: List[str]) -> List[tuple]:
+        boundaries = self._boundaries(file_name, content, lines)
+        edges = boundaries + [len(lines)]
+        segments = []
+        for start, end in zip(edges, edges[1:]):
+            if end > start:
+                segments.extend(self._split_oversized(start, end, lines))
+        return segments
+
+    def _boundaries(self, file_name: str, content: str, lines: List[str]) -> List[int]:
+        """Get 0-based line indexes where top-level definitions (and class members) start"""
+        starts = None
+        if file_name.endswith('.py'):
+            starts = self._python_boundaries(content)
+        if starts is None:
+            starts = [i for i, line in enumerate(lines) if self.TOP_LEVEL.match(line)]
+
+        # Keep leading comments and decorators with the definition they describe
+        adjusted = []
+        for start in starts:
+            while start > 0 and self.COMMENT.match(lines[start - 1]):
+                start -= 1
+            adjusted.append(start)
+        return sorted(set([0] + adjusted))
+
+    @staticmethod
+    def _python_boundaries(content: str) -> Optional[List[int]]:
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            return None
+        definitions = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        starts = []
+        for node in tree.body:
+            if not isinstance(node, definitions):
+                continue
+            # Methods are boundaries too so large classes can split; grouping rejoins small ones
+            members = [node]
+            if isinstance(node, ast.ClassDef):
+                members += [child for child in node.body if isinstance(child, definitions)]
+            for member in members:
+                decorators = getattr(member, 'decorator_list', [])
+                starts.append(min([member.lineno] + [d.lineno for d in decorators]) - 1)
+        return starts
+
+    def _split_oversized(self, start: int, end: int, lines: List[str]) -> List[tuple]:
+        """Split a single definition that exceeds the budget at blank lines, then by size"""
+        if estimate_tokens("".join(lines[start:end])) <= self.budget_tokens:
+            return [(start, end)]
+
+        pieces, piece_start, size = [], start, 0
+        limit = self.budget_tokens * CHARS_PER_TOKEN
+        for i in range(start, end):
+            size += len(lines[i])
+            at_break = not lines[i].strip() or size >= limit
+            if at_break and size >= limit // 2:
+                pieces.append((piece_start, i + 1))
+                piece_start, size = i + 1, 0
+        if piece_start < end:
+            pieces.append((piece_start, end))
+        return pieces
+
+    def _group(self, segments: List[tuple], lines: List[str]) -> List[tuple]:
+        """Merge adjacent segments greedily while they fit the budget"""
+        groups = []
+        for start, end in segments:
+            if groups:
+                group_start, _ = groups[-1]
+                if estimate_tokens("".join(lines[group_start:end])) <= self.budget_tokens:
+                    groups[-1] = (group_start, end)
+                    continue
+            groups.append((start, end))
+        return groups
+
+def pack_batches(items: List[Any], sizes: List[int], budget_tokens: int, max_items: Optional[int] = None) -> List[List[Any]]:
+    """Group items into batches whose token sizes fit the budget, largest first (first-fit decreasing)"""
+    batches: List[List[Any]] = []
+    totals: List[int] = []
+    for item, size in sorted(zip(items, sizes), key=lambda pair: pair[1], reverse=True):
+        for i, total in enumerate(totals):
+            if total + size <= budget_tokens and (not max_items or len(batches[i]) < max_items):
+                batches[i].append(item)
+                totals[i] += size
+                break
+        else:
+            batches.append([item])
+            totals.append(size)
+    return batches
+
+def run_concurrently(func: Callable[[Any], Any], items: List[Any], max_workers: int = 4) -> List[Any]:
+    """Apply func to every item in parallel threads, keeping input order"""
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        # Workers inherit the caller's run context so their model calls count toward the same run
+        return list(pool.map(run_context.bind(func), items))
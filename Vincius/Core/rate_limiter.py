@@ -0,0 +1,214 @@
+import json
+import time
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+class RateLimiter:
+    """Caps concurrent model requests and spaces them to a requests-per-minute rate.
+
+    Shared by every run in the process, so concurrent workflows draw from one
+    quota instead of each backing off on 429s independently.
+    """
+
+    def __init__(self, max_concurrent: int = 4, requests_per_minute: Optional[float] = None):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.requests_per_minute = requests_per_minute
+        self._slots = threading.Semaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    @property
+    def interval(self) -> float:
+        return 60.0 / self.requests_per_minute if self.requests_per_minute else 0.0
+
+    def acquire(self) -> float:
+        """Wait for a free slot and the next start time; return seconds waited"""
+        started = time.monotonic()
+        self._slots.acquire()
+        interval = self.interval
+        if interval:
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self._next_start)
+                self._next_start = start_at + interval
+            if start_at > now:
+                time.sleep(start_at - now)
+        return time.monotonic() - started
+
+    def release(self) -> None:
+        self._slots.release()
+
+    def on_success(self, latency: float) -> None:
+        pass  # Static limits do not learn
+
+    def on_throttle(self) -> None:
+        pass
+
+    def retry_after(self) -> Optional[float]:
+        return None  # Leave the retry delay to the caller's backoff
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"concurrency_limit": self.max_concurrent, "requests_per_minute": self.requests_per_minute}
+
+    def __enter__(self) -> 'RateLimiter':
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+class AdaptiveLimiter:
+    """AIMD controller for model concurrency and request rate.
+
+    Every success widens the concurrency window by 1/window (about one slot per
+    window of calls) and raises the rate by rate_increase requests per minute.
+    A 429 halves both. Latency well above the best seen so far also narrows the
+    window a little, once per window of calls, before throttling starts. The
+    learned limits are saved to state_file, so the next run starts near the
+    quota instead of rediscovering it.
+    """
+
+    SAVE_INTERVAL = 10.0  # Seconds between saves while limits only grow
+
+    def __init__(self, max_concurrent: int = 4, min_concurrent: int = 1,
+                 requests_per_minute: Optional[float] = None, max_requests_per_minute: Optional[float] = None,
+                 min_requests_per_minute: float = 4.0, rate_increase: float = 1.0, decrease_factor: float = 0.5,
+                 latency_factor: float = 3.0, state_file: Optional[Path] = None):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.min_concurrent = max(1, min(int(min_concurrent), self.max_concurrent))
+        self.max_requests_per_minute = max_requests_per_minute
+        self.min_requests_per_minute = min_requests_per_minute
+        self.rate_increase = rate_increase
+        self.decrease_factor = decrease_factor
+        self.latency_factor = latency_factor
+        self.state_file = Path(state_file) if state_file else None
+
+        self.window = float(self.max_concurrent)
+        self.requests_per_minute = requests_per_minute
+        self.throttles = 0
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._next_start = 0.0
+        self._recent_starts: Deque[float] = deque()
+        self._best_latency: Optional[float] = None
+        self._since_latency_cut = 0
+        self._last_save = 0.0
+        self._load()
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_concurrent, min(self.max_concurrent, int(self.window)))
+
+    @property
+    def interval(self) -> float:
+        return 60.0 / self.requests_per_minute if self.requests_per_minute else 0.0
+
+    def acquire(self) -> float:
+        """Wait for a slot in the current window and the next start time; return seconds waited"""
+        started = time.monotonic()
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self.interval
+            self._recent_starts.append(start_at)
+            while self._recent_starts and self._recent_starts[0] < now - 60:
+                self._recent_starts.popleft()
+        if start_at > now:
+            time.sleep(start_at - now)
+        return time.monotonic() - started
+
+    def release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def __enter__(self) -> 'AdaptiveLimiter':
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    def on_success(self, latency: float) -> None:
+        """Additive increase, or a small cut when latency shows the backend is saturating"""
+        with self._condition:
+            self._since_latency_cut += 1
+            if self._best_latency is None or latency < self._best_latency:
+                self._best_latency = latency
+            if (latency > self._best_latency * self.latency_factor and self._best_latency > 0
+                    and self._since_latency_cut >= self.limit):
+                self.window = max(float(self.min_concurrent), self.window * 0.9)
+                self._since_latency_cut = 0
+            else:
+                self.window = min(float(self.max_concurrent), self.window + 1.0 / max(self.window, 1.0))
+            if self.requests_per_minute:
+                raised = self.requests_per_minute + self.rate_increase
+                self.requests_per_minute = min(raised, self.max_requests_per_minute or raised)
+            self._condition.notify_all()
+        self._save()
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease of both the window and the rate"""
+        with self._condition:
+            self.throttles += 1
+            self.window = max(float(self.min_concurrent), self.window * self.decrease_factor)
+            # Without a rate yet, start from half of what was actually sent in the last minute
+            current = self.requests_per_minute or max(len(self._recent_starts), self.min_requests_per_minute)
+            self.requests_per_minute = max(self.min_requests_per_minute, current * self.decrease_factor)
+            self._next_start = max(self._next_start, time.monotonic() + self.interval)
+        logger.info("📉 Throttled: concurrency window %.1f, %.1f requests/min", self.window, self.requests_per_minute)
+        self._save(force=True)
+
+    def retry_after(self) -> float:
+        """Seconds to wait before retrying a throttled call; the rate cut already spaces calls"""
+        return max(1.0, self.interval)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "concurrency_window": round(self.window, 2),
+                "concurrency_limit": self.limit,
+                "in_flight": self._in_flight,
+                "requests_per_minute": round(self.requests_per_minute, 2) if self.requests_per_minute else None,
+                "throttles": self.throttles
+            }
+
+    def _load(self) -> None:
+        if not self.state_file or not self.state_file.exists():
+            return
+        try:
+            state = json.loads(self.state_file.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("⚠️ Ignoring saved model limits: %s", e)
+            return
+        window = state.get("window")
+        if isinstance(window, (int, float)):
+            self.window = max(float(self.min_concurrent), min(float(self.max_concurrent), window))
+        rpm = state.get("requests_per_minute")
+        if isinstance(rpm, (int, float)) and rpm > 0:
+            self.requests_per_minute = max(self.min_requests_per_minute, min(rpm, self.max_requests_per_minute or rpm))
+        logger.info("🎚️ Restored model limits: window %.1f, %s requests/min", self.window, self.requests_per_minute)
+
+    def _save(self, force: bool = False) -> None:
+        if not self.state_file:
+            return
+        now = time.monotonic()
+        with self._condition:
+            if not force and now - self._last_save < self.SAVE_INTERVAL:
+                return
+            self._last_save = now
+            state = {"window": self.window, "requests_per_minute": self.requests_per_minute,
+                     "updated": time.time()}
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            self.state_file.write_text(json.dumps(state), encoding='utf-8')
+        except OSError as e:
+            logger.warning("⚠️ Unable to save model limits: %s", e)
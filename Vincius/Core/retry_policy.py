@@ -0,0 +1,211 @@
+import re
+import time
+import random
+import threading
+from typing import Any, Callable, Collection, Dict, NamedTuple, Optional
+from Vincius.Core.config_manager import ConfigManager
+from Vincius.Core.model_backends import NonRetryableError
+from Vincius.Core.model_router import is_throttled
+from Vincius.Core.tracing import span
+from Vincius.Core import run_context
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+# Error classes; each has its own retry allowance in the RETRY config
+QUOTA = "quota"          # 429 / quota exhausted: wait for the limiter, then retry
+TRANSIENT = "transient"  # Network errors, 5xx and anything unrecognised
+INVALID = "invalid"      # The model answered with nothing usable
+PARSE = "parse"          # The answer could not be turned into files
+FATAL = "fatal"          # Retrying the same request cannot help
+
+ERROR_KINDS = (QUOTA, TRANSIENT, INVALID, PARSE, FATAL)
+
+_FATAL_STATUS = {400, 401, 403}
+_FATAL_MARKERS = ('api key', 'api_key', 'permission', 'unauthenticated', 'invalid argument')
+# A status code leading the message ("400 Request contains...") or named as one ("status: 403")
+_STATUS_IN_MESSAGE = re.compile(r'^\s*(\d{3})\b|\b(?:status|code|http|error)[\s:=]*(\d{3})\b', re.IGNORECASE)
+
+class InvalidResponseError(ValueError):
+    """The model returned an empty or malformed response"""
+
+class ParseError(ValueError):
+    """A model response had no usable file sections"""
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """HTTP status of an error: from the exception (SDK errors carry .code) or its message"""
+    for holder in (error, getattr(error, 'response', None)):
+        for attribute in ('code', 'status_code'):
+            value = getattr(holder, attribute, None)
+            if isinstance(value, int) and not isinstance(value, bool):
+                return value
+    match = _STATUS_IN_MESSAGE.search(str(error))
+    return int(match.group(1) or match.group(2)) if match else None
+
+def classify(error: BaseException) -> str:
+    """Map an error to the class that decides whether and how it is retried"""
+    if isinstance(error, NonRetryableError):
+        return FATAL
+    if isinstance(error, ParseError):
+        return PARSE
+    if isinstance(error, InvalidResponseError):
+        return INVALID
+    if is_throttled(error):
+        return QUOTA
+    if _status_code(error) in _FATAL_STATUS:
+        return FATAL
+    message = str(error).lower()
+    if any(marker in message for marker in _FATAL_MARKERS):
+        return FATAL
+    return TRANSIENT
+
+class StepBudget:
+    """Retry allowance shared by every retry layer within one step.
+
+    First attempts are free, so a step may make as many model calls as its work
+    needs. Each retry (a repeated call, a regeneration or a repair request) takes
+    one of max_retries, and the time spent backing off and re-attempting counts
+    against seconds. Nested layers draw on the same allowance, so they cannot
+    multiply each other's retries past it.
+    """
+
+    def __init__(self, seconds: Optional[float] = None, max_retries: Optional[int] = None):
+        self.seconds = seconds
+        self.max_retries = max_retries
+        self.retries = 0
+        self.spent = 0.0
+        self._lock = threading.Lock()
+
+    def remaining(self) -> Optional[float]:
+        """Retry seconds left, None without a limit"""
+        with self._lock:
+            return None if self.seconds is None else self.seconds - self.spent
+
+    def spend(self, seconds: float) -> None:
+        with self._lock:
+            self.spent += seconds
+
+    def take_retry(self, wait: float = 0.0) -> Optional[str]:
+        """Reserve one retry that starts after `wait` seconds; return why it is refused, or None"""
+        with self._lock:
+            if self.max_retries is not None and self.retries >= self.max_retries:
+                return f"the step's {self.max_retries} retries are used up"
+            if self.seconds is not None and self.spent + wait > self.seconds:
+                return f"{wait:.1f}s backoff exceeds the {max(self.seconds - self.spent, 0.0):.1f}s of retry time left"
+            self.retries += 1
+            return None
+
+def take_retry(name: str, wait: float = 0.0) -> bool:
+    """Charge one retry to the current step's budget; False (and a warning) when it is refused"""
+    budget = run_context.current().budget
+    refused = budget.take_retry(wait) if budget else None
+    if refused:
+        logger.warning("⏱️ Not retrying %s: %s", name, refused)
+        return False
+    return True
+
+class RetryResult(NamedTuple):
+    value: Any
+    attempts: int
+    waited: float
+
+class RetryError(Exception):
+    """Raised when a call failed and will not be retried again"""
+
+    def __init__(self, error: BaseException, kind: str, attempts: int, waited: float):
+        super().__init__(str(error))
+        self.error = error
+        self.kind = kind
+        self.attempts = attempts
+        self.waited = waited
+
+class RetryPolicy:
+    """One retry engine for model calls, response checks and regeneration.
+
+    Delays grow exponentially from base_delay up to max_delay with jitter
+    ("full", "equal" or "none"). Each error class has its own attempt limit, and
+    every retry and its delay must fit the step's budget from the run context, so
+    nested callers cannot multiply each other's retries past it.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 2.0, max_delay: float = 60.0,
+                 jitter: str = "full", kinds: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.kinds = kinds or {}
+
+    @classmethod
+    def from_config(cls, step_config: Optional[Dict[str, Any]] = None) -> 'RetryPolicy':
+        """Build the policy from RETRY, with a step's `retry` overrides from its agent_config"""
+        settings = dict(ConfigManager().get('RETRY', {}) or {})
+        overrides = (step_config or {}).get('retry') or {}
+        kinds = {kind: dict(rules or {}) for kind, rules in (settings.get('kinds') or {}).items()}
+        for kind, rules in (overrides.get('kinds') or {}).items():
+            kinds.setdefault(kind, {}).update(rules or {})
+        settings.update(overrides)
+        return cls(settings.get('max_attempts', 3), settings.get('base_delay', 2.0),
+                   settings.get('max_delay', 60.0), settings.get('jitter', 'full'), kinds)
+
+    def retries(self, kind: str) -> bool:
+        return kind != FATAL and self.kinds.get(kind, {}).get('retry', True)
+
+    def attempts_for(self, kind: str) -> int:
+        return self.kinds.get(kind, {}).get('max_attempts', self.max_attempts)
+
+    def delay(self, attempt: int) -> float:
+        """Backoff before the given retry (1 = first retry)"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        if self.jitter == "full":
+            return random.uniform(0, ceiling)
+        if self.jitter == "equal":
+            return ceiling / 2 + random.uniform(0, ceiling / 2)
+        return ceiling
+
+    def run(self, func: Callable[[], Any], name: str = "call", retry_kinds: Optional[Collection[str]] = None,
+            on_error: Optional[Callable[[BaseException, str], None]] = None,
+            delay_hint: Optional[Callable[[BaseException, str], Optional[float]]] = None) -> RetryResult:
+        """Call func until it succeeds, retrying only the error classes in retry_kinds (default: all)"""
+        budget = run_context.current().budget
+        attempts, waited = 0, 0.0
+        while True:
+            attempts += 1
+            started = time.monotonic()
+            try:
+                value = func()
+            except Exception as e:
+                if budget and attempts > 1:
+                    # Re-attempts are retry time; the first attempt is the step's own work
+                    budget.spend(time.monotonic() - started)
+                kind = classify(e)
+                if on_error:
+                    on_error(e, kind)
+                logger.warning("⚠️ %s attempt %s failed (%s): %s", name, attempts, kind, e)
+
+                allowed = self.retries(kind) and (retry_kinds is None or kind in retry_kinds)
+                if not allowed or attempts >= self.attempts_for(kind):
+                    raise RetryError(e, kind, attempts, waited) from e
+
+                hinted = delay_hint(e, kind) if delay_hint else None
+                wait = hinted if hinted is not None else self.delay(attempts)
+                if not take_retry(name, wait):
+                    raise RetryError(e, kind, attempts, waited) from e
+
+                logger.info("⏳ Waiting %.1f seconds before retry %s/%s...", wait, attempts + 1, self.attempts_for(kind))
+                with span("backoff", "retry", seconds=round(wait, 3), kind=kind):
+                    time.sleep(wait)
+                waited += wait
+                if budget:
+                    budget.spend(wait)
+                continue
+
+            if budget and attempts > 1:
+                budget.spend(time.monotonic() - started)
+            return RetryResult(value, attempts, waited)
+
+def step_budget(step_config: Optional[Dict[str, Any]] = None) -> StepBudget:
+    """Create the retry budget for one workflow step from RETRY and the step's `retry` overrides"""
+    settings = dict(ConfigManager().get('RETRY', {}) or {})
+    settings.update((step_config or {}).get('retry') or {})
+    return StepBudget(settings.get('step_retry_seconds'), settings.get('step_max_retries'))
@@ -0,0 +1,114 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+from Vincius.Core.config_manager import ConfigManager
+from Vincius.Core import run_context
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+APPROVED = "approved"
+
+def content_digest(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+class Verdict(NamedTuple):
+    digest: str
+    prompt_version: str
+    verdict: str
+    reviewed_at: float
+
+class ReviewLedger:
+    """Review verdicts persisted between runs, one per file path in each workspace.
+
+    A verdict only holds for the exact content it was given (by SHA-256) and the
+    review prompt version that produced it, so editing the file or the prompt
+    makes the file due for review again. Verdicts live under the run workspace's
+    state dir and are written by flush(), merged with what other runs saved.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ReviewLedger, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        settings = ConfigManager().get('CODE_REVIEW', {}) or {}
+        self.file_name = settings.get('verdicts_file', 'review_verdicts.json')
+        self._lock = threading.Lock()
+        self._verdicts: Dict[Path, Dict[str, Verdict]] = {}    # Ledger file -> path -> verdict
+        self._pending: Dict[Path, Dict[str, Optional[Verdict]]] = {}  # Unsaved changes; None = forgotten
+
+    def _ledger_path(self) -> Path:
+        return run_context.state_path() / self.file_name
+
+    def _current(self) -> Tuple[Path, Dict[str, Verdict]]:
+        """The ledger file of the current workspace and its verdicts, loaded on first use"""
+        path = self._ledger_path()
+        if path not in self._verdicts:
+            self._verdicts[path] = self._load(path)
+        return path, self._verdicts[path]
+
+    @staticmethod
+    def _load(path: Path) -> Dict[str, Verdict]:
+        if not path.exists():
+            return {}
+        try:
+            raw = json.loads(path.read_text(encoding='utf-8'))
+            return {file_path: Verdict(**entry) for file_path, entry in raw.items()}
+        except (OSError, TypeError, json.JSONDecodeError) as e:
+            logger.warning("⚠️ Ignoring saved review verdicts: %s", e)
+            return {}
+
+    def flush(self) -> None:
+        """Merge unsaved verdicts into each ledger file and write it atomically"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            for path, changes in pending.items():
+                merged = self._load(path)
+                for file_path, verdict in changes.items():
+                    if verdict is None:
+                        merged.pop(file_path, None)
+                    else:
+                        merged[file_path] = verdict
+                temp = path.with_suffix(f'.{os.getpid()}.tmp')
+                try:
+                    temp.write_text(json.dumps({file_path: verdict._asdict() for file_path, verdict in merged.items()},
+                                               indent=1), encoding='utf-8')
+                    temp.replace(path)
+                except OSError as e:
+                    logger.warning("⚠️ Unable to save review verdicts: %s", e)
+                self._verdicts[path] = merged
+
+    def is_approved(self, path: str, content: str, prompt_version: str) -> bool:
+        """Whether this exact content already passed review under this prompt version"""
+        with self._lock:
+            verdict = self._current()[1].get(path)
+        return (verdict is not None and verdict.verdict == APPROVED
+                and verdict.prompt_version == prompt_version and verdict.digest == content_digest(content))
+
+    def record(self, path: str, content: str, prompt_version: str, verdict: str = APPROVED) -> None:
+        with self._lock:
+            ledger_path, verdicts = self._current()
+            verdicts[path] = Verdict(content_digest(content), prompt_version, verdict, time.time())
+            self._pending.setdefault(ledger_path, {})[path] = verdicts[path]
+
+    def forget(self, path: str) -> None:
+        with self._lock:
+            ledger_path, verdicts = self._current()
+            if verdicts.pop(path, None) is not None:
+                self._pending.setdefault(ledger_path, {})[path] = None
+
+    def get(self, path: str) -> Optional[Verdict]:
+        with self._lock:
+            return self._current()[1].get(path)
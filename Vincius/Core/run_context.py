@@ -0,0 +1,61 @@
+import contextvars
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+class RunContext(NamedTuple):
+    """Identity of the workflow run, step and agent executing in the current thread or task"""
+    run_id: Optional[str] = None
+    step: Optional[str] = None
+    agent_type: Optional[str] = None
+    agent_uuid: Optional[str] = None
+    workspace: Optional[Path] = None  # Root for agent directories and logs; project root when unset
+    budget: Optional[Any] = None      # retry_policy.StepBudget shared by every retry within the step
+
+_current: contextvars.ContextVar[RunContext] = contextvars.ContextVar('vincius_run_context', default=RunContext())
+
+def current() -> RunContext:
+    """Get the run context of the caller"""
+    return _current.get()
+
+def update(**fields: Any) -> contextvars.Token:
+    """Replace fields of the current run context for the rest of this context"""
+    return _current.set(_current.get()._replace(**fields))
+
+@contextmanager
+def run_scope(**fields: Any) -> Iterator[RunContext]:
+    """Apply fields for the duration of a block, then restore the previous context"""
+    token = update(**fields)
+    try:
+        yield _current.get()
+    finally:
+        _current.reset(token)
+
+def workspace_path() -> Path:
+    """Get the root directory for the current run's agent folders and logs"""
+    workspace = _current.get().workspace
+    if workspace:
+        return Path(workspace)
+    from Vincius.Core.config_manager import ConfigManager
+    return ConfigManager().base_path
+
+def state_path() -> Path:
+    """Get the directory for state the current run's workspace keeps between runs"""
+    from Vincius.Core.config_manager import ConfigManager
+    state = workspace_path() / ConfigManager().get('PATHS', {}).get('state_dir', 'Logs/state')
+    state.mkdir(parents=True, exist_ok=True)
+    return state
+
+def bind(func: Callable) -> Callable:
+    """Wrap func so it runs in a copy of the caller's context, e.g. on a pool thread.
+
+    Worker threads start with an empty context; without this, identity set by the
+    submitting run would be lost in the work it fans out.
+    """
+    context = contextvars.copy_context()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)
+    return wrapper
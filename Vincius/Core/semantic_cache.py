@@ -0,0 +1,167 @@
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 64) - 1
+
+# Fields that change between otherwise identical prompts
+DEFAULT_VOLATILE_PATTERNS = [
+    r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?',  # ISO timestamps
+    r'\d{4}-\d{2}-\d{2}',                                                      # Dates
+    r'\d{1,2}:\d{2}(:\d{2})?',                                                 # Times
+    r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',           # UUIDs
+    r'\b[0-9a-f]{12,64}\b',                                                    # Hashes and run ids
+    r'\b\d{9,}\b'                                                              # Epoch times and counters
+]
+
+class CacheHit(NamedTuple):
+    response: str
+    similarity: float
+
+def normalize_prompt(prompt: str, volatile_patterns: Sequence[re.Pattern]) -> str:
+    """Reduce a prompt to the text that decides its answer: no volatile fields, no layout"""
+    text = prompt.lower()
+    for pattern in volatile_patterns:
+        text = pattern.sub(' <v> ', text)
+    return ' '.join(text.split())
+
+class MinHasher:
+    """MinHash signatures over word shingles, estimating Jaccard similarity of two texts.
+
+    Word shingles make the estimate insensitive to where blocks of text sit in the
+    prompt, so reordered sections still match.
+    """
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # Fixed (a, b) pairs for the universal hashes h(x) = (a * x + b) mod p
+        coefficients = []
+        for index in range(num_perm):
+            digest = hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=16).digest()
+            coefficients.append((int.from_bytes(digest[:8], 'big') % (_PRIME - 1) + 1,
+                                 int.from_bytes(digest[8:], 'big') % _PRIME))
+        self._coefficients = coefficients
+
+    def shingles(self, text: str) -> Set[int]:
+        words = text.split()
+        size = min(self.shingle_size, len(words)) or 1
+        return {
+            int.from_bytes(hashlib.blake2b(' '.join(words[i:i + size]).encode(), digest_size=8).digest(), 'big')
+            for i in range(max(1, len(words) - size + 1))
+        }
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        shingles = self.shingles(text)
+        return tuple(
+            min((a * shingle + b) % _PRIME for shingle in shingles) if shingles else _MAX_HASH
+            for a, b in self._coefficients
+        )
+
+    @staticmethod
+    def similarity(first: Sequence[int], second: Sequence[int]) -> float:
+        """Share of matching signature slots, an estimate of Jaccard similarity"""
+        return sum(1 for x, y in zip(first, second) if x == y) / len(first) if first else 0.0
+
+class _Entry(NamedTuple):
+    model_key: str
+    digest: str
+    signature: Tuple[int, ...]
+    response: str
+
+class SemanticCache:
+    """Local near-duplicate prompt cache using MinHash with LSH banding.
+
+    Each signature is split into bands; prompts sharing any band are candidates,
+    and the best candidate above the threshold is served. Entries are scoped to a
+    model key so different models or generation settings never share answers.
+    """
+
+    def __init__(self, threshold: float = 0.9, num_perm: int = 64, bands: int = 16,
+                 shingle_size: int = 5, max_entries: int = 500,
+                 volatile_patterns: Optional[List[str]] = None):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_entries = max_entries
+        self.hasher = MinHasher(num_perm, shingle_size)
+        patterns = DEFAULT_VOLATILE_PATTERNS if volatile_patterns is None else volatile_patterns
+        self.volatile_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._exact: Dict[Tuple[str, str], int] = {}
+        self._buckets: Dict[Tuple[str, int, Tuple[int, ...]], Set[int]] = {}
+        self._next_id = 0
+
+    def _bands(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [(band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    def _key(self, prompt: str) -> Tuple[str, str]:
+        normalized = normalize_prompt(prompt, self.volatile_patterns)
+        return normalized, hashlib.sha256(normalized.encode()).hexdigest()
+
+    def lookup(self, prompt: str, model_key: str, threshold: Optional[float] = None) -> Optional[CacheHit]:
+        """Find the cached response of the most similar earlier prompt, if similar enough"""
+        threshold = self.threshold if threshold is None else threshold
+        normalized, digest = self._key(prompt)
+
+        with self._lock:
+            entry_id = self._exact.get((model_key, digest))
+            if entry_id is not None:
+                self._entries.move_to_end(entry_id)
+                return CacheHit(self._entries[entry_id].response, 1.0)
+
+        signature = self.hasher.signature(normalized)
+        with self._lock:
+            candidates = set()
+            for band, rows in self._bands(signature):
+                candidates |= self._buckets.get((model_key, band, rows), set())
+
+            best_id, best = None, 0.0
+            for entry_id in candidates:
+                similarity = MinHasher.similarity(signature, self._entries[entry_id].signature)
+                if similarity > best:
+                    best_id, best = entry_id, similarity
+            if best_id is None or best < threshold:
+                return None
+            self._entries.move_to_end(best_id)
+            return CacheHit(self._entries[best_id].response, best)
+
+    def store(self, prompt: str, model_key: str, response: str) -> None:
+        """Remember a response, evicting the least recently used entry when full"""
+        normalized, digest = self._key(prompt)
+        signature = self.hasher.signature(normalized)
+
+        with self._lock:
+            if (model_key, digest) in self._exact:
+                return
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = _Entry(model_key, digest, signature, response)
+            self._exact[(model_key, digest)] = entry_id
+            for band, rows in self._bands(signature):
+                self._buckets.setdefault((model_key, band, rows), set()).add(entry_id)
+
+            while len(self._entries) > self.max_entries:
+                self._evict(next(iter(self._entries)))
+
+    def _evict(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        self._exact.pop((entry.model_key, entry.digest), None)
+        for band, rows in self._bands(entry.signature):
+            bucket = self._buckets.get((entry.model_key, band, rows))
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[(entry.model_key, band, rows)]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,3 +1,7 @@
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
 class StartStepFinder:
     def __init__(self, steps: dict):
         self.steps = steps or {}  # Handle None case
@@ -7,7 +11,7 @@ class StartStepFinder:
         """Find the starting step or return default"""
         # If no steps configured, return default
         if not self.steps:
-            print(f"⚠️ No workflow steps found, using default step: {self.default_step}")
+            logger.warning("⚠️ No workflow steps found, using default step: %s", self.default_step)
             return self.default_step
 
         next_steps = set()
@@ -25,9 +29,9 @@ class StartStepFinder:
         # Find first step that isn't mentioned as a next step
         for step in self.steps.keys():
             if step not in next_steps:
-                print(f"✅ Found starting step: {step}")
+                logger.info("✅ Found starting step: %s", step)
                 return step
 
         # If no start step found in workflow, use default
-        print(f"⚠️ No start step found in workflow, using default: {self.default_step}")
+        logger.warning("⚠️ No start step found in workflow, using default: %s", self.default_step)
         return self.default_step
\ No newline at end of file
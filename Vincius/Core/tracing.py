@@ -0,0 +1,163 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Dict, Any, Callable, Iterator, List, Optional
+from Vincius.Core.config_manager import ConfigManager
+from Vincius.Core import run_context
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+class Span:
+    """Handle for an open span; set() adds arguments shown in the trace viewer"""
+
+    __slots__ = ("name", "category", "args")
+
+    def __init__(self, name: str, category: str, args: Dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def set(self, **args: Any) -> None:
+        self.args.update(args)
+
+class _NullSpan:
+    """Returned when tracing is off so call sites never need to check"""
+
+    def set(self, **args: Any) -> None:
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class Tracer:
+    """Collects timed spans and exports them in the Chrome trace event format.
+
+    The exported JSON opens in Perfetto (ui.perfetto.dev) or chrome://tracing.
+    Spans are complete ("X") events on the thread that ran them, so nesting in
+    the viewer follows the call stack. Each span is tagged with the run in the
+    caller's run context, so concurrent runs export separate traces.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Tracer, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        settings = ConfigManager().get('TRACING', {}) or {}
+        self.enabled = bool(settings.get('enabled', True))
+        self.trace_subdir = settings.get('dir', 'Logs/Traces')
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = []
+        self._runs: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        self._threads: Dict[int, int] = {}
+        self._origin = time.perf_counter()
+
+    @property
+    def trace_dir(self) -> Path:
+        """Trace directory of the caller's run workspace"""
+        return run_context.workspace_path() / self.trace_subdir
+
+    def reset(self) -> None:
+        """Drop all recorded spans"""
+        with self._lock:
+            self._events = []
+            self._runs = {}
+            self._threads = {}
+            self._origin = time.perf_counter()
+
+    def discard(self, run_id: Optional[str] = None) -> None:
+        """Drop the spans of one run, e.g. after exporting them"""
+        with self._lock:
+            self._runs.pop(run_id or run_context.current().run_id, None)
+
+    def _thread_id(self) -> int:
+        ident = threading.get_ident()
+        tid = self._threads.get(ident)
+        if tid is None:
+            tid = self._threads[ident] = len(self._threads) + 1
+            self._events.append({
+                "name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid,
+                "args": {"name": threading.current_thread().name}
+            })
+        return tid
+
+    @contextmanager
+    def span(self, name: str, category: str = "", **args: Any) -> Iterator[Any]:
+        """Time the enclosed block as one span"""
+        if not self.enabled:
+            yield _NULL_SPAN
+            return
+
+        span = Span(name, category, args)
+        run_id = run_context.current().run_id
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.args["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            ended = time.perf_counter()
+            with self._lock:
+                self._runs.setdefault(run_id, []).append({
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round((started - self._origin) * 1_000_000, 3),
+                    "dur": round((ended - started) * 1_000_000, 3),
+                    "pid": os.getpid(),
+                    "tid": self._thread_id(),
+                    "args": span.args
+                })
+
+    def export(self, name: str = "trace", run_id: Optional[str] = None) -> Optional[Path]:
+        """Write the spans of a run (the caller's by default) to <trace dir>/<name>.json"""
+        run_id = run_id or run_context.current().run_id
+        with self._lock:
+            spans = list(self._runs.get(run_id, []))
+            # Thread names are shared by every run; only keep the threads this run used
+            used = {event["tid"] for event in spans}
+            events = [event for event in self._events if event["tid"] in used] + spans
+        if not self.enabled or not spans:
+            return None
+
+        trace_path = self.trace_dir / f"{name}.json"
+        try:
+            trace_path.parent.mkdir(parents=True, exist_ok=True)
+            trace_path.write_text(
+                json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, default=str),
+                encoding='utf-8'
+            )
+        except OSError as e:
+            logger.warning("⚠️ Unable to write trace: %s", e)
+            return None
+
+        logger.info("🧭 Trace written to: %s (open it in ui.perfetto.dev)", trace_path)
+        return trace_path
+
+def span(name: str, category: str = "", **args: Any):
+    """Time a block as a span of the process tracer"""
+    return Tracer().span(name, category, **args)
+
+def traced(name: Optional[str] = None, category: str = "") -> Callable:
+    """Decorator that records every call of a function as a span"""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,58 @@
+import json
+import time
+import http.client
+from typing import Dict, Any, Optional
+from Vincius.Core.config_manager import ConfigManager
+from Vincius.Core.workflow_server import unix_socket_connection
+
+class WorkflowClient:
+    """Thin client for a running WorkflowServer; unset address parts come from SERVER config like the server's"""
+
+    def __init__(self, host: Optional[str] = None, port: Optional[int] = None,
+                 socket_path: Optional[str] = None, timeout: float = 30.0):
+        settings = ConfigManager().get('SERVER', {}) or {}
+        self.host = host or settings.get('host', '127.0.0.1')
+        self.port = port if port is not None else settings.get('port', 8765)
+        self.socket_path = socket_path or settings.get('socket')
+        self.timeout = timeout
+
+    def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None,
+                 timeout: Optional[float] = None) -> Dict[str, Any]:
+        timeout = timeout or self.timeout
+        if self.socket_path:
+            connection = unix_socket_connection(self.socket_path, timeout)
+        else:
+            connection = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        try:
+            body = json.dumps(payload).encode('utf-8') if payload is not None else None
+            headers = {'Content-Type': 'application/json'} if body is not None else {}
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            data = json.loads(response.read() or b'{}')
+            if response.status >= 400:
+                raise RuntimeError(f"Server returned {response.status}: {data.get('error', data)}")
+            return data
+        finally:
+            connection.close()
+
+    def health(self) -> Dict[str, Any]:
+        return self._request('GET', '/health')
+
+    def submit(self, input_data: Any = None) -> Dict[str, Any]:
+        """Queue a workflow run and return the job record"""
+        return self._request('POST', '/jobs', {"input": input_data})
+
+    def status(self, job_id: str, wait: float = 0) -> Dict[str, Any]:
+        """Get a job, optionally blocking on the server for up to `wait` seconds"""
+        path = f"/jobs/{job_id}" + (f"?wait={wait}" if wait else "")
+        return self._request('GET', path, timeout=self.timeout + wait)
+
+    def wait(self, job_id: str, poll: float = 30.0, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Block until a job finishes"""
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            job = self.status(job_id, wait=poll)
+            if job["status"] in ("succeeded", "failed"):
+                return job
+            if deadline and time.monotonic() >= deadline:
+                return job
@@ -2,6 +2,9 @@ import importlib
 from typing import Dict, Any, Optional
 import json
 from pathlib import Path
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class WorkflowExecutor:
     def __init__(self, workflow_config: Dict[str, Any], context: Dict[str, Any]):
@@ -15,7 +18,7 @@ class WorkflowExecutor:
             cls = getattr(module, class_name)
             return cls
         except Exception as e:
-            print(f"Error loading agent class: {e}")
+            logger.error("❌ Error loading agent class: %s", e)
             raise
 
     def _save_memory(self, step_name: str, data: Dict[str, Any]):
@@ -24,9 +27,9 @@ class WorkflowExecutor:
             json.dump(data, f, indent=2)
 
     def execute_step(self, step_name: str) -> bool:
-        print(f"\n{'='*50}")
-        print(f"Executing step: {step_name}")
-        print(f"{'='*50}\n")
+        logger.info("\n%s", '='*50)
+        logger.info("Executing step: %s", step_name)
+        logger.info("%s\n", '='*50)
         
         try:
             step_config = self.workflow[step_name]
@@ -36,13 +39,13 @@ class WorkflowExecutor:
             module_name = action['module']
             agent_config = action.get('agent_config', {})
             
-            print(f"Attempting to load agent {class_name} from module {module_name}")
+            logger.info("Attempting to load agent %s from module %s", class_name, module_name)
             
             try:
                 cls = self._get_agent_instance(class_name, module_name)
                 agent = cls(agent_config)
             except Exception as e:
-                print(f"Failed to initialize agent: {e}")
+                logger.exception("❌ Failed to initialize agent: %s", e)
                 return False
             
             input_key = action.get('input_key')
@@ -51,7 +54,7 @@ class WorkflowExecutor:
             try:
                 result = agent.execute(input_data)
                 if not result:
-                    print("Agent returned empty result")
+                    logger.info("Agent returned empty result")
                     return False
                     
                 output_key = action.get('output_key')
@@ -61,36 +64,36 @@ class WorkflowExecutor:
                 return True
                 
             except Exception as e:
-                print(f"Agent execution failed: {e}")
+                logger.exception("❌ Agent execution failed: %s", e)
                 return False
             
         except Exception as e:
-            print(f"Error executing step: {e}")
+            logger.exception("❌ Error executing step: %s", e)
             return False
 
     def execute_workflow(self, start_step: str) -> None:
         executed_steps = set()
 
         def _execute_chain(step_name: str):
-            print(f"Attempting to execute chain for step: {step_name}")
+            logger.info("Attempting to execute chain for step: %s", step_name)
             if step_name in executed_steps:
-                print(f"Step {step_name} already executed, skipping.")
+                logger.info("Step %s already executed, skipping.", step_name)
                 return
             if self.execute_step(step_name):
                 executed_steps.add(step_name)
                 next_steps = self.workflow[step_name]['next_steps']
-                print(f"Next steps for {step_name}: {next_steps}")
+                logger.info("Next steps for %s: %s", step_name, next_steps)
                 if isinstance(next_steps, dict):
                     success_step = next_steps.get('success_step')
                     if success_step:
                         if isinstance(success_step, dict) and not success_step:
-                            print("End of workflow.")
+                            logger.info("End of workflow.")
                             return  # Empty dict means end of workflow
-                        print(f"Executing success step: {success_step}")
+                        logger.info("Executing success step: %s", success_step)
                         _execute_chain(success_step)
                 elif isinstance(next_steps, list):
                     for next_step in next_steps:
-                        print(f"Executing next step: {next_step}")
+                        logger.info("Executing next step: %s", next_step)
                         _execute_chain(next_step)
 
         _execute_chain(start_step)
\ No newline at end of file
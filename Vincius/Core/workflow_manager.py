@@ -1,43 +1,68 @@
 from typing import Dict, Any, Optional
 from Vincius.Core.config_manager import ConfigManager
 from Vincius.Core.start_step_finder import StartStepFinder
+from Vincius.Core.metrics import MetricsRecorder
+from Vincius.Core.tracing import Tracer
+from Vincius.Core import run_context
+from Vincius.Core.retry_policy import step_budget
 from importlib import import_module
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
 
 class WorkflowManager:
-    def __init__(self):
+    def __init__(self, run_id: Optional[str] = None):
         self.config_manager = ConfigManager()
+        self.metrics = MetricsRecorder()
+        self.tracer = Tracer()
+        self.run_id = self.metrics.start_run(run_id)
         self.workflow = self.config_manager.get_workflow().get('workflow', {})
         
         # Usar StartStepFinder para determinar o passo inicial
         start_finder = StartStepFinder(self.workflow)
         self.current_step = start_finder.find_start_step()
         
-        print(f"✅ Found starting step: {self.current_step}")
+        logger.info("✅ Found starting step: %s", self.current_step)
 
     def execute_workflow(self, input_data: Any = None) -> Optional[Dict]:
         """Execute the workflow from the starting step"""
         return self.execute(input_data)  # Use existing execute method
         
     def execute(self, input_data: Any = None) -> Optional[Dict]:
+        # Everything below, including agents and model calls, is attributed to this run
+        with run_context.run_scope(run_id=self.run_id):
+            try:
+                return self._run_steps(input_data)
+            finally:
+                self.metrics.print_summary()
+                self.metrics.write_summary()
+                self.metrics.finish_run()
+                self.tracer.export(f"trace_{self.run_id}")
+                self.tracer.discard()
+
+    def _run_steps(self, input_data: Any = None) -> Optional[Dict]:
         try:
-            print(f"Starting workflow execution from: {self.current_step}")
+            logger.info("Starting workflow execution from: %s", self.current_step)
             
             while self.current_step:
-                print("\n" + "=" * 50)
-                print(f"Executing step: {self.current_step}")
-                print("=" * 50 + "\n")
+                logger.info("%s", "\n" + "=" * 50)
+                logger.info("Executing step: %s", self.current_step)
+                logger.info("%s", "=" * 50 + "\n")
                 
                 step_config = self.workflow.get(self.current_step)
                 if not step_config:
                     raise ValueError(f"Step not found: {self.current_step}")
                 
-                # Execute current step
-                result = self._execute_step(step_config, input_data)
+                # Execute current step; agent identity set inside it ends with the step
+                budget = step_budget(step_config.get('action', {}).get('agent_config'))
+                with run_context.run_scope(step=self.current_step, agent_type=None, agent_uuid=None, budget=budget), \
+                        self.tracer.span(self.current_step, "step"):
+                    result = self._execute_step(step_config, input_data)
                 
                 # Move to next step
                 next_step = step_config.get('next_steps', {}).get('success_step')
                 if not next_step:
-                    print(f"✅ Workflow completed at step: {self.current_step}")
+                    logger.info("✅ Workflow completed at step: %s", self.current_step)
                     return result
                 
                 self.current_step = next_step
@@ -46,7 +71,7 @@ class WorkflowManager:
             return input_data
             
         except Exception as e:
-            print(f"Error executing workflow: {str(e)}")
+            logger.error("❌ Error executing workflow: %s", e)
             return None
 
     def _execute_step(self, step_config: Dict, input_data: Any) -> Any:
@@ -64,7 +89,7 @@ class WorkflowManager:
                 raise ValueError(f"Unsupported action type: {action_type}")
 
         except Exception as e:
-            print(f"Error executing step: {str(e)}")
+            logger.error("❌ Error executing step: %s", e)
             raise
 
     def _execute_class_action(self, action: Dict, input_data: Any) -> Any:
@@ -77,18 +102,21 @@ class WorkflowManager:
             if not module_path or not class_name:
                 raise ValueError("Missing module or class name in action config")
 
-            module = import_module(module_path)
+            with self.tracer.span(f"import {module_path}", "agent"):
+                module = import_module(module_path)
             agent_class = getattr(module, class_name)
 
             # Get agent configuration
             agent_config = action.get('agent_config', {})
             
             # Initialize and execute agent
-            agent = agent_class(agent_config)
-            result = agent.execute(input_data)
+            with self.tracer.span(f"{class_name}.__init__", "agent"):
+                agent = agent_class(agent_config)
+            with self.tracer.span(f"{class_name}.execute", "agent"):
+                result = agent.execute(input_data)
             
             return result
 
         except Exception as e:
-            print(f"Error executing class action: {str(e)}")
+            logger.error("❌ Error executing class action: %s", e)
             raise
\ No newline at end of file
@@ -0,0 +1,248 @@
+import os
+import json
+import uuid
+import queue
+import socket
+import threading
+import socketserver
+from collections import OrderedDict
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+from urllib.parse import parse_qs
+from Vincius.Core.config_manager import ConfigManager
+from Vincius.Core.job_runner import JobRunner
+from Vincius.Core.log_config import get_logger
+
+logger = get_logger(__name__)
+
+class Job:
+    """One submitted workflow run and its outcome"""
+
+    def __init__(self, input_data: Any = None):
+        self.id = uuid.uuid4().hex[:12]
+        self.input_data = input_data
+        self.status = "queued"
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.submitted_at = datetime.now().isoformat()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self.done = threading.Event()
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = self.result
+        try:
+            json.dumps(result)
+        except (TypeError, ValueError):
+            result = str(result)
+        return {
+            "id": self.id,
+            "status": self.status,
+            "result": result,
+            "error": self.error,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+class JobQueue:
+    """Queue of workflow jobs drained by a fixed pool of worker threads"""
+
+    MAX_FINISHED = 1000  # Finished jobs kept for status queries
+
+    def __init__(self, workers: int = 1):
+        self.workers = max(1, workers)
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._runner: Optional[JobRunner] = None
+
+    def start(self) -> None:
+        # Workers call run_workflow directly for its per-run isolation, so the runner never starts its pool
+        self._runner = JobRunner()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"workflow-worker-{index + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Let running jobs finish, then stop the workers"""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def submit(self, input_data: Any = None) -> Job:
+        job = Job(input_data)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        self._queue.put(job)
+        logger.info("📥 Queued job %s (%s waiting)", job.id, self._queue.qsize())
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+        return {
+            "workers": self.workers,
+            "queued": statuses.count("queued"),
+            "running": statuses.count("running"),
+            "succeeded": statuses.count("succeeded"),
+            "failed": statuses.count("failed")
+        }
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done.is_set()]
+        for job_id in finished[:max(0, len(finished) - self.MAX_FINISHED)]:
+            del self._jobs[job_id]
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+
+            job.status = "running"
+            job.started_at = datetime.now().isoformat()
+            logger.info("▶️ Running job %s", job.id)
+            try:
+                job.result = self._runner.run_workflow(job.input_data, run_id=job.id)
+                job.status = "succeeded" if job.result is not None else "failed"
+            except Exception as e:
+                logger.error("❌ Job %s failed: %s", job.id, e, exc_info=True)
+                job.status, job.error = "failed", str(e)
+            finally:
+                job.finished_at = datetime.now().isoformat()
+                job.done.set()
+                logger.info("🏁 Job %s %s", job.id, job.status)
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """JSON API: POST /jobs, GET /jobs/<id>[?wait=seconds], GET /health"""
+
+    jobs: JobQueue = None
+    MAX_WAIT_SECONDS = 3600
+
+    def do_GET(self) -> None:
+        path, _, query = self.path.partition('?')
+        if path == '/health':
+            return self._send(200, {"status": "ok", **self.jobs.stats()})
+
+        if path.startswith('/jobs/'):
+            job = self.jobs.get(path[len('/jobs/'):])
+            if not job:
+                return self._send(404, {"error": "unknown job"})
+            wait = parse_qs(query).get('wait', [''])[0]
+            if wait:
+                try:
+                    seconds = float(wait)
+                except ValueError:
+                    seconds = -1.0
+                if not 0 <= seconds <= self.MAX_WAIT_SECONDS:
+                    return self._send(400, {"error": f"wait must be a number of seconds from 0 to {self.MAX_WAIT_SECONDS}"})
+                job.done.wait(seconds)
+            return self._send(200, job.to_dict())
+
+        self._send(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        if self.path != '/jobs':
+            return self._send(404, {"error": "not found"})
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except (ValueError, json.JSONDecodeError):
+            return self._send(400, {"error": "body must be JSON"})
+
+        job = self.jobs.submit(body.get('input'))
+        self._send(202, job.to_dict())
+
+    def _send(self, status: int, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) and self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - " + format, self.address_string(), *args)
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self) -> None:
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+        os.chmod(self.server_address, 0o600)
+
+class WorkflowServer:
+    """Long-lived process that keeps config and model clients warm and runs submitted workflows"""
+
+    def __init__(self, host: Optional[str] = None, port: Optional[int] = None,
+                 socket_path: Optional[str] = None, workers: Optional[int] = None):
+        settings = ConfigManager().get('SERVER', {}) or {}
+        self.host = host or settings.get('host', '127.0.0.1')
+        self.port = port if port is not None else settings.get('port', 8765)
+        self.socket_path = socket_path or settings.get('socket')
+        self.jobs = JobQueue(workers or settings.get('workers', 1))
+        self._server: Optional[socketserver.BaseServer] = None
+
+    def warm_up(self) -> None:
+        """Load config and the model client once so jobs do not pay for it"""
+        ConfigManager()
+        try:
+            from Vincius.Core.brain_model import BrainModel
+            BrainModel()
+        except Exception as e:
+            logger.warning("⚠️ Model not initialized at startup, jobs will retry: %s", e)
+
+    def serve_forever(self) -> None:
+        handler = type('Handler', (_RequestHandler,), {"jobs": self.jobs})
+        if self.socket_path:
+            self._server = _UnixHTTPServer(self.socket_path, handler)
+            address = f"unix://{self.socket_path}"
+        else:
+            self._server = ThreadingHTTPServer((self.host, self.port), handler)
+            address = f"http://{self.host}:{self._server.server_address[1]}"
+
+        self.warm_up()
+        self.jobs.start()
+        logger.info("🛰️ Workflow server listening on %s with %s workers", address, self.jobs.workers)
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("🛑 Shutting down workflow server...")
+        finally:
+            self._server.server_close()
+            self.jobs.stop()
+            if self.socket_path and os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def shutdown(self) -> None:
+        if self._server:
+            self._server.shutdown()
+
+def unix_socket_connection(socket_path: str, timeout: Optional[float] = None):
+    """Create an http.client connection that talks over a Unix socket"""
+    import http.client
+
+    class UnixHTTPConnection(http.client.HTTPConnection):
+        def connect(self):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            if self.timeout is not None:
+                self.sock.settimeout(self.timeout)
+            self.sock.connect(socket_path)
+
+    return UnixHTTPConnection('localhost', timeout=timeout)
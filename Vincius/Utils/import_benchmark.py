@@ -0,0 +1,103 @@
+"""Measure import time of the entry point and agent modules.
+
+Run from the project root:
+
+    python -m Vincius.Utils.import_benchmark            # entry point + agents in the active workflow
+    python -m Vincius.Utils.import_benchmark --all      # every agent module
+    python -m Vincius.Utils.import_benchmark --budget-ms 250 Vincius.Agents.APIRequest.agent
+
+Each module is imported in a fresh interpreter with -X importtime. The run fails
+when a module exceeds the budget or pulls in a module that must stay lazy.
+"""
+import re
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Dict, Any, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+ENTRY_MODULES = ['Vincius.Core.workflow_manager']
+# Heavy modules that must not be imported at startup (the SDK loads on the first model call)
+LAZY_MODULES = ['google.generativeai', 'google.genai', 'commonmark']
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+# A plain import statement; importlib.import_module() is not reported by -X importtime
+PROBE = "import {module}; import json, sys; print(json.dumps([m for m in {lazy!r} if m in sys.modules]))"
+
+def workflow_modules() -> List[str]:
+    """Get the agent modules referenced by the active workflow"""
+    import yaml
+    workflow_path = PROJECT_ROOT / 'Vincius' / 'Config' / 'Workflows' / 'workflow.yaml'
+    workflow = (yaml.safe_load(workflow_path.read_text(encoding='utf-8')) or {}).get('workflow', {})
+    return sorted({
+        step['action']['module']
+        for step in workflow.values()
+        if isinstance(step, dict) and step.get('action', {}).get('module')
+    })
+
+def all_agent_modules() -> List[str]:
+    agents_dir = PROJECT_ROOT / 'Vincius' / 'Agents'
+    return sorted(f"Vincius.Agents.{path.parent.name}.agent" for path in agents_dir.glob('*/agent.py'))
+
+def measure(module: str, runs: int) -> Dict[str, Any]:
+    """Import a module in fresh interpreters and return the median cumulative time"""
+    timings, loaded, slowest, error = [], [], [], None
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', PROBE.format(module=module, lazy=LAZY_MODULES)],
+            cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "import failed"
+            break
+
+        entries = [match.groups() for match in map(IMPORT_LINE.match, completed.stderr.splitlines()) if match]
+        timings.append(next((int(cumulative) for _, cumulative, _, name in entries if name == module), 0) / 1000)
+        loaded = json.loads(completed.stdout.strip().splitlines()[-1])
+        slowest = sorted(((int(own) / 1000, name) for own, _, _, name in entries), reverse=True)[:5]
+
+    return {
+        "module": module,
+        "ms": statistics.median(timings) if timings else None,
+        "lazy_loaded": loaded,
+        "slowest": slowest,
+        "error": error
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import-time benchmark for Vincius modules")
+    parser.add_argument('modules', nargs='*', help="Modules to measure (default: entry point and workflow agents)")
+    parser.add_argument('--all', action='store_true', help="Measure every agent module")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument('--budget-ms', type=float, default=300.0, help="Maximum median import time per module")
+    args = parser.parse_args()
+
+    modules = args.modules or ENTRY_MODULES + (all_agent_modules() if args.all else workflow_modules())
+    failures = 0
+
+    print(f"{'Module':<45} {'Import':>9}  Notes")
+    for module in modules:
+        result = measure(module, max(1, args.runs))
+        if result["error"]:
+            failures += 1
+            print(f"{module:<45} {'-':>9}  ❌ {result['error']}")
+            continue
+
+        notes = []
+        if result["ms"] > args.budget_ms:
+            notes.append(f"over budget ({args.budget_ms:.0f} ms)")
+        if result["lazy_loaded"]:
+            notes.append(f"loads {', '.join(result['lazy_loaded'])} eagerly")
+        failures += bool(notes)
+
+        slowest = ", ".join(f"{name} {ms:.1f}ms" for ms, name in result["slowest"][:3])
+        status = "❌ " + "; ".join(notes) if notes else f"✅ slowest: {slowest}"
+        print(f"{module:<45} {result['ms']:>7.1f}ms  {status}")
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
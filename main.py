@@ -1,16 +1,64 @@
 import sys
+import json
+import argparse
 from pathlib import Path
 
 project_root = Path(__file__).parent.absolute()
 sys.path.insert(0, str(project_root))
 
-from dotenv import load_dotenv 
-from Vincius.Core.workflow_manager import WorkflowManager
+from dotenv import load_dotenv
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Vincius AI workflow runner")
+    commands = parser.add_subparsers(dest="command")
+
+    commands.add_parser("run", help="Run the workflow once in this process (default)")
+
+    serve = commands.add_parser("serve", help="Start a long-lived server that runs submitted workflows")
+    serve.add_argument("--host", help="Address to listen on (default from SERVER config)")
+    serve.add_argument("--port", type=int, help="Port to listen on")
+    serve.add_argument("--socket", help="Listen on a Unix socket instead of TCP")
+    serve.add_argument("--workers", type=int, help="Workflows run in parallel")
+
+    for name, help_text in (("submit", "Submit a workflow job to a running server"),
+                            ("status", "Show the status of a submitted job")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("--host", help="Server address (default from SERVER config)")
+        command.add_argument("--port", type=int, help="Server port (default from SERVER config)")
+        command.add_argument("--socket", help="Connect through a Unix socket (default from SERVER config)")
+        if name == "submit":
+            command.add_argument("input", nargs="?", help="Input passed to the first step")
+            command.add_argument("--wait", action="store_true", help="Block until the job finishes")
+        else:
+            command.add_argument("job_id")
+
+    return parser.parse_args(argv)
 
 def main():
     load_dotenv()
-    manager = WorkflowManager()
-    manager.execute_workflow()
+    args = parse_args()
+
+    if args.command in (None, "run"):
+        from Vincius.Core.workflow_manager import WorkflowManager
+        manager = WorkflowManager()
+        manager.execute_workflow()
+
+    elif args.command == "serve":
+        from Vincius.Core.workflow_server import WorkflowServer
+        WorkflowServer(args.host, args.port, args.socket, args.workers).serve_forever()
+
+    else:
+        from Vincius.Core.workflow_client import WorkflowClient
+        client = WorkflowClient(args.host, args.port, args.socket)
+        if args.command == "submit":
+            job = client.submit(args.input)
+            if args.wait:
+                job = client.wait(job["id"])
+        else:
+            job = client.status(args.job_id)
+        print(json.dumps(job, indent=2))
+        if job.get("status") == "failed":
+            sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()